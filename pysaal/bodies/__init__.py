@@ -1,5 +1,8 @@
 from pysaal.bodies._earth import Earth
+from pysaal.bodies._earth_constants import EarthConstants
+from pysaal.bodies._eclipse_timeline import EclipseTimeline
 from pysaal.bodies._moon import Moon
 from pysaal.bodies._sun import Sun
+from pysaal.bodies._sun_moon_ephemeris import SunMoonEphemeris
 
-__all__ = ["Earth", "Moon", "Sun"]
+__all__ = ["Earth", "EarthConstants", "EclipseTimeline", "Moon", "Sun", "SunMoonEphemeris"]
@@ -1,18 +1,15 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from pysaal.bodies._earth_constants import EarthConstants
 from pysaal.enums import EarthModel
 from pysaal.lib import DLLs
-from pysaal.lib._env_const import (
-    XF_GEOCON_FF,
-    XF_GEOCON_J2,
-    XF_GEOCON_J3,
-    XF_GEOCON_J4,
-    XF_GEOCON_J5,
-    XF_GEOCON_KMPER,
-    XF_GEOCON_MU,
-    XF_GEOCON_RPTIM,
-)
 
 
 class Earth:
+
+    _constants: Optional[EarthConstants] = None
+
     @staticmethod
     def set_model(model: EarthModel) -> None:
         """Update the global geodetic model used in the environment constants.
@@ -20,6 +17,54 @@ class Earth:
         :param model: The new geodetic model to use.  See :ref:`earth_model` for options.
         """
         DLLs.env_const.EnvSetGeoStr(model.value.encode())
+        Earth.clear_constants()
+
+    @staticmethod
+    def get_constants() -> EarthConstants:
+        """Get a cached snapshot of every environment constant.
+
+        .. note::
+
+            The snapshot is read from the library on first use and reused until :meth:`set_model` or
+            :meth:`clear_constants` is called.
+        """
+        if Earth._constants is None:
+            Earth._constants = EarthConstants.from_environment()
+        return Earth._constants
+
+    @staticmethod
+    def clear_constants() -> None:
+        """Discard the cached constants so they are read again on next use.
+
+        .. note::
+
+            This only needs to be called directly if the environment is changed without :meth:`set_model`.
+        """
+        Earth._constants = None
+
+    @staticmethod
+    @contextmanager
+    def use_model(model: EarthModel) -> Iterator[EarthConstants]:
+        """Temporarily switch the global geodetic model and restore the previous one on exit.
+
+        :param model: The geodetic model to use inside the context.  See :ref:`earth_model` for options.
+
+        :example:
+
+        .. code-block:: python
+
+            from pysaal.bodies import Earth
+            from pysaal.enums import EarthModel
+
+            with Earth.use_model(EarthModel.WGS_84) as constants:
+                print(constants.mu)
+        """
+        previous = Earth.get_model()
+        Earth.set_model(model)
+        try:
+            yield Earth.get_constants()
+        finally:
+            Earth.set_model(previous)
 
     @staticmethod
     def get_model() -> EarthModel:
@@ -42,39 +87,39 @@ class Earth:
     @staticmethod
     def get_flattening() -> float:
         """Get the flattening factor of the Earth."""
-        return Earth._get_constant(XF_GEOCON_FF)
+        return Earth.get_constants().flattening
 
     @staticmethod
     def get_j2() -> float:
         """Get the J2 coefficient of the Earth. (unitless)"""
-        return Earth._get_constant(XF_GEOCON_J2)
+        return Earth.get_constants().j2
 
     @staticmethod
     def get_j3() -> float:
         """Get the J3 coefficient of the Earth. (unitless)"""
-        return Earth._get_constant(XF_GEOCON_J3)
+        return Earth.get_constants().j3
 
     @staticmethod
     def get_j4() -> float:
         """Get the J4 coefficient of the Earth. (unitless)"""
-        return Earth._get_constant(XF_GEOCON_J4)
+        return Earth.get_constants().j4
 
     @staticmethod
     def get_j5() -> float:
         """Get the J5 coefficient of the Earth. (unitless)"""
-        return Earth._get_constant(XF_GEOCON_J5)
+        return Earth.get_constants().j5
 
     @staticmethod
     def get_radius() -> float:
         """Get the equatorial radius of the Earth. :math:`(km)`"""
-        return Earth._get_constant(XF_GEOCON_KMPER)
+        return Earth.get_constants().radius
 
     @staticmethod
     def get_rotation_rate() -> float:
         r"""Get the rotation rate of the Earth. :math:`\frac{rad}{min}`"""
-        return Earth._get_constant(XF_GEOCON_RPTIM)
+        return Earth.get_constants().rotation_rate
 
     @staticmethod
     def get_mu() -> float:
         r"""Get the gravitational parameter of the Earth. :math:`\frac{km^3}{s^2}`"""
-        return Earth._get_constant(XF_GEOCON_MU)
+        return Earth.get_constants().mu
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+
+from pysaal.enums import EarthModel, FKModel
+from pysaal.lib import DLLs
+from pysaal.lib._env_const import (
+    XF_FKCON_C1,
+    XF_FKCON_C1DOT,
+    XF_FKCON_THGR70,
+    XF_GEOCON_CK2,
+    XF_GEOCON_CK4,
+    XF_GEOCON_FF,
+    XF_GEOCON_J2,
+    XF_GEOCON_J3,
+    XF_GEOCON_J4,
+    XF_GEOCON_J5,
+    XF_GEOCON_KE,
+    XF_GEOCON_KMPER,
+    XF_GEOCON_KS2EK,
+    XF_GEOCON_MU,
+    XF_GEOCON_RPTIM,
+    XF_GEOCON_THDOT,
+)
+
+
+@dataclass(frozen=True)
+class EarthConstants:
+    """Immutable snapshot of the geopotential and fundamental catalog constants of the environment.
+
+    Reading a field is a plain attribute access, so hot loops can use the snapshot returned by
+    :meth:`Earth.get_constants` instead of calling ``EnvGetGeoConst`` for every value.
+    """
+
+    #: The geodetic model the constants were read from
+    model: EarthModel
+
+    #: Flattening factor of the Earth (unitless)
+    flattening: float
+
+    #: J2 coefficient of the Earth (unitless)
+    j2: float
+
+    #: J3 coefficient of the Earth (unitless)
+    j3: float
+
+    #: J4 coefficient of the Earth (unitless)
+    j4: float
+
+    #: J5 coefficient of the Earth (unitless)
+    j5: float
+
+    #: Ke in :math:`\frac{er^{1.5}}{min}`
+    ke: float
+
+    #: Equatorial radius of the Earth in :math:`km`
+    radius: float
+
+    #: Rotation rate of the Earth with respect to the fixed equinox in :math:`\frac{rad}{min}`
+    rotation_rate: float
+
+    #: J2/2 (unitless)
+    ck2: float
+
+    #: -3/8 J4 (unitless)
+    ck4: float
+
+    #: Conversion from :math:`\frac{km}{s}` to :math:`\frac{er}{kemin}`
+    ks2ek: float
+
+    #: Rotation rate of the Earth with respect to the fixed equinox in :math:`\frac{rad}{kemin}`
+    thdot: float
+
+    #: Gravitational parameter of the Earth in :math:`\frac{km^3}{s^2}`
+    mu: float
+
+    #: The fundamental catalog the FK constants were read from
+    fk_model: FKModel
+
+    #: Rotation rate of the Earth with respect to the moving equinox in :math:`\frac{rad}{day}`
+    c1: float
+
+    #: Rotation acceleration of the Earth in :math:`\frac{rad}{day^2}`
+    c1_dot: float
+
+    #: Greenwich angle at 1970 in :math:`radians`
+    theta_g_1970: float
+
+    @classmethod
+    def from_environment(cls) -> "EarthConstants":
+        """Read every constant from the environment in its current state"""
+        model = DLLs.get_null_string()
+        DLLs.env_const.EnvGetGeoStr(model)
+        geo = DLLs.env_const.EnvGetGeoConst
+        fk = DLLs.env_const.EnvGetFkConst
+        return cls(
+            model=EarthModel(model.value.decode()),
+            flattening=geo(XF_GEOCON_FF),
+            j2=geo(XF_GEOCON_J2),
+            j3=geo(XF_GEOCON_J3),
+            j4=geo(XF_GEOCON_J4),
+            j5=geo(XF_GEOCON_J5),
+            ke=geo(XF_GEOCON_KE),
+            radius=geo(XF_GEOCON_KMPER),
+            rotation_rate=geo(XF_GEOCON_RPTIM),
+            ck2=geo(XF_GEOCON_CK2),
+            ck4=geo(XF_GEOCON_CK4),
+            ks2ek=geo(XF_GEOCON_KS2EK),
+            thdot=geo(XF_GEOCON_THDOT),
+            mu=geo(XF_GEOCON_MU),
+            fk_model=FKModel(DLLs.env_const.EnvGetFkIdx()),
+            c1=fk(XF_FKCON_C1),
+            c1_dot=fk(XF_FKCON_C1DOT),
+            theta_g_1970=fk(XF_FKCON_THGR70),
+        )
@@ -0,0 +1,177 @@
+from ctypes import Array, c_double
+from math import acos, asin, sqrt
+from typing import Optional, Sequence
+
+from pysaal.bodies._earth import Earth
+from pysaal.bodies._sun import Sun
+from pysaal.bodies._sun_moon_ephemeris import SunMoonEphemeris
+from pysaal.elements import TLE
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.math.constants import SECONDS_TO_DAYS
+from pysaal.time import Epoch, TimeSpan
+
+
+class EclipseTimeline:
+    """Umbra and penumbra intervals of a satellite over a time window.
+
+    The conical shadow functions are evaluated on a coarse ephemeris generated by a single ``Sgp4GenEphems`` call and
+    every sign change is refined by bisection with single-point propagation.  Sun positions are taken from a shared
+    :class:`SunMoonEphemeris` cache so that a catalog can be processed without a JPL call at every step.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.bodies import EclipseTimeline
+        from pysaal.elements import TLE
+        from pysaal.time import TimeSpan
+
+        line_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+        line_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+        tle = TLE.from_lines(line_1, line_2)
+
+        timeline = EclipseTimeline.from_tle(tle, TimeSpan(tle.epoch, tle.epoch + 1))
+        for umbra in timeline.umbra:
+            print(umbra.start.dtg_20, umbra.end.dtg_20)
+    """
+
+    #: Default step of the coarse grid in :math:`minutes`
+    DEFAULT_STEP_MINUTES = 1.0
+
+    #: Default width of the bisection bracket at convergence in :math:`seconds`
+    DEFAULT_TOLERANCE_SECONDS = 0.1
+
+    def __init__(self, satellite_id: int, span: TimeSpan):
+
+        #: The satellite ID of the propagated TLE
+        self.satellite_id = satellite_id
+
+        #: The time window searched for eclipses
+        self.span = span
+
+        #: Intervals in which the Sun is at least partially blocked by the Earth
+        self.penumbra: list[TimeSpan] = []
+
+        #: Intervals in which the Sun is completely blocked by the Earth
+        self.umbra: list[TimeSpan] = []
+
+    @staticmethod
+    def get_shadow_functions(position: Sequence[float], sun_position: Sequence[float]) -> tuple[float, float]:
+        """Evaluate the penumbra and umbra shadow functions of a satellite in :math:`radians`
+
+        :param position: Position of the satellite in :math:`km`
+        :param sun_position: Position of the Sun in the same frame in :math:`km`
+        :return: The penumbra and umbra functions, each of which is negative while the satellite is in that shadow
+
+        .. note::
+
+            Both functions compare the angle between the apparent centers of the Earth and the Sun with the sum and
+            difference of their apparent radii.
+        """
+        to_sun = [sun_position[i] - position[i] for i in range(3)]
+        r = sqrt(sum(p * p for p in position))
+        d = sqrt(sum(s * s for s in to_sun))
+        alpha_earth = asin(min(Earth.get_radius() / r, 1.0))
+        alpha_sun = asin(min(Sun.RADIUS / d, 1.0))
+        cos_theta = -sum(p * s for p, s in zip(position, to_sun)) / (r * d)
+        theta = acos(max(-1.0, min(1.0, cos_theta)))
+        return theta - (alpha_earth + alpha_sun), theta - (alpha_earth - alpha_sun)
+
+    @staticmethod
+    def _get_shadow_functions_at(
+        tle: TLE, utc_ds50: float, cache: SunMoonEphemeris, position: Array[c_double]
+    ) -> tuple[float, float]:
+        error = DLLs.sgp4_prop.Sgp4PropDs50UtcPos(tle.key, utc_ds50, position)
+        if error:
+            raise PySAALError
+        sun = cache.get_sun_position(Epoch(utc_ds50))
+        return EclipseTimeline.get_shadow_functions(position, [sun.x, sun.y, sun.z])
+
+    @staticmethod
+    def _bisect(
+        tle: TLE,
+        lower: float,
+        upper: float,
+        lower_in_shadow: bool,
+        index: int,
+        cache: SunMoonEphemeris,
+        tolerance: float,
+        position: Array[c_double],
+    ) -> float:
+        while upper - lower > tolerance:
+            middle = 0.5 * (lower + upper)
+            in_shadow = EclipseTimeline._get_shadow_functions_at(tle, middle, cache, position)[index] < 0
+            if in_shadow == lower_in_shadow:
+                lower = middle
+            else:
+                upper = middle
+        return 0.5 * (lower + upper)
+
+    @classmethod
+    def from_tle(
+        cls,
+        tle: TLE,
+        span: TimeSpan,
+        step_minutes: float = DEFAULT_STEP_MINUTES,
+        tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+        cache: Optional[SunMoonEphemeris] = None,
+    ) -> "EclipseTimeline":
+        """Find the eclipse intervals of a single TLE
+
+        :param tle: The TLE to propagate.  It is loaded into memory if it is not already.
+        :param span: The time window to search
+        :param step_minutes: Step of the coarse grid in :math:`minutes`.  Eclipses shorter than the step may be missed.
+        :param tolerance_seconds: Precision of the entry and exit times in :math:`seconds`
+        :param cache: Sun position cache covering the window.  One is fitted over the window if not provided.
+        :raises PySAALError: If there is an error during propagation
+        """
+        if cache is None:
+            cache = SunMoonEphemeris(span.start, span.end)
+        tolerance = tolerance_seconds * SECONDS_TO_DAYS
+        timeline = cls(tle.satellite_id, span)
+
+        ephemeris = tle.get_ephemeris(span, step_minutes)
+        sun, _ = cache.get_positions([Epoch(row[0]) for row in ephemeris])
+        values = [EclipseTimeline.get_shadow_functions(row[1:4], sun_vec) for row, sun_vec in zip(ephemeris, sun)]
+
+        position = (c_double * 3)()
+        for index, intervals in enumerate((timeline.penumbra, timeline.umbra)):
+            entry: Optional[float] = span.start.utc_ds50 if values and values[0][index] < 0 else None
+            for i in range(1, len(values)):
+                was_in_shadow = values[i - 1][index] < 0
+                if was_in_shadow == (values[i][index] < 0):
+                    continue
+                crossing = EclipseTimeline._bisect(
+                    tle, ephemeris[i - 1][0], ephemeris[i][0], was_in_shadow, index, cache, tolerance, position
+                )
+                if was_in_shadow:
+                    intervals.append(TimeSpan(Epoch(entry), Epoch(crossing)))  # type: ignore
+                    entry = None
+                else:
+                    entry = crossing
+            if entry is not None:
+                intervals.append(TimeSpan(Epoch(entry), span.end))
+        return timeline
+
+    @classmethod
+    def from_catalog(
+        cls,
+        tles: Sequence[TLE],
+        span: TimeSpan,
+        step_minutes: float = DEFAULT_STEP_MINUTES,
+        tolerance_seconds: float = DEFAULT_TOLERANCE_SECONDS,
+    ) -> list["EclipseTimeline"]:
+        """Find the eclipse intervals of many TLEs over a common time window
+
+        :param tles: The TLEs to propagate
+        :param span: The time window to search
+        :param step_minutes: Step of the coarse grid in :math:`minutes`
+        :param tolerance_seconds: Precision of the entry and exit times in :math:`seconds`
+
+        .. note::
+
+            A single Sun position cache is fitted over the window and shared by every satellite.
+        """
+        cache = SunMoonEphemeris(span.start, span.end)
+        return [cls.from_tle(tle, span, step_minutes, tolerance_seconds, cache) for tle in tles]
@@ -29,5 +29,5 @@ class Moon:
         """
         _ = Vector3D.get_null_pointer()
         moon_vec = Vector3D.get_null_pointer()
-        DLLs.astro_func.JplCompSunMoonPos(epoch.tt_ds50, _, moon_vec)
+        DLLs.astro_func.JplCompSunMoonPos(epoch.utc_ds50, _, moon_vec)
         return Vector3D.from_c_array(moon_vec)
@@ -10,6 +10,9 @@ class Sun:
     #: The gravitational parameter of the Sun in :math:`\frac{km^3}{s^2}`.
     MU = 1.327124400419e11
 
+    #: The mean radius of the Sun in :math:`km`.
+    RADIUS = 695700.0
+
     @staticmethod
     def get_analytic_position(epoch: Epoch) -> Vector3D:
         """Get the position of the Sun using an analytic model. :math:`(km)`
@@ -29,5 +32,5 @@ class Sun:
         """
         sun_vec = Vector3D.get_null_pointer()
         _ = Vector3D.get_null_pointer()
-        DLLs.astro_func.JplCompSunMoonPos(epoch.tt_ds50, sun_vec, _)
+        DLLs.astro_func.JplCompSunMoonPos(epoch.utc_ds50, sun_vec, _)
         return Vector3D.from_c_array(sun_vec)
@@ -0,0 +1,154 @@
+from ctypes import Array, c_double
+from math import ceil, cos, floor, pi
+from typing import Sequence
+
+from pysaal.lib import DLLs
+from pysaal.math.linalg import Vector3D
+from pysaal.time import Epoch
+
+
+class SunMoonEphemeris:
+    """Batched JPL positions of the Sun and Moon with a fitted Chebyshev cache.
+
+    The static :meth:`get_jpl_positions` returns both bodies from a single ``JplCompSunMoonPos`` call per epoch.  An
+    instance fits Chebyshev polynomials to the JPL positions over a time window so that repeated evaluation inside
+    eclipse and illumination loops does not require a library call at every step.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.bodies import SunMoonEphemeris
+        from pysaal.time import Epoch
+
+        start = Epoch(27368.0)
+        cache = SunMoonEphemeris(start, start + 7)
+        sun, moon = cache.get_positions([start + 0.5, start + 1.25])
+    """
+
+    #: Default length of each fitted segment in :math:`days`
+    DEFAULT_SEGMENT_DAYS = 1.0
+
+    #: Default degree of the Chebyshev polynomial fitted to each segment
+    DEFAULT_DEGREE = 12
+
+    def __init__(
+        self, start: Epoch, end: Epoch, segment_days: float = DEFAULT_SEGMENT_DAYS, degree: int = DEFAULT_DEGREE
+    ):
+        """Fit the cache over a time window
+
+        :param start: The first epoch covered by the cache
+        :param end: The last epoch covered by the cache
+        :param segment_days: Length of each fitted segment in :math:`days`
+        :param degree: Degree of the Chebyshev polynomial fitted to each segment
+        """
+        if end <= start:
+            raise ValueError("The end of the cache window must be after the start.")
+        if segment_days <= 0 or degree < 1:
+            raise ValueError("The segment length and degree must be positive.")
+
+        #: The first epoch covered by the cache
+        self.start = start
+
+        #: The last epoch covered by the cache
+        self.end = end
+
+        #: Length of each fitted segment in :math:`days`
+        self.segment_days = segment_days
+
+        #: Degree of the Chebyshev polynomial fitted to each segment
+        self.degree = degree
+
+        n_nodes = degree + 1
+        n_segments = max(1, ceil((end.utc_ds50 - start.utc_ds50) / segment_days))
+        nodes = [cos(pi * (k + 0.5) / n_nodes) for k in range(n_nodes)]
+        basis = [[cos(pi * j * (k + 0.5) / n_nodes) for k in range(n_nodes)] for j in range(n_nodes)]
+
+        node_epochs = []
+        for segment in range(n_segments):
+            segment_start = start.utc_ds50 + segment * segment_days
+            node_epochs.extend(Epoch(segment_start + 0.5 * (node + 1) * segment_days) for node in nodes)
+        sun, moon = SunMoonEphemeris.get_jpl_positions(node_epochs)
+
+        self._coefficients: list[list[list[float]]] = []
+        for segment in range(n_segments):
+            rows = range(segment * n_nodes, (segment + 1) * n_nodes)
+            samples = [[sun[r][axis] for r in rows] for axis in range(3)]
+            samples += [[moon[r][axis] for r in rows] for axis in range(3)]
+            segment_coefficients = []
+            for values in samples:
+                coefficients = [2.0 / n_nodes * sum(v * b for v, b in zip(values, basis[j])) for j in range(n_nodes)]
+                coefficients[0] *= 0.5
+                segment_coefficients.append(coefficients)
+            self._coefficients.append(segment_coefficients)
+
+    @staticmethod
+    def get_jpl_positions(epochs: Sequence[Epoch]) -> tuple[Array[Array[c_double]], Array[Array[c_double]]]:
+        """Get the JPL positions of the Sun and the Moon for many epochs. :math:`(km)`
+
+        :param epochs: The epochs at which to calculate the positions
+        :return: ``(N, 3)`` Sun positions and ``(N, 3)`` Moon positions
+        """
+        sun = ((c_double * 3) * len(epochs))()
+        moon = ((c_double * 3) * len(epochs))()
+        for epoch, sun_vec, moon_vec in zip(epochs, sun, moon):
+            DLLs.astro_func.JplCompSunMoonPos(epoch.utc_ds50, sun_vec, moon_vec)
+        return sun, moon
+
+    def covers(self, epoch: Epoch) -> bool:
+        """Check if an epoch falls inside the fitted window
+
+        :param epoch: The epoch to check
+        """
+        return self.start <= epoch <= self.end
+
+    def _evaluate(self, utc_ds50: float, sun_vec: Array[c_double], moon_vec: Array[c_double]) -> None:
+        offset = (utc_ds50 - self.start.utc_ds50) / self.segment_days
+        segment = min(int(floor(offset)), len(self._coefficients) - 1)
+        tau = 2.0 * (offset - segment) - 1.0
+        two_tau = 2.0 * tau
+        for axis, coefficients in enumerate(self._coefficients[segment]):
+            b_1 = 0.0
+            b_2 = 0.0
+            for coefficient in reversed(coefficients[1:]):
+                b_1, b_2 = two_tau * b_1 - b_2 + coefficient, b_1
+            value = tau * b_1 - b_2 + coefficients[0]
+            if axis < 3:
+                sun_vec[axis] = value
+            else:
+                moon_vec[axis - 3] = value
+
+    def get_positions(self, epochs: Sequence[Epoch]) -> tuple[Array[Array[c_double]], Array[Array[c_double]]]:
+        """Get the positions of the Sun and the Moon from the cache. :math:`(km)`
+
+        :param epochs: The epochs at which to calculate the positions
+        :return: ``(N, 3)`` Sun positions and ``(N, 3)`` Moon positions
+
+        .. note::
+
+            Epochs outside of the fitted window are computed directly from the JPL ephemeris.
+        """
+        sun = ((c_double * 3) * len(epochs))()
+        moon = ((c_double * 3) * len(epochs))()
+        for epoch, sun_vec, moon_vec in zip(epochs, sun, moon):
+            if self.covers(epoch):
+                self._evaluate(epoch.utc_ds50, sun_vec, moon_vec)
+            else:
+                DLLs.astro_func.JplCompSunMoonPos(epoch.utc_ds50, sun_vec, moon_vec)
+        return sun, moon
+
+    def get_sun_position(self, epoch: Epoch) -> Vector3D:
+        """Get the position of the Sun from the cache. :math:`(km)`
+
+        :param epoch: The epoch at which to calculate the position.
+        """
+        sun, _ = self.get_positions([epoch])
+        return Vector3D.from_c_array(sun[0])
+
+    def get_moon_position(self, epoch: Epoch) -> Vector3D:
+        """Get the position of the Moon from the cache. :math:`(km)`
+
+        :param epoch: The epoch at which to calculate the position.
+        """
+        _, moon = self.get_positions([epoch])
+        return Vector3D.from_c_array(moon[0])
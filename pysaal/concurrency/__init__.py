@@ -0,0 +1,4 @@
+from pysaal.concurrency._dll_executor import DLLExecutor
+from pysaal.concurrency._async_propagator import AsyncPropagator
+
+__all__ = ["DLLExecutor", "AsyncPropagator"]
@@ -0,0 +1,157 @@
+import asyncio
+from ctypes import Array, c_double
+from typing import Optional, Sequence, Union
+from weakref import WeakKeyDictionary
+
+from pysaal.concurrency._dll_executor import DLLExecutor
+from pysaal.elements import TLE, PropagatedTLE, TLECatalog
+from pysaal.exceptions import PySAALError
+from pysaal.time import Epoch
+
+
+class AsyncPropagator:
+    r"""asyncio front-end for SGP4 propagation that never blocks the event loop.
+
+    Work is dispatched to the owner thread of a :class:`DLLExecutor`.  Concurrent requests for the same element set
+    and epoch share a single result, and state requests that arrive within :attr:`window_seconds` of each other are
+    sent to the owner thread as one batch.
+
+    .. note::
+
+        A propagator must only be awaited from a single event loop.  :meth:`get_default` keeps one per running loop,
+        and it is the propagator used by :meth:`TLE.aget_state_at_epoch` and :meth:`TLECatalog.apropagate`.
+
+    :example:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from pysaal.elements import TLE
+
+        line_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+        line_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+        tle = TLE.from_lines(line_1, line_2)
+
+        async def main():
+            return await asyncio.gather(*(tle.aget_state_at_epoch(tle.epoch + 0.1 * i) for i in range(10)))
+
+        states = asyncio.run(main())
+    """
+
+    #: Default time that a state request waits for others to join its batch in :math:`seconds`
+    DEFAULT_WINDOW_SECONDS = 0.001
+
+    _defaults: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncPropagator]" = WeakKeyDictionary()
+
+    def __init__(self, executor: Optional[DLLExecutor] = None, window_seconds: float = DEFAULT_WINDOW_SECONDS):
+
+        #: The executor that owns the library.  The shared executor is used if not provided.
+        self.executor = executor if executor is not None else DLLExecutor.get_default()
+
+        #: Time that a state request waits for others to join its batch in :math:`seconds`
+        self.window_seconds = window_seconds
+
+        #: Number of state batches sent to the executor
+        self.batch_count = 0
+
+        self._requests: dict[tuple, asyncio.Future] = {}
+        self._batch: list[tuple[tuple, TLE, float]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @classmethod
+    def get_default(cls) -> "AsyncPropagator":
+        """Get the propagator of the running event loop, which dispatches to :meth:`DLLExecutor.get_default`"""
+        loop = asyncio.get_running_loop()
+        propagator = cls._defaults.get(loop)
+        if propagator is None or propagator.executor is not DLLExecutor.get_default():
+            propagator = cls()
+            cls._defaults[loop] = propagator
+        return propagator
+
+    @staticmethod
+    def _get_record(tle: TLE) -> bytes:
+        return bytes(tle.c_double_array) + tle.c_char_array.raw
+
+    def _get_states(self, requests: Sequence[tuple[TLE, float]]) -> list[Union[PropagatedTLE, PySAALError]]:
+        """Propagate a batch of state requests on the owner thread, keeping errors with the request that raised them"""
+        results: list[Union[PropagatedTLE, PySAALError]] = []
+        for tle, utc_ds50 in requests:
+            try:
+                results.append(self.executor.load_tle(tle).get_state_at_epoch(Epoch(utc_ds50)))
+            except PySAALError as error:
+                results.append(error)
+        return results
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        batch, self._batch = self._batch, []
+        self.batch_count += 1
+        keys = [key for key, _, _ in batch]
+        try:
+            done = asyncio.wrap_future(self.executor.submit(self._get_states, [(tle, t) for _, tle, t in batch]))
+        except RuntimeError as error:
+            for key in keys:
+                self._requests.pop(key).set_exception(error)
+            return
+        done.add_done_callback(lambda task: self._resolve(keys, task))
+
+    def _resolve(self, keys: list[tuple], done: asyncio.Future) -> None:
+        for i, key in enumerate(keys):
+            future = self._requests.pop(key)
+            if done.cancelled():
+                future.cancel()
+            elif done.exception() is not None:
+                future.set_exception(done.exception())  # type: ignore
+            elif isinstance(done.result()[i], PySAALError):
+                future.set_exception(done.result()[i])
+            else:
+                future.set_result(done.result()[i])
+
+    async def get_state_at_epoch(self, tle: TLE, epoch: Epoch) -> PropagatedTLE:
+        """Get the full orbit state of a TLE at a given epoch
+
+        :param tle: The TLE to propagate.  Its records are copied, so it is never loaded by the event loop thread.
+        :param epoch: The epoch at which to calculate the state
+        :raises PySAALError: If there is an error during propagation
+        """
+        key = (AsyncPropagator._get_record(tle), epoch.utc_ds50)
+        future = self._requests.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._requests[key] = future
+            self._batch.append((key, DLLExecutor.copy_tle(tle), epoch.utc_ds50))
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        return await asyncio.shield(future)
+
+    async def propagate(self, tle: TLE, epochs: Sequence[Epoch]) -> Array[Array[c_double]]:
+        r"""Propagate a TLE to several epochs
+
+        :param tle: The TLE to propagate
+        :param epochs: The output epochs
+        :raises PySAALError: If there is an error during propagation
+        :return: ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}`
+
+        .. note::
+
+            Concurrent calls for the same element set and epochs share a single request.
+        """
+        key = (AsyncPropagator._get_record(tle), tuple(epoch.utc_ds50 for epoch in epochs))
+        future = self._requests.get(key)
+        if future is None:
+            future = asyncio.wrap_future(self.executor.propagate(tle, epochs))
+            self._requests[key] = future
+            future.add_done_callback(lambda _: self._requests.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def propagate_catalog(self, catalog: TLECatalog, epochs: Sequence[Epoch]) -> list[Array[Array[c_double]]]:
+        r"""Propagate every TLE of a catalog to several epochs
+
+        :param catalog: The TLEs to propagate
+        :param epochs: The output epochs
+        :raises PySAALError: If there is an error during propagation
+        :return: ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}` for every record
+        """
+        return list(await asyncio.gather(*(self.propagate(tle, epochs) for tle in catalog)))
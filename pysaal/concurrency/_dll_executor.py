@@ -0,0 +1,270 @@
+from concurrent.futures import Future
+from ctypes import Array, c_double
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from typing import Any, Callable, Optional, Sequence
+
+from pysaal.elements import TLE
+from pysaal.enums import ReferenceFrame
+from pysaal.exceptions import PySAALError
+from pysaal.frames import FrameConverter
+from pysaal.lib import DLLs
+from pysaal.time import Epoch
+
+#: Guards the creation of the shared executor
+_DEFAULT_LOCK = Lock()
+
+
+class DLLExecutor:
+    r"""Thread-safe front-end that serializes every library call on a single owner thread.
+
+    The SAAL libraries keep global state, so calls from several threads can race.  Application threads submit
+    requests to a queue and receive :class:`concurrent.futures.Future` objects, while the owner thread drains the
+    queue in batches and is the only thread that calls into the library.  Each TLE is loaded once per batch and shared
+    by every request of the batch, and frame transforms are shared through a single :class:`FrameConverter`.
+
+    .. note::
+
+        Any other use of pysaal from application threads bypasses the executor.  Wrap such work in a function and pass
+        it to :meth:`submit` so that it runs on the owner thread.  While the executor runs, it is the
+        :attr:`TLE.library_owner`, so TLEs garbage collected by other threads are removed from memory by the owner
+        thread as soon as they are queued.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.concurrency import DLLExecutor
+        from pysaal.elements import TLE
+
+        line_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+        line_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+
+        with DLLExecutor() as executor:
+            tle = executor.submit(TLE.from_lines, line_1, line_2).result()
+            states = executor.propagate(tle, [tle.epoch + 0.5, tle.epoch + 1.0]).result()
+    """
+
+    #: Default maximum number of requests drained from the queue in a single batch
+    DEFAULT_MAX_BATCH_SIZE = 256
+
+    #: Default maximum number of TLEs loaded by the owner thread during a batch
+    DEFAULT_MAX_CACHE_SIZE = 10000
+
+    _default: Optional["DLLExecutor"] = None
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE):
+
+        #: Maximum number of requests drained from the queue in a single batch
+        self.max_batch_size = max_batch_size
+
+        #: Maximum number of TLEs loaded by the owner thread during a batch.  The cache is cleared when it is full.
+        self.max_cache_size = max_cache_size
+
+        #: Number of batches executed by the owner thread
+        self.batch_count = 0
+
+        #: Number of requests executed by the owner thread
+        self.request_count = 0
+
+        self._requests: SimpleQueue = SimpleQueue()
+        self._shutdown_lock = Lock()
+        self._shutdown = False
+        self._tles: dict[int, tuple[bytes, TLE, bool]] = {}
+        self._frame_converter = FrameConverter()
+        self._thread = Thread(target=self._run, name="pysaal-dll-executor", daemon=True)
+        with _DEFAULT_LOCK:
+            if TLE.library_owner is None:
+                TLE.library_owner = self._thread
+                TLE.pending_removal_callback = self._schedule_pending_removals
+        self._thread.start()
+
+    @classmethod
+    def get_default(cls) -> "DLLExecutor":
+        """Get the executor shared by the asynchronous methods of pysaal
+
+        .. note::
+
+            A new executor is started if the shared one has been shut down.
+        """
+        with _DEFAULT_LOCK:
+            if cls._default is None or cls._default._shutdown:
+                cls._default = cls()
+            return cls._default
+
+    def __enter__(self) -> "DLLExecutor":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.shutdown()
+
+    @property
+    def cache_size(self) -> int:
+        """Number of TLEs loaded by the owner thread for the current batch"""
+        return len(self._tles)
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch = [self._requests.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except Empty:
+                    break
+            self.batch_count += 1
+            TLE.remove_pending_keys()
+            for request in batch:
+                if request is None:
+                    running = False
+                    continue
+                future, function, args, kwargs = request
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self.request_count += 1
+                try:
+                    future.set_result(function(*args, **kwargs))
+                except BaseException as error:
+                    future.set_exception(error)
+            self._clear_cache()
+        with _DEFAULT_LOCK:
+            if TLE.library_owner is self._thread:
+                TLE.library_owner = None
+                TLE.pending_removal_callback = None
+        TLE.remove_pending_keys()
+
+    def _schedule_pending_removals(self) -> None:
+        """Wake the owner thread to remove keys queued by finalizers on other threads"""
+        if not self._shutdown:
+            self._requests.put((Future(), TLE.remove_pending_keys, (), {}))
+
+    def _clear_cache(self) -> None:
+        for _, tle, owned in self._tles.values():
+            if owned:
+                tle.destroy()
+        self._tles.clear()
+
+    def submit(self, function: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Schedule a callable to run on the owner thread
+
+        :param function: The callable to run.  It may call any pysaal or library function.
+        :raises RuntimeError: If the executor has been shut down
+        :return: A future holding the return value of the callable
+        """
+        future: Future = Future()
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit requests after the executor has been shut down.")
+            self._requests.put((future, function, args, kwargs))
+        return future
+
+    @staticmethod
+    def copy_tle(tle: TLE) -> TLE:
+        """Copy the records of a TLE without calling the library
+
+        :param tle: The TLE to copy
+        :return: A TLE that is not loaded into memory
+        """
+        copy = TLE()
+        copy.c_double_array[:] = tle.c_double_array[:]
+        copy.c_char_array.raw = tle.c_char_array.raw
+        copy.name = tle.name
+        return copy
+
+    def load_tle(self, tle: TLE) -> TLE:
+        """Get a loaded copy of a TLE that is shared by the rest of the batch
+
+        :param tle: The TLE to load
+        :raises PySAALError: If the library is unable to load the TLE
+
+        .. note::
+
+            This method calls the library, so it must only be called by functions passed to :meth:`submit`.  If the
+            application already loaded an element set with the same :attr:`TLE.sat_key`, that element set is used
+            and is left in memory.  Copies loaded by the executor are removed at the end of the batch so that they
+            never block the application from loading the same element set.
+        """
+        record = bytes(tle.c_double_array) + tle.c_char_array.raw
+        sat_key = tle.sat_key
+        cached = self._tles.get(sat_key)
+        if cached is not None:
+            cached_record, loaded, owned = cached
+            if cached_record == record or not owned:
+                return loaded
+            loaded.destroy()
+            del self._tles[sat_key]
+        elif len(self._tles) >= self.max_cache_size:
+            self._clear_cache()
+
+        loaded = DLLExecutor.copy_tle(tle)
+        try:
+            loaded.load()
+            owned = True
+        except PySAALError:
+            if DLLs.tle.TleDataToArray(sat_key, *TLE.get_null_pointers()):
+                raise
+            loaded.key = sat_key
+            loaded.loaded = True
+            owned = False
+        self._tles[sat_key] = (record, loaded, owned)
+        return loaded
+
+    def _propagate(self, tle: TLE, times: Sequence[float]) -> Array[Array[c_double]]:
+        key = self.load_tle(tle).key
+        states = ((c_double * 6) * len(times))()
+        position = (c_double * 3)()
+        velocity = (c_double * 3)()
+        for utc_ds50, state in zip(times, states):
+            if DLLs.sgp4_prop.Sgp4PropDs50UtcPosVel(key, utc_ds50, position, velocity):
+                raise PySAALError
+            state[:3] = position[:]
+            state[3:] = velocity[:]
+        return states
+
+    def propagate(self, tle: TLE, epochs: Sequence[Epoch]) -> Future:
+        r"""Schedule SGP4 propagation of a TLE to several epochs
+
+        :param tle: The TLE to propagate.  Its records are copied before returning, so it is never loaded by the
+            calling thread.
+        :param epochs: The output epochs
+        :raises RuntimeError: If the executor has been shut down
+        :return: A future holding ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}`.  The future raises
+            :class:`PySAALError` if the library is unable to load or propagate the TLE.
+        """
+        return self.submit(self._propagate, DLLExecutor.copy_tle(tle), [epoch.utc_ds50 for epoch in epochs])
+
+    def convert(
+        self,
+        states: Sequence[Sequence[float]],
+        epochs: Sequence[Epoch],
+        source: ReferenceFrame,
+        target: ReferenceFrame,
+    ) -> Future:
+        r"""Schedule a batch frame conversion
+
+        :param states: ``(N, 3)`` positions or ``(N, 6)`` states in :math:`km` and :math:`\frac{km}{s}`.  The states
+            must not be modified until the future is done.
+        :param epochs: The epoch of each state
+        :param source: The frame of the input states.  See :ref:`reference_frame` for options.
+        :param target: The frame of the output states
+        :raises RuntimeError: If the executor has been shut down
+        :return: A future holding the result of :meth:`FrameConverter.convert`
+        """
+        return self.submit(self._frame_converter.convert, states, epochs, source, target)
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop accepting requests and remove the TLEs loaded by the owner thread from memory
+
+        :param wait: If True, block until every pending request has been executed
+        :param timeout: Maximum time to wait in :math:`seconds`
+
+        .. note::
+
+            Requests submitted before the call are still executed.
+        """
+        with self._shutdown_lock:
+            if not self._shutdown:
+                self._shutdown = True
+                self._requests.put(None)
+        if wait:
+            self._thread.join(timeout)
@@ -0,0 +1,3 @@
+from pysaal.conjunction._collision_probability import CollisionProbability
+
+__all__ = ["CollisionProbability"]
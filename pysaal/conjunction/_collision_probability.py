@@ -0,0 +1,173 @@
+from ctypes import Array, c_double
+from math import atan2, cos, erf, exp, nan, pi, sin, sqrt
+from typing import Optional, Sequence
+
+from pysaal.covariance import CovarianceStack
+from pysaal.enums import CovarianceFrame
+from pysaal.math.linalg import Vector3D
+from pysaal.time import Epoch
+
+
+class CollisionProbability:
+    """Batch two-dimensional probability of collision for screened conjunctions.
+
+    Each event is reduced to the encounter plane perpendicular to the relative velocity at the time of closest approach
+    (TCA).  The combined position covariance and the miss vector are projected onto that plane and the bivariate
+    normal density is integrated over the combined hard-body circle.  The integral is evaluated in the one-dimensional
+    error-function form of Alfano, which is equivalent to the two-dimensional integral of Foster.
+    """
+
+    #: Default number of Simpson intervals across the hard-body diameter
+    DEFAULT_INTERVALS = 100
+
+    @staticmethod
+    def _get_position_covariance(matrix: Array[Array[c_double]]) -> list[list[float]]:
+        return [[matrix[i][j] for j in range(3)] for i in range(3)]
+
+    @staticmethod
+    def _project(covariance: list[list[float]], a: Vector3D, b: Vector3D) -> float:
+        a_vec = [a.x, a.y, a.z]
+        b_vec = [b.x, b.y, b.z]
+        return sum(a_vec[i] * covariance[i][j] * b_vec[j] for i in range(3) for j in range(3))
+
+    @staticmethod
+    def _get_perpendicular(direction: Vector3D) -> Vector3D:
+        """Get a unit vector perpendicular to a unit vector, built from the coordinate axis least aligned with it"""
+        components = [abs(direction.x), abs(direction.y), abs(direction.z)]
+        axis = [0.0, 0.0, 0.0]
+        axis[components.index(min(components))] = 1.0
+        return direction.cross(Vector3D(*axis)).unit
+
+    @staticmethod
+    def compute_2d(
+        miss_x: float, miss_y: float, sigma_x: float, sigma_y: float, radius: float, intervals: int = DEFAULT_INTERVALS
+    ) -> float:
+        """Integrate a bivariate normal density with principal axes aligned to x and y over a circle at the origin
+
+        :param miss_x: Component of the miss vector along the first principal axis in :math:`km`
+        :param miss_y: Component of the miss vector along the second principal axis in :math:`km`
+        :param sigma_x: Standard deviation along the first principal axis in :math:`km`
+        :param sigma_y: Standard deviation along the second principal axis in :math:`km`
+        :param radius: Combined hard-body radius in :math:`km`
+        :param intervals: Number of Simpson intervals across the circle (rounded up to an even number)
+        """
+        if sigma_x <= 0 or sigma_y <= 0 or radius <= 0:
+            return nan
+        intervals += intervals % 2
+        step = 2 * radius / intervals
+        root_2_sigma_y = sqrt(2) * sigma_y
+        total = 0.0
+        for k in range(intervals + 1):
+            x = -radius + k * step
+            half_chord = sqrt(max(radius * radius - x * x, 0.0))
+            value = exp(-((x - miss_x) ** 2) / (2 * sigma_x * sigma_x)) * (
+                erf((half_chord + miss_y) / root_2_sigma_y) + erf((half_chord - miss_y) / root_2_sigma_y)
+            )
+            weight = 1 if k == 0 or k == intervals else (4 if k % 2 else 2)
+            total += weight * value
+        return total * step / 3 / (2 * sqrt(2 * pi) * sigma_x)
+
+    @staticmethod
+    def compute(
+        primary_states: Sequence[Sequence[float]],
+        primary_covariances: CovarianceStack,
+        secondary_states: Sequence[Sequence[float]],
+        secondary_covariances: CovarianceStack,
+        hard_body_radii: Sequence[float],
+        epochs: Optional[Sequence[Epoch]] = None,
+        intervals: int = DEFAULT_INTERVALS,
+    ) -> Array[c_double]:
+        r"""Compute the probability of collision for a batch of conjunctions
+
+        :param primary_states: ``(N, 6)`` ECI states of the primary objects at TCA in :math:`km` and
+            :math:`\frac{km}{s}`
+        :param primary_covariances: Covariances of the primary objects at TCA in any supported frame
+        :param secondary_states: ``(N, 6)`` ECI states of the secondary objects at TCA in :math:`km` and
+            :math:`\frac{km}{s}`
+        :param secondary_covariances: Covariances of the secondary objects at TCA in any supported frame
+        :param hard_body_radii: Combined hard-body radius of each event in :math:`km`
+        :param epochs: The TCA of each event.  Only required if a covariance stack is in the EFG frame.
+        :param intervals: Number of Simpson intervals across the hard-body circle
+        :return: Probability of collision for each event.  Events with no relative velocity or a singular projected
+            covariance are NaN.
+
+        .. note::
+
+            Covariances that are not already ECI are transformed with :meth:`CovarianceStack.to_frame` using the
+            supplied states, so the states and covariances must share the same inertial frame.  If the miss vector is
+            zero the orientation of the encounter plane about the relative velocity is arbitrary, and the miss is
+            evaluated at the origin of the plane.
+
+        :example:
+
+        .. code-block:: python
+
+            from pysaal.conjunction import CollisionProbability
+            from pysaal.covariance import CovarianceStack
+            from pysaal.enums import CovarianceFrame
+
+            primary = CovarianceStack(1, CovarianceFrame.UVW)
+            secondary = CovarianceStack(1, CovarianceFrame.UVW)
+            for i in range(6):
+                primary[0][i][i] = 0.01
+                secondary[0][i][i] = 0.04
+            pc = CollisionProbability.compute(
+                [[7000.0, 0.0, 0.0, 0.0, 7.5, 0.0]],
+                primary,
+                [[7000.1, 0.0, 0.0, 0.0, 0.0, 7.5]],
+                secondary,
+                [0.02],
+            )
+        """
+        count = len(hard_body_radii)
+        if not (len(primary_states) == len(secondary_states) == len(primary_covariances) == count):
+            raise ValueError("States, covariances and hard-body radii must have the same length.")
+        if len(secondary_covariances) != count:
+            raise ValueError("States, covariances and hard-body radii must have the same length.")
+
+        primary_eci = primary_covariances
+        if primary_eci.frame != CovarianceFrame.ECI:
+            primary_eci = primary_eci.to_frame(CovarianceFrame.ECI, primary_states, epochs)
+        secondary_eci = secondary_covariances
+        if secondary_eci.frame != CovarianceFrame.ECI:
+            secondary_eci = secondary_eci.to_frame(CovarianceFrame.ECI, secondary_states, epochs)
+
+        probabilities = (c_double * count)()
+        for i in range(count):
+            primary, secondary = primary_states[i], secondary_states[i]
+            relative_position = Vector3D(*secondary[:3]) - Vector3D(*primary[:3])
+            relative_velocity = Vector3D(*secondary[3:6]) - Vector3D(*primary[3:6])
+            if relative_velocity.magnitude == 0:
+                probabilities[i] = nan
+                continue
+
+            y_hat = relative_velocity.unit
+            normal = relative_position.cross(relative_velocity)
+            z_hat = normal.unit if normal.magnitude > 0 else CollisionProbability._get_perpendicular(y_hat)
+            x_hat = y_hat.cross(z_hat)
+
+            primary_cov = CollisionProbability._get_position_covariance(primary_eci[i])
+            secondary_cov = CollisionProbability._get_position_covariance(secondary_eci[i])
+            combined = [[primary_cov[r][c] + secondary_cov[r][c] for c in range(3)] for r in range(3)]
+
+            c_xx = CollisionProbability._project(combined, x_hat, x_hat)
+            c_xz = CollisionProbability._project(combined, x_hat, z_hat)
+            c_zz = CollisionProbability._project(combined, z_hat, z_hat)
+            miss_x = relative_position.dot(x_hat)
+            miss_z = relative_position.dot(z_hat)
+
+            center = 0.5 * (c_xx + c_zz)
+            spread = sqrt((0.5 * (c_xx - c_zz)) ** 2 + c_xz * c_xz)
+            theta = 0.5 * atan2(2 * c_xz, c_xx - c_zz)
+            major = center + spread
+            minor = center - spread
+            if minor <= 0:
+                probabilities[i] = nan
+                continue
+
+            miss_major = cos(theta) * miss_x + sin(theta) * miss_z
+            miss_minor = -sin(theta) * miss_x + cos(theta) * miss_z
+            probabilities[i] = CollisionProbability.compute_2d(
+                miss_major, miss_minor, sqrt(major), sqrt(minor), hard_body_radii[i], intervals
+            )
+        return probabilities
@@ -0,0 +1,3 @@
+from pysaal.covariance._covariance_stack import CovarianceStack
+
+__all__ = ["CovarianceStack"]
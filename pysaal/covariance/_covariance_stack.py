@@ -0,0 +1,197 @@
+from ctypes import Array, c_double
+from typing import Callable, Optional, Sequence
+
+from pysaal.enums import CovarianceFrame
+from pysaal.lib import DLLs
+from pysaal.time import Epoch
+
+#: Number of elements in the lower triangle of a 6x6 covariance matrix
+LOWER_TRIANGLE_SIZE = 21
+
+#: Number of elements in the state transition array used by PropCovFrState
+STATE_TRANSITION_SIZE = 54
+
+_TO_UVW = {
+    CovarianceFrame.ECI: DLLs.astro_func.CovMtxECIToUVW,
+    CovarianceFrame.PTW: DLLs.astro_func.CovMtxPTWToUVW,
+    CovarianceFrame.EQUINOCTIAL: DLLs.astro_func.CovMtxEqnxToUVW,
+}
+
+_FROM_UVW = {
+    CovarianceFrame.ECI: DLLs.astro_func.CovMtxUVWToECI,
+    CovarianceFrame.PTW: DLLs.astro_func.CovMtxUVWToPTW,
+    CovarianceFrame.EQUINOCTIAL: DLLs.astro_func.CovMtxUVWToEqnx,
+}
+
+
+class CovarianceStack:
+    """Stack of 6x6 covariance matrices expressed in a common frame.
+
+    The matrices are held in a single contiguous ``(N, 6, 6)`` block of doubles so that each row can be handed directly
+    to the SAAL covariance routines without copying.
+    """
+
+    def __init__(self, size: int, frame: CovarianceFrame):
+
+        #: Contiguous ``(N, 6, 6)`` block of covariance matrices
+        self.c_array = (((c_double * 6) * 6) * size)()
+
+        #: The frame of every matrix in the stack.  See :ref:`covariance_frame` for options.
+        self.frame = frame
+
+    def __len__(self) -> int:
+        return len(self.c_array)
+
+    def __getitem__(self, index: int) -> Array[Array[c_double]]:
+        return self.c_array[index]
+
+    @classmethod
+    def from_c_array(cls, c_array: Array[Array[Array[c_double]]], frame: CovarianceFrame) -> "CovarianceStack":
+        """Wrap an existing ``(N, 6, 6)`` ctypes block without copying
+
+        :param c_array: The block of covariance matrices
+        :param frame: The frame of the matrices
+        """
+        stack = cls(0, frame)
+        stack.c_array = c_array
+        return stack
+
+    @classmethod
+    def from_lower_triangles(
+        cls, lower_triangles: Sequence[Sequence[float]], frame: CovarianceFrame
+    ) -> "CovarianceStack":
+        """Expand ``(N, 21)`` lower-triangle rows into full symmetric matrices
+
+        :param lower_triangles: The row-wise lower triangle of each matrix
+        :param frame: The frame of the matrices
+        """
+        stack = cls(len(lower_triangles), frame)
+        lower_triangle = (c_double * LOWER_TRIANGLE_SIZE)()
+        for row, matrix in zip(lower_triangles, stack.c_array):
+            lower_triangle[:] = row[:LOWER_TRIANGLE_SIZE]
+            DLLs.astro_func.LTA21ToMtx6x6(lower_triangle, matrix)
+        return stack
+
+    @classmethod
+    def from_state_transitions(
+        cls,
+        rms: Sequence[float],
+        consider: float,
+        state_transitions: Sequence[Sequence[float]],
+        covariances: Sequence[Array[Array[c_double]]],
+        frame: CovarianceFrame,
+    ) -> "CovarianceStack":
+        """Propagate epoch covariances with their state transition arrays using PropCovFrState
+
+        :param rms: Root mean square of the observation residuals for each row
+        :param consider: Density consider parameter as a percentile (12 is recommended)
+        :param state_transitions: ``(N, 54)`` state transition arrays
+        :param covariances: ``(N, 9, 9)`` covariance matrices at the start time
+        :param frame: The frame shared by the state transitions and covariances
+        """
+        stack = cls(len(state_transitions), frame)
+        state_transition = (c_double * STATE_TRANSITION_SIZE)()
+        for i, matrix in enumerate(stack.c_array):
+            state_transition[:] = state_transitions[i][:STATE_TRANSITION_SIZE]
+            DLLs.astro_func.PropCovFrState(rms[i], consider, state_transition, covariances[i], matrix)
+        return stack
+
+    @property
+    def lower_triangles(self) -> Array[Array[c_double]]:
+        """``(N, 21)`` row-wise lower triangle of each matrix"""
+        lower_triangles = ((c_double * LOWER_TRIANGLE_SIZE) * len(self))()
+        for matrix, lower_triangle in zip(self.c_array, lower_triangles):
+            DLLs.astro_func.Mtx6x6ToLTA21(matrix, lower_triangle)
+        return lower_triangles
+
+    @staticmethod
+    def _get_path(source: CovarianceFrame, target: CovarianceFrame) -> list[CovarianceFrame]:
+        """Frames visited when converting from source to target, routed through ECI for EFG and UVW otherwise"""
+        path = [source]
+        if source == CovarianceFrame.EFG:
+            path.append(CovarianceFrame.ECI)
+        tail = [target]
+        if target == CovarianceFrame.EFG:
+            tail.insert(0, CovarianceFrame.ECI)
+        if path[-1] == tail[0]:
+            return path + tail[1:]
+        if path[-1] != CovarianceFrame.UVW:
+            path.append(CovarianceFrame.UVW)
+        return path + (tail[1:] if tail[0] == CovarianceFrame.UVW else tail)
+
+    def to_frame(
+        self,
+        frame: CovarianceFrame,
+        states: Optional[Sequence[Sequence[float]]] = None,
+        epochs: Optional[Sequence[Epoch]] = None,
+    ) -> "CovarianceStack":
+        r"""Transform every matrix in the stack to a new frame
+
+        :param frame: The frame of the returned stack
+        :param states: ``(N, 6)`` ECI positions and velocities in :math:`km` and :math:`\frac{km}{s}`.  Required when
+            the conversion passes through UVW.
+        :param epochs: The epoch of each matrix.  Required when converting to or from EFG.
+        :raises ValueError: If the states or epochs required for the conversion are not provided
+
+        .. note::
+
+            The ECI frame is whichever inertial frame the states are given in (TEME or J2000).  Two scratch matrices,
+            a position and a velocity buffer are allocated once and reused for every row.
+
+        :example:
+
+        .. code-block:: python
+
+            from pysaal.covariance import CovarianceStack
+            from pysaal.enums import CovarianceFrame
+
+            eci = CovarianceStack(1, CovarianceFrame.ECI)
+            for i in range(6):
+                eci[0][i][i] = 1.0
+            states = [[6778.0, 0.0, 0.0, 0.0, 7.668, 0.0]]
+            uvw = eci.to_frame(CovarianceFrame.UVW, states)
+        """
+        result = CovarianceStack(len(self), frame)
+        path = CovarianceStack._get_path(self.frame, frame)
+        if len(path) == 1:
+            result.c_array[:] = self.c_array[:]
+            return result
+
+        needs_states = any(CovarianceFrame.UVW in pair for pair in zip(path, path[1:]))
+        needs_epochs = CovarianceFrame.EFG in path
+        if needs_states and (states is None or len(states) != len(self)):
+            raise ValueError(f"{len(self)} states are required to convert from {self.frame} to {frame}.")
+        if needs_epochs and (epochs is None or len(epochs) != len(self)):
+            raise ValueError(f"{len(self)} epochs are required to convert from {self.frame} to {frame}.")
+
+        position = (c_double * 3)()
+        velocity = (c_double * 3)()
+        theta = c_double()
+        scratch = (((c_double * 6) * 6) * 2)()
+
+        steps: list[Callable] = []
+        for source, target in zip(path, path[1:]):
+            if source == CovarianceFrame.EFG:
+                steps.append(lambda cov_in, cov_out: DLLs.astro_func.CovMtxEFGToECI(theta, cov_in, cov_out))
+            elif target == CovarianceFrame.EFG:
+                steps.append(lambda cov_in, cov_out: DLLs.astro_func.CovMtxECIToEFG(theta, cov_in, cov_out))
+            elif target == CovarianceFrame.UVW:
+                func = _TO_UVW[source]
+                steps.append(lambda cov_in, cov_out, func=func: func(position, velocity, cov_in, cov_out))
+            else:
+                func = _FROM_UVW[target]
+                steps.append(lambda cov_in, cov_out, func=func: func(position, velocity, cov_in, cov_out))
+
+        last_step = len(steps) - 1
+        for i in range(len(self)):
+            if needs_states:
+                position[:] = states[i][:3]  # type: ignore
+                velocity[:] = states[i][3:6]  # type: ignore
+            if needs_epochs:
+                theta.value = epochs[i].greenwich_angle  # type: ignore
+            cov_in = self.c_array[i]
+            for k, step in enumerate(steps):
+                cov_out = result.c_array[i] if k == last_step else scratch[k % 2]
+                step(cov_in, cov_out)
+                cov_in = cov_out
+        return result
@@ -5,19 +5,41 @@ from pysaal.elements._classical_elements import ClassicalElements
 from pysaal.elements._mean_elements import MeanElements
 from pysaal.elements._lla import LLA
 from pysaal.elements._propagated_tle import PropagatedTLE
+from pysaal.elements._impulsive_maneuver import ImpulsiveManeuver
 from pysaal.elements._tle import TLE
+from pysaal.elements._ground_track import GroundTrack
+from pysaal.elements._tle_validator import TLEValidator
+from pysaal.elements._tle_catalog import TLECatalog
+from pysaal.elements._tle_history import TLEHistory
+from pysaal.elements._tle_writer import TLEWriter
 from pysaal.elements._sp_vector import SPVector
+from pysaal.elements._sp_vector_catalog import SPVectorCatalog
 from pysaal.elements._convert_elements import ConvertElements
+from pysaal.elements._decay_screener import DecayScreener
+from pysaal.elements._maneuver_planner import ManeuverPlanner
+from pysaal.elements._vcm import VCM
+from pysaal.elements._vcm_catalog import VCMCatalog
 
 __all__ = [
     "KeplerianElements",
     "EquinoctialElements",
     "ConvertElements",
+    "DecayScreener",
     "CartesianElements",
     "ClassicalElements",
     "MeanElements",
     "TLE",
+    "GroundTrack",
+    "TLECatalog",
+    "TLEHistory",
+    "TLEValidator",
+    "TLEWriter",
     "LLA",
     "SPVector",
+    "SPVectorCatalog",
     "PropagatedTLE",
+    "ImpulsiveManeuver",
+    "ManeuverPlanner",
+    "VCM",
+    "VCMCatalog",
 ]
@@ -1,5 +1,7 @@
-from ctypes import c_double
+from ctypes import Array, c_double, c_int
+from typing import Optional, Sequence
 
+from pysaal.defaults import DEFAULT_CLASSIFICATION, DEFAULT_SATELLITE_DESIGNATOR
 from pysaal.elements._cartesian_elements import CartesianElements
 from pysaal.elements._classical_elements import ClassicalElements
 from pysaal.elements._equinoctial_elements import EquinoctialElements
@@ -7,9 +9,12 @@ from pysaal.elements._keplerian_elements import KeplerianElements
 from pysaal.elements._mean_elements import MeanElements
 from pysaal.elements._sp_vector import SPVector
 from pysaal.elements._tle import TLE
+from pysaal.elements._tle_catalog import TLECatalog
 from pysaal.enums import TLEType
 from pysaal.lib import DLLs
+from pysaal.lib._tle import XA_TLE_AGOMGP, XA_TLE_BSTAR, XA_TLE_BTERM, XA_TLE_EPHTYPE, XA_TLE_EPOCH, XA_TLE_SATNUM
 from pysaal.math.constants import B_STAR_TO_B_TERM_COEFFICIENT
+from pysaal.time import Epoch
 
 
 class _GetEquinoctial:
@@ -417,6 +422,72 @@ class _GetTLE:
         DLLs.sgp4_prop.Sgp4PosVelToTleArr(sp.position.c_array, sp.velocity.c_array, tle.c_double_array)
         return tle
 
+    @staticmethod
+    def from_teme_states(
+        states: Sequence[Sequence[float]],
+        epochs: Sequence[Epoch],
+        satellite_ids: Sequence[int],
+        tle_type: TLEType = TLEType.SGP4,
+        b_stars: Optional[Sequence[float]] = None,
+        agoms: Optional[Sequence[float]] = None,
+    ) -> tuple[TLECatalog, Array[c_int]]:
+        r"""Converts many osculating TEME states to mean-element TLEs in one pass
+
+        :param states: ``(N, 6)`` TEME positions and velocities in :math:`km` and :math:`\frac{km}{s}`
+        :param epochs: The epoch of each state
+        :param satellite_ids: The satellite ID of each state
+        :param tle_type: The type of TLE to generate.  Must be SGP, SGP4 or XP.
+        :param b_stars: B* drag term of each state in :math:`\frac{1}{er}`.  Defaults to zero.
+        :param agoms: Solar radiation pressure coefficient of each state in :math:`\frac{m^2}{kg}`.  Only used by XP.
+        :raises ValueError: If the inputs have different lengths or the TLE type is SP
+        :return: A catalog of the generated TLEs and the ``Sgp4PosVelToTleArr`` status of each row.  A nonzero
+            status means the conversion did not converge, although a less accurate element set is still written.
+
+        .. note::
+
+            ``Sgp4PosVelToTleArr`` returns SGP4 (Kozai) mean elements, which are the elements expected in a TLE.  They
+            are not Brouwer mean elements, so they should not be compared with elements from other mean theories.
+
+        :example:
+
+        .. code-block:: python
+
+            from pysaal.elements import ConvertElements
+            from pysaal.time import Epoch
+
+            epoch = Epoch(27368.0)
+            states = [[-42134.8666, -1477.3611, -95.4631, 0.1074911, -3.0729420, 0.0214372]]
+            catalog, status = ConvertElements.tle.from_teme_states(states, [epoch], [1])
+        """
+        if tle_type == TLEType.SP:
+            raise ValueError("SP element sets cannot be generated from SGP4 mean elements.")
+        count = len(states)
+        if len(epochs) != count or len(satellite_ids) != count:
+            raise ValueError("States, epochs and satellite IDs must have the same length.")
+        if (b_stars is not None and len(b_stars) != count) or (agoms is not None and len(agoms) != count):
+            raise ValueError("Drag terms must have the same length as the states.")
+
+        catalog = TLECatalog(count)
+        status = (c_int * count)()
+        text = f"{DEFAULT_CLASSIFICATION.value}{DEFAULT_SATELLITE_DESIGNATOR: <{TLE.MAX_DESIGNATOR_LENGTH}}".encode()
+        pos = (c_double * 3)()
+        vel = (c_double * 3)()
+        for i, xa_tle in enumerate(catalog.c_double_block):
+            xa_tle[XA_TLE_SATNUM] = float(satellite_ids[i])
+            xa_tle[XA_TLE_EPOCH] = epochs[i].utc_ds50
+            xa_tle[XA_TLE_EPHTYPE] = tle_type.value
+            catalog.c_char_block[i][: len(text)] = text
+            b_star = 0.0 if b_stars is None else b_stars[i]
+            if tle_type == TLEType.XP:
+                xa_tle[XA_TLE_BTERM] = b_star * B_STAR_TO_B_TERM_COEFFICIENT
+                xa_tle[XA_TLE_AGOMGP] = 0.0 if agoms is None else agoms[i]
+            else:
+                xa_tle[XA_TLE_BSTAR] = b_star
+            pos[:] = states[i][:3]  # type: ignore
+            vel[:] = states[i][3:6]  # type: ignore
+            status[i] = DLLs.sgp4_prop.Sgp4PosVelToTleArr(pos, vel, xa_tle)
+        return catalog, status
+
 
 class ConvertElements:
     """Class used to convert between different types of orbital elements"""
@@ -0,0 +1,134 @@
+from ctypes import Array, c_double, c_longlong
+from math import nan, pi
+from typing import Sequence
+
+from pysaal.elements._tle import TLE
+from pysaal.elements._tle_catalog import TLECatalog
+from pysaal.lib import DLLs
+from pysaal.lib._el_ops import XA_SATPARM_INCLI, XA_SATPARM_PERIGEEHT, XA_SATPARM_PERIOD
+from pysaal.math.constants import MINUTES_IN_DAY, SECONDS_IN_DAY
+
+
+class DecayScreener:
+    """Batch reentry screening with ``FindSatDecayTime``.
+
+    Objects are prefiltered by perigee height and geosynchronous orbits are skipped before any decay estimate is made,
+    so only the low-perigee part of a catalog pays for the decay search.  Decay epochs are returned as a contiguous
+    array of UTC days since 1950 in which ``nan`` marks objects that were skipped or for which no decay time was found.
+
+    :example:
+
+    .. code-block:: python
+
+        from math import isnan
+        from pathlib import Path
+
+        from pysaal.elements import DecayScreener, TLECatalog
+
+        catalog = TLECatalog.from_file(Path("catalog.tle"))
+        screener = DecayScreener(f10_average=180.0)
+        decay_epochs = screener.screen_catalog(catalog)
+        decaying = [i for i, ds50 in enumerate(decay_epochs) if not isnan(ds50)]
+    """
+
+    #: Default average F10.7 solar flux in :math:`SFU`
+    DEFAULT_F10_AVERAGE = 150.0
+
+    #: Default maximum perigee height of a screened object in :math:`km`
+    DEFAULT_MAX_PERIGEE_HEIGHT = 1000.0
+
+    def __init__(
+        self, f10_average: float = DEFAULT_F10_AVERAGE, max_perigee_height: float = DEFAULT_MAX_PERIGEE_HEIGHT
+    ):
+
+        #: The average F10.7 solar flux in :math:`SFU` used for every decay estimate
+        self.f10_average = f10_average
+
+        #: Objects with a perigee height above this value in :math:`km` are skipped
+        self.max_perigee_height = max_perigee_height
+
+    @staticmethod
+    def get_satellite_parameters(key: int) -> Array[c_double]:
+        """Get the orbit parameters the library derives for a loaded satellite
+
+        :param key: The key of the satellite
+        :return: The ``XA_SATPARM`` array, or an array of zeros if the library is unable to compute it
+        """
+        parameters = (c_double * 32)()
+        DLLs.el_ops.GetSatParameters(c_longlong(key), parameters)
+        return parameters
+
+    def _find_decay(self, key: int) -> float:
+        decay_ds50 = c_double()
+        if DLLs.el_ops.FindSatDecayTime(c_longlong(key), self.f10_average, decay_ds50):
+            return nan
+        return decay_ds50.value
+
+    def screen_keys(self, keys: Sequence[int]) -> Array[c_double]:
+        """Estimate the decay epochs of loaded satellites
+
+        :param keys: The keys of the satellites
+        :return: The decay epoch of each satellite in UTC days since 1950, or ``nan`` if it was skipped
+
+        .. note::
+
+            The perigee height, period and inclination used by the prefilter come from ``GetSatParameters``.
+        """
+        decay_epochs = (c_double * len(keys))()
+        for i, key in enumerate(keys):
+            parameters = DecayScreener.get_satellite_parameters(key)
+            perigee_height = parameters[XA_SATPARM_PERIGEEHT]
+            is_geo = DLLs.el_ops.IsGeoOrbit(parameters[XA_SATPARM_INCLI], parameters[XA_SATPARM_PERIOD])
+            if perigee_height > self.max_perigee_height or is_geo:
+                decay_epochs[i] = nan
+            else:
+                decay_epochs[i] = self._find_decay(key)
+        return decay_epochs
+
+    def screen_loaded(self) -> tuple[Array[c_longlong], Array[c_double]]:
+        """Estimate the decay epochs of every TLE in memory
+
+        :return: The keys of the TLEs in memory and the decay epoch of each one
+        """
+        keys = TLE.get_loaded_keys()
+        return keys, self.screen_keys(keys)
+
+    @staticmethod
+    def get_perigee_heights(catalog: TLECatalog) -> list[float]:
+        """Compute the approximate perigee height of every record from its mean motion and eccentricity in :math:`km`
+
+        :param catalog: The TLEs to evaluate
+        """
+        from pysaal.bodies import Earth
+
+        constants = Earth.get_constants()
+        heights = []
+        for mean_motion, eccentricity in zip(catalog.mean_motions, catalog.eccentricities):
+            if mean_motion <= 0:
+                heights.append(nan)
+                continue
+            n = mean_motion * 2 * pi / SECONDS_IN_DAY
+            semi_major_axis = (constants.mu / (n * n)) ** (1 / 3)
+            heights.append(semi_major_axis * (1 - eccentricity) - constants.radius)
+        return heights
+
+    def screen_catalog(self, catalog: TLECatalog) -> Array[c_double]:
+        """Estimate the decay epochs of every record in a catalog
+
+        :param catalog: The TLEs to screen
+        :return: The decay epoch of each record in UTC days since 1950, or ``nan`` if it was skipped
+
+        .. note::
+
+            The prefilter is evaluated on the catalog columns without calling the library, and only the records that
+            pass it are loaded into memory.
+        """
+        decay_epochs = (c_double * len(catalog))()
+        periods = [MINUTES_IN_DAY / n if n > 0 else 0.0 for n in catalog.mean_motions]
+        heights = DecayScreener.get_perigee_heights(catalog)
+        for i, (height, inclination, period) in enumerate(zip(heights, catalog.inclinations, periods)):
+            if not height <= self.max_perigee_height or DLLs.el_ops.IsGeoOrbit(inclination, period):
+                decay_epochs[i] = nan
+            else:
+                decay_epochs[i] = self._find_decay(catalog.load_record(i))
+        return decay_epochs
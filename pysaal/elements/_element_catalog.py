@@ -0,0 +1,177 @@
+from abc import ABC, abstractmethod
+from ctypes import Array, c_char, c_double, c_longlong
+from mmap import ACCESS_COPY, mmap
+from pathlib import Path
+from struct import Struct
+from typing import Iterator, Sequence
+
+#: Layout of the binary file header: magic, format version, numeric record size, text record size and record count
+_HEADER = Struct("<8sIIIQ")
+
+#: Identifier at the start of every binary catalog file
+_MAGIC = b"PYSAALEC"
+
+#: Version of the binary catalog layout
+_VERSION = 1
+
+
+class _ElementCatalog(ABC):
+    """Base class for catalogs that keep their records in contiguous ctypes blocks.
+
+    The numeric fields of every record live in one ``(N, NUMERIC_SIZE)`` block of doubles and the text fields in a
+    matching ``(N, TEXT_SIZE)`` block of characters.  Each row is a zero-copy view that can be passed directly to the
+    SAAL functions, and columns are gathered with strided buffer copies instead of per-element Python loops.
+
+    .. note::
+
+        The blocks are C-contiguous, so they can be wrapped without copying by array libraries that understand the
+        buffer protocol (e.g. ``numpy.ctypeslib.as_array``).
+    """
+
+    #: Number of doubles in a single numeric record
+    NUMERIC_SIZE = 0
+
+    #: Number of characters in a single text record
+    TEXT_SIZE = 0
+
+    #: Number of bytes reserved for the header of a binary catalog file, which keeps the numeric block aligned
+    BINARY_HEADER_SIZE = 64
+
+    def __init__(self, size: int):
+
+        #: Contiguous block holding the numeric fields of every record
+        self.c_double_block = ((c_double * self.NUMERIC_SIZE) * size)()
+
+        #: Contiguous block holding the text fields of every record
+        self.c_char_block = ((c_char * self.TEXT_SIZE) * size)()
+
+        #: Keys of the records in memory.  A value of 0 indicates the record has not been loaded.
+        self.keys = (c_longlong * size)()
+
+    def __len__(self) -> int:
+        return len(self.c_double_block)
+
+    def __iter__(self) -> Iterator:
+        for i in range(len(self)):
+            yield self[i]
+
+    @abstractmethod
+    def __getitem__(self, index: int):
+        """Get a view of a single record"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.destroy()
+
+    @abstractmethod
+    def destroy(self) -> None:
+        """Remove every loaded record of the catalog from memory"""
+
+    @property
+    def loaded(self) -> bool:
+        """Flag indicating if every record in the catalog is loaded into memory"""
+        return len(self) > 0 and all(self.keys)
+
+    def _flat_view(self) -> memoryview:
+        return memoryview(self.c_double_block).cast("B").cast("d")
+
+    def get_column(self, index: int) -> Array[c_double]:
+        """Gather a single numeric field for every record
+
+        :param index: The index of the field in the numeric record
+        :return: A contiguous array of length ``N``
+        """
+        column = (c_double * len(self))()
+        if len(self):
+            memoryview(column).cast("B").cast("d")[:] = self._flat_view()[index :: self.NUMERIC_SIZE]
+        return column
+
+    def set_column(self, index: int, values: Sequence[float]) -> None:
+        """Scatter values into a single numeric field of every record
+
+        :param index: The index of the field in the numeric record
+        :param values: One value per record
+
+        .. note::
+
+            Records that are already loaded are not updated in memory until they are reloaded.
+        """
+        if len(values) != len(self):
+            raise ValueError(f"Expected {len(self)} values but received {len(values)}.")
+        if len(self):
+            column = (c_double * len(self))(*values)
+            self._flat_view()[index :: self.NUMERIC_SIZE] = memoryview(column).cast("B").cast("d")
+
+    def get_columns(self, start: int, count: int) -> Array[Array[c_double]]:
+        """Gather a run of adjacent numeric fields for every record
+
+        :param start: The index of the first field in the numeric record
+        :param count: The number of adjacent fields to gather
+        :return: A contiguous ``(N, count)`` array
+        """
+        columns = ((c_double * count) * len(self))()
+        if len(self):
+            destination = memoryview(columns).cast("B").cast("d")
+            source = self._flat_view()
+            for offset in range(count):
+                destination[offset::count] = source[start + offset :: self.NUMERIC_SIZE]
+        return columns
+
+    def get_text_column(self, start: int, length: int) -> list[str]:
+        """Gather a fixed-width text field for every record
+
+        :param start: The index of the first character of the field in the text record
+        :param length: The width of the field
+        """
+        return [row[start : start + length].rstrip(b"\x00").decode().strip() for row in self.c_char_block]
+
+    def save_binary(self, file_path: Path) -> None:
+        """Write the records to a binary catalog file
+
+        :param file_path: The path of the file to write
+
+        .. note::
+
+            The file holds a header of :attr:`BINARY_HEADER_SIZE` bytes followed by the ``(N, NUMERIC_SIZE)`` float64
+            block and the ``(N, TEXT_SIZE)`` character block exactly as they are laid out in memory.  The numeric block
+            can therefore also be opened with ``numpy.memmap`` at an offset of :attr:`BINARY_HEADER_SIZE`.
+        """
+        header = _HEADER.pack(_MAGIC, _VERSION, self.NUMERIC_SIZE, self.TEXT_SIZE, len(self))
+        with open(file_path, "wb") as f:
+            f.write(header.ljust(self.BINARY_HEADER_SIZE, b"\x00"))
+            f.write(memoryview(self.c_double_block).cast("B"))
+            f.write(memoryview(self.c_char_block).cast("B"))
+
+    @classmethod
+    def from_binary(cls, file_path: Path):
+        """Open a binary catalog file written by :meth:`save_binary` without parsing it
+
+        :param file_path: The path to the binary catalog file
+        :raises ValueError: If the file is not a binary catalog of this type
+
+        .. note::
+
+            The file is memory-mapped copy-on-write and the record blocks are views into the mapping, so opening is
+            independent of the number of records and processes that open the same file share its pages.  Edits are
+            private to the process and are not written back to the file.  No record is loaded into memory.
+        """
+        with open(file_path, "rb") as f:
+            mapping = mmap(f.fileno(), 0, access=ACCESS_COPY)
+        if len(mapping) < cls.BINARY_HEADER_SIZE:
+            raise ValueError(f"{file_path} is not a binary catalog file.")
+        magic, version, numeric_size, text_size, size = _HEADER.unpack_from(mapping)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{file_path} is not a version {_VERSION} binary catalog file.")
+        if numeric_size != cls.NUMERIC_SIZE or text_size != cls.TEXT_SIZE:
+            raise ValueError(f"{file_path} does not hold records of type {cls.__name__}.")
+        text_offset = cls.BINARY_HEADER_SIZE + size * numeric_size * 8
+        if len(mapping) < text_offset + size * text_size:
+            raise ValueError(f"{file_path} is truncated.")
+
+        catalog = cls(0)
+        catalog.c_double_block = ((c_double * numeric_size) * size).from_buffer(mapping, cls.BINARY_HEADER_SIZE)
+        catalog.c_char_block = ((c_char * text_size) * size).from_buffer(mapping, text_offset)
+        catalog.keys = (c_longlong * size)()
+        return catalog
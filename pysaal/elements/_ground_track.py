@@ -0,0 +1,178 @@
+from ctypes import Array, c_double
+from math import floor
+from typing import Sequence
+
+from pysaal.elements._lla import LLA
+from pysaal.elements._tle import TLE
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.math.constants import MINUTUES_TO_DAYS
+from pysaal.time import Epoch, TimeSpan
+
+
+class GroundTrack:
+    """Sub-satellite points of a satellite over a time grid.
+
+    Points are produced by ``Sgp4PropDs50UtcLLH`` directly into a contiguous ``(N, 3)`` block of geodetic latitude,
+    longitude and height, so no intermediate state or :class:`PropagatedTLE` is built for each point.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.elements import TLE, GroundTrack
+        from pysaal.time import TimeSpan
+
+        line_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+        line_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+        tle = TLE.from_lines(line_1, line_2)
+
+        track = GroundTrack.from_tle(tle, TimeSpan(tle.epoch, tle.epoch + 0.1), 1.0)
+        for segment in track.split_at_antimeridian():
+            print(segment.longitudes[0], segment.longitudes[-1])
+    """
+
+    def __init__(self, satellite_id: int, size: int):
+
+        #: The satellite ID of the propagated TLE
+        self.satellite_id = satellite_id
+
+        #: UTC epoch of every point as days since 1950
+        self.times = (c_double * size)()
+
+        #: Contiguous ``(N, 3)`` block of latitude and longitude in :math:`degrees` and height in :math:`km`
+        self.c_array = ((c_double * 3) * size)()
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, index: int) -> LLA:
+        return LLA.from_c_array(self.c_array[index])
+
+    @staticmethod
+    def get_time_grid(span: TimeSpan, step: float) -> Array[c_double]:
+        """Get evenly spaced UTC epochs from the start of a span up to and including its end
+
+        :param span: The time span to cover
+        :param step: The step between points in :math:`minutes`
+        :raises ValueError: If the step is not positive
+        """
+        if step <= 0:
+            raise ValueError("The step must be positive.")
+        step_days = step * MINUTUES_TO_DAYS
+        size = int(floor(span.days / step_days + 1e-9)) + 1
+        start = span.start.utc_ds50
+        return (c_double * size)(*[start + i * step_days for i in range(size)])
+
+    @classmethod
+    def from_times(cls, tle: TLE, times: Sequence[float]) -> "GroundTrack":
+        """Propagate a TLE to every epoch of a time grid
+
+        :param tle: The TLE to propagate.  It is loaded into memory if it is not already.
+        :param times: UTC epochs as days since 1950
+        :raises PySAALError: If there is an error during propagation
+
+        .. note::
+
+            Longitudes are wrapped to the range :math:`[-180, 180)`.
+        """
+        if not tle.loaded:
+            tle.load()
+        track = cls(tle.satellite_id, len(times))
+        track.times[:] = times  # type: ignore
+        for utc_ds50, llh in zip(times, track.c_array):
+            error = DLLs.sgp4_prop.Sgp4PropDs50UtcLLH(tle.key, utc_ds50, llh)
+            if error:
+                raise PySAALError
+            llh[1] = (llh[1] + 180.0) % 360.0 - 180.0
+        return track
+
+    @classmethod
+    def from_tle(cls, tle: TLE, span: TimeSpan, step: float) -> "GroundTrack":
+        """Generate the ground track of a TLE over a time span
+
+        :param tle: The TLE to propagate
+        :param span: The time span to cover
+        :param step: The step between points in :math:`minutes`
+        """
+        return cls.from_times(tle, GroundTrack.get_time_grid(span, step))
+
+    @classmethod
+    def from_catalog(cls, tles: Sequence[TLE], span: TimeSpan, step: float) -> list["GroundTrack"]:
+        """Generate the ground tracks of many TLEs on a common time grid
+
+        :param tles: The TLEs to propagate
+        :param span: The time span to cover
+        :param step: The step between points in :math:`minutes`
+        """
+        times = GroundTrack.get_time_grid(span, step)
+        return [cls.from_times(tle, times) for tle in tles]
+
+    @property
+    def epochs(self) -> list[Epoch]:
+        """Epoch of every point"""
+        return [Epoch(utc_ds50) for utc_ds50 in self.times]
+
+    @property
+    def latitudes(self) -> list[float]:
+        """Geodetic latitude of every point in :math:`degrees`"""
+        return [llh[0] for llh in self.c_array]
+
+    @property
+    def longitudes(self) -> list[float]:
+        """East longitude of every point in :math:`degrees`"""
+        return [llh[1] for llh in self.c_array]
+
+    @property
+    def altitudes(self) -> list[float]:
+        """Height above the ellipsoid of every point in :math:`km`"""
+        return [llh[2] for llh in self.c_array]
+
+    def split_at_antimeridian(self) -> list["GroundTrack"]:
+        r"""Split the track into segments that do not cross the antimeridian
+
+        .. note::
+
+            A point interpolated onto :math:`\pm 180` degrees longitude closes each segment and opens the next so that
+            plotted lines reach the edge of the map.
+        """
+        segments: list[list[tuple[float, float, float, float]]] = [[]]
+        previous = None
+        for utc_ds50, (lat, lon, alt) in zip(self.times, self.c_array):
+            if previous is not None and abs(lon - previous[2]) > 180.0:
+                edge = 180.0 if previous[2] > 0 else -180.0
+                unwrapped = lon + 2 * edge
+                fraction = (edge - previous[2]) / (unwrapped - previous[2])
+                t_edge = previous[0] + fraction * (utc_ds50 - previous[0])
+                lat_edge = previous[1] + fraction * (lat - previous[1])
+                alt_edge = previous[3] + fraction * (alt - previous[3])
+                segments[-1].append((t_edge, lat_edge, edge, alt_edge))
+                segments.append([(t_edge, lat_edge, -edge, alt_edge)])
+            previous = (utc_ds50, lat, lon, alt)
+            segments[-1].append(previous)
+
+        tracks = []
+        for points in segments:
+            track = GroundTrack(self.satellite_id, len(points))
+            for i, (utc_ds50, lat, lon, alt) in enumerate(points):
+                track.times[i] = utc_ds50
+                track.c_array[i][:] = [lat, lon, alt]
+            tracks.append(track)
+        return tracks
+
+    def to_geojson(self) -> dict:
+        """Export the track as a GeoJSON feature split at the antimeridian
+
+        :return: A ``MultiLineString`` feature of longitude/latitude pairs with the satellite ID as a property
+        """
+        return {
+            "type": "Feature",
+            "geometry": {
+                "type": "MultiLineString",
+                "coordinates": [
+                    [[lon, lat] for lat, lon in zip(segment.latitudes, segment.longitudes)]
+                    for segment in self.split_at_antimeridian()
+                ],
+            },
+            "properties": {"satellite_id": self.satellite_id},
+        }
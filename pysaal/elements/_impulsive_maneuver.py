@@ -0,0 +1,107 @@
+from ctypes import Array, c_double, c_longlong
+from math import sqrt
+from typing import Sequence
+
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._el_ops import (
+    VP_TIME_DS50UTC,
+    XA_VP_IMPULSE_U,
+    XA_VP_IMPULSE_V,
+    XA_VP_IMPULSE_W,
+    XA_VP_INTERVAL,
+    XA_VP_REPETITIONS,
+    XA_VP_SIZE,
+    XA_VP_TIMETYPE,
+    XA_VP_TIMEVAL,
+)
+from pysaal.math.constants import MINUTUES_TO_DAYS
+from pysaal.time import Epoch
+
+
+class ImpulsiveManeuver:
+    """Instantaneous change in velocity expressed in the UVW frame of the satellite.
+
+    U is along the position vector, W is along the orbit normal and V completes the right-handed frame in the direction
+    of motion.  A maneuver may repeat a fixed number of times at a fixed interval.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.elements import ImpulsiveManeuver
+        from pysaal.time import Epoch
+
+        burn = ImpulsiveManeuver(Epoch(27368.5), [0.0, 0.002, 0.0])
+    """
+
+    def __init__(self, epoch: Epoch, delta_v: Sequence[float], repetitions: int = 0, interval: float = 0.0):
+
+        #: The time of the first impulse
+        self.epoch = epoch
+
+        #: The U, V and W components of the impulse in :math:`\frac{km}{s}`
+        self.delta_v = list(delta_v)
+
+        #: Number of additional times the impulse is applied
+        self.repetitions = repetitions
+
+        #: Time between repetitions in :math:`minutes`
+        self.interval = interval
+
+    @property
+    def c_array(self) -> Array[c_double]:
+        """The maneuver in the VP-card array format used by ``AddManeuverVPArr``"""
+        xa_vp = (c_double * XA_VP_SIZE)()
+        xa_vp[XA_VP_TIMETYPE] = VP_TIME_DS50UTC
+        xa_vp[XA_VP_TIMEVAL] = self.epoch.utc_ds50
+        xa_vp[XA_VP_IMPULSE_U] = self.delta_v[0]
+        xa_vp[XA_VP_IMPULSE_V] = self.delta_v[1]
+        xa_vp[XA_VP_IMPULSE_W] = self.delta_v[2]
+        xa_vp[XA_VP_REPETITIONS] = self.repetitions
+        xa_vp[XA_VP_INTERVAL] = self.interval
+        return xa_vp
+
+    def add_to_key(self, key: int) -> None:
+        """Attach the maneuver to a VCM, SP vector or SP TLE in memory
+
+        :param key: The key of the element set
+        :raises PySAALError: If the library rejects the maneuver
+
+        .. note::
+
+            Maneuvers must be added before the element set is initialized for propagation.
+        """
+        if DLLs.el_ops.AddManeuverVPArr(c_longlong(key), self.c_array):
+            raise PySAALError
+
+    def get_events(self) -> list[tuple[float, list[float]]]:
+        """Expand the repetitions into individual impulses
+
+        :return: The UTC time as days since 1950 and the UVW impulse of every application of the maneuver
+        """
+        step = self.interval * MINUTUES_TO_DAYS
+        return [(self.epoch.utc_ds50 + i * step, list(self.delta_v)) for i in range(self.repetitions + 1)]
+
+    @staticmethod
+    def get_inertial_delta_v(
+        position: Sequence[float], velocity: Sequence[float], delta_v: Sequence[float]
+    ) -> list[float]:
+        r"""Rotate a UVW impulse into the inertial frame of a state
+
+        :param position: The position of the satellite in :math:`km`
+        :param velocity: The velocity of the satellite in :math:`\frac{km}{s}`
+        :param delta_v: The U, V and W components of the impulse in :math:`\frac{km}{s}`
+        :return: The impulse in the frame of the state in :math:`\frac{km}{s}`
+        """
+        r = sqrt(sum(p * p for p in position))
+        u = [p / r for p in position]
+        h = [
+            position[1] * velocity[2] - position[2] * velocity[1],
+            position[2] * velocity[0] - position[0] * velocity[2],
+            position[0] * velocity[1] - position[1] * velocity[0],
+        ]
+        h_norm = sqrt(sum(c * c for c in h))
+        w = [c / h_norm for c in h]
+        v = [w[1] * u[2] - w[2] * u[1], w[2] * u[0] - w[0] * u[2], w[0] * u[1] - w[1] * u[0]]
+        return [delta_v[0] * u[i] + delta_v[1] * v[i] + delta_v[2] * w[i] for i in range(3)]
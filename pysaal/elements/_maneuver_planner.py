@@ -0,0 +1,160 @@
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import Array, c_double
+from itertools import repeat
+from typing import Optional, Sequence
+
+from pysaal.elements._convert_elements import ConvertElements
+from pysaal.elements._impulsive_maneuver import ImpulsiveManeuver
+from pysaal.elements._tle import TLE
+from pysaal.elements._tle_catalog import TLECatalog
+from pysaal.enums import TLEType
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.time import Epoch
+
+
+class ManeuverPlanner:
+    r"""What-if propagation of a TLE through sequences of impulsive maneuvers with SGP4.
+
+    At each impulse the state is propagated from the element set in effect, the impulse is rotated from UVW into TEME
+    and added to the velocity, and the post-maneuver state is converted back to a TLE with ``Sgp4PosVelToTleArr``.
+    Every requested epoch is then propagated from the element set in effect at that time.
+
+    .. note::
+
+        The post-maneuver element sets are loaded under temporary satellite IDs from
+        :meth:`TLE.get_unused_satellite_ids` and are removed from memory before returning.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.elements import TLE, ImpulsiveManeuver, ManeuverPlanner
+
+        line_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+        line_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+        tle = TLE.from_lines(line_1, line_2)
+
+        planner = ManeuverPlanner(tle)
+        burn_epoch = tle.epoch + 0.1
+        variants = [[ImpulsiveManeuver(burn_epoch, [0.0, dv * 1e-3, 0.0])] for dv in range(-5, 6)]
+        states = planner.sweep(variants, [tle.epoch + 1.0])
+    """
+
+    def __init__(self, tle: TLE):
+
+        #: The element set before any maneuver
+        self.tle = tle
+
+    @staticmethod
+    def _propagate_key(key: int, utc_ds50: float, state: Array[c_double]) -> None:
+        position = (c_double * 3)()
+        velocity = (c_double * 3)()
+        if DLLs.sgp4_prop.Sgp4PropDs50UtcPosVel(key, utc_ds50, position, velocity):
+            raise PySAALError
+        state[:3] = position[:]
+        state[3:] = velocity[:]
+
+    def _get_tle_type(self) -> TLEType:
+        if self.tle.ephemeris_type == TLEType.SP:
+            raise ValueError("SP element sets cannot be propagated with SGP4.")
+        return self.tle.ephemeris_type
+
+    def propagate(self, maneuvers: Sequence[ImpulsiveManeuver], epochs: Sequence[Epoch]) -> Array[Array[c_double]]:
+        r"""Propagate the TLE through a sequence of maneuvers
+
+        :param maneuvers: The maneuvers to apply.  Repetitions are expanded into individual impulses.
+        :param epochs: The output epochs
+        :raises ValueError: If the TLE is an SP element set
+        :raises PySAALError: If there is an error during propagation
+        :return: ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}`
+        """
+        tle_type = self._get_tle_type()
+        if not self.tle.loaded:
+            self.tle.load()
+        events = sorted(event for maneuver in maneuvers for event in maneuver.get_events())
+        event_times = [utc_ds50 for utc_ds50, _ in events]
+
+        keys = [self.tle.key]
+        segments: list[TLECatalog] = []
+        state = (c_double * 6)()
+        temporary_ids = TLE.get_unused_satellite_ids(len(events))
+        try:
+            previous = self.tle
+            for i, (utc_ds50, delta_v) in enumerate(events):
+                ManeuverPlanner._propagate_key(keys[-1], utc_ds50, state)
+                burn = ImpulsiveManeuver.get_inertial_delta_v(state[:3], state[3:], delta_v)
+                for j in range(3):
+                    state[3 + j] += burn[j]
+                segment, _ = ConvertElements.tle.from_teme_states(
+                    [state[:]],
+                    [Epoch(utc_ds50)],
+                    [temporary_ids[i]],
+                    tle_type,
+                    [previous.b_star],
+                    [previous.agom] if tle_type == TLEType.XP else None,
+                )
+                segments.append(segment)
+                keys.append(segment.load_record(0))
+                previous = segment[0]
+
+            states = ((c_double * 6) * len(epochs))()
+            for epoch, out in zip(epochs, states):
+                key = keys[bisect_right(event_times, epoch.utc_ds50)]
+                ManeuverPlanner._propagate_key(key, epoch.utc_ds50, out)
+        finally:
+            for segment in segments:
+                segment.destroy()
+        return states
+
+    def sweep(
+        self,
+        variants: Sequence[Sequence[ImpulsiveManeuver]],
+        epochs: Sequence[Epoch],
+        max_workers: Optional[int] = None,
+    ) -> list[Array[Array[c_double]]]:
+        r"""Propagate many maneuver variants of the same TLE in parallel worker processes
+
+        :param variants: The sequence of maneuvers of each variant
+        :param epochs: The output epochs shared by every variant
+        :param max_workers: Number of worker processes.  Defaults to the number of processors.  A value of 1 runs
+            every variant in the calling process.
+        :return: ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}` for each variant
+
+        .. note::
+
+            The SAAL libraries keep their state per process, so the variants run in separate processes rather than
+            threads.  The TLE lines, impulses and epochs are sent to the workers as plain values.
+        """
+        if max_workers == 1:
+            return [self.propagate(maneuvers, epochs) for maneuvers in variants]
+
+        self._get_tle_type()
+        times = [epoch.utc_ds50 for epoch in epochs]
+        payloads = []
+        for variant in variants:
+            payloads.append([(burn.epoch.utc_ds50, burn.delta_v, burn.repetitions, burn.interval) for burn in variant])
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_propagate_in_worker, repeat(self.tle.lines), payloads, repeat(times)))
+
+        sweeps = []
+        for rows in results:
+            states = ((c_double * 6) * len(rows))()
+            for state, row in zip(states, rows):
+                state[:] = row
+            sweeps.append(states)
+        return sweeps
+
+
+def _propagate_in_worker(
+    lines: tuple[str, str], maneuvers: list[tuple[float, list[float], int, float]], times: list[float]
+) -> list[list[float]]:
+    """Propagate a single maneuver variant in a worker process and return the states as plain lists"""
+    tle = TLE.from_lines(*lines)
+    variant = [ImpulsiveManeuver(Epoch(t), dv, count, interval) for t, dv, count, interval in maneuvers]
+    try:
+        states = ManeuverPlanner(tle).propagate(variant, [Epoch(t) for t in times])
+    finally:
+        tle.destroy()
+    return [state[:] for state in states]
@@ -1,3 +1,6 @@
+from ctypes import Array, c_char, c_double, c_longlong
+from typing import Sequence
+
 from pysaal.configs import MAX_DESIGNATOR_LENGTH, MAX_SATELLITE_ID
 from pysaal.defaults import (
     DEFAULT_AGOM,
@@ -7,6 +10,29 @@ from pysaal.defaults import (
     DEFAULT_SATELLITE_NAME,
 )
 from pysaal.elements import CartesianElements
+from pysaal.elements._impulsive_maneuver import ImpulsiveManeuver
+from pysaal.enums import Classification, PySAALKeyErrorCode
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._main_dll import IDX_ORDER_READ
+from pysaal.lib._sp_vec import (
+    SPVEC_INPCOORD_TMDAT,
+    XA_SPVEC_AGOM,
+    XA_SPVEC_BTERM,
+    XA_SPVEC_ELSETNUM,
+    XA_SPVEC_EPOCH,
+    XA_SPVEC_INPCOORD,
+    XA_SPVEC_OGPARM,
+    XA_SPVEC_POS1,
+    XA_SPVEC_REVNUM,
+    XA_SPVEC_SATNUM,
+    XA_SPVEC_SIZE,
+    XA_SPVEC_VEL1,
+    XS_SPVEC_SATNAME_1_8,
+    XS_SPVEC_SECCLASS_0_1,
+    XS_SPVEC_SIZE,
+)
+from pysaal.math.constants import KILOMETERS_TO_METERS, METERS_TO_KILOMETERS
 from pysaal.time import Epoch
 
 
@@ -25,6 +51,15 @@ class SPVector:
         #: The ballistic coefficient in :math:`\frac{kg}{m^2}`
         self.b_term = DEFAULT_B_TERM
 
+        #: The outgassing parameter in :math:`\frac{km}{s^2}`
+        self.outgassing_parameter = 0.0
+
+        #: The revolution number at epoch
+        self.revolution_number = 0
+
+        #: The element set number
+        self.element_set_number = 0
+
         self._designator = DEFAULT_SATELLITE_DESIGNATOR
 
         #: The name of the satellite
@@ -34,6 +69,172 @@ class SPVector:
         #: The classification of the satellite
         self.classification = DEFAULT_CLASSIFICATION
 
+        #: Flag indicating if the vector is loaded into memory
+        self.loaded = False
+
+        #: The key used to reference the vector in memory
+        self.key = None
+
+    @classmethod
+    def from_c_arrays(cls, c_double_array: Array[c_double], c_char_array: Array[c_char]) -> "SPVector":
+        """Instantiate an SP vector from c arrays that correspond to the required arguments for the SAAL functions
+
+        :param c_double_array: The c_double array containing the SP vector numeric fields
+        :param c_char_array: The c_char array containing the SP vector string fields
+        """
+        position = c_double_array[XA_SPVEC_POS1 : XA_SPVEC_POS1 + 3]
+        velocity = [v * METERS_TO_KILOMETERS for v in c_double_array[XA_SPVEC_VEL1 : XA_SPVEC_VEL1 + 3]]
+        sp = cls(
+            Epoch(c_double_array[XA_SPVEC_EPOCH]),
+            CartesianElements(*position, *velocity),
+            int(c_double_array[XA_SPVEC_SATNUM]),
+        )
+        sp.b_term = c_double_array[XA_SPVEC_BTERM]
+        sp.agom = c_double_array[XA_SPVEC_AGOM]
+        sp.outgassing_parameter = c_double_array[XA_SPVEC_OGPARM]
+        sp.revolution_number = int(c_double_array[XA_SPVEC_REVNUM])
+        sp.element_set_number = int(c_double_array[XA_SPVEC_ELSETNUM])
+        text = c_char_array.raw
+        try:
+            sp.classification = Classification(text[XS_SPVEC_SECCLASS_0_1 : XS_SPVEC_SECCLASS_0_1 + 1].decode())
+        except ValueError:
+            sp.classification = DEFAULT_CLASSIFICATION
+        designator = text[XS_SPVEC_SATNAME_1_8 : XS_SPVEC_SATNAME_1_8 + MAX_DESIGNATOR_LENGTH]
+        sp._designator = designator.rstrip(b"\x00").decode().strip()
+        return sp
+
+    @classmethod
+    def from_lines(cls, line_1: str, line_2: str) -> "SPVector":
+        """Create an SP vector from the two lines of a 1P/2P card
+
+        :param line_1: The first line of the card
+        :param line_2: The second line of the card
+        :raises PySAALError: If the library is unable to parse the lines
+        """
+        xa_spvec, xs_spvec = SPVector.get_null_pointers()
+        status = DLLs.sp_vec.SpVecLinesToArray(line_1.encode(), line_2.encode(), xa_spvec, xs_spvec)
+        if status:
+            raise PySAALError
+        return cls.from_c_arrays(xa_spvec, xs_spvec)
+
+    @classmethod
+    def from_key(cls, key: c_longlong) -> "SPVector":
+        """Instantiate an SP vector from a known key in memory
+
+        :param key: The key associated with the SP vector in memory
+        """
+        xa_spvec, xs_spvec = SPVector.get_null_pointers()
+        status = DLLs.sp_vec.SpVecDataToArray(key, xa_spvec, xs_spvec)
+        if status:
+            raise PySAALError
+        sp = cls.from_c_arrays(xa_spvec, xs_spvec)
+        sp.loaded = True
+        sp.key = key
+        return sp
+
+    @staticmethod
+    def get_null_pointers() -> tuple[Array[c_double], Array[c_char]]:
+        """Get null pointers for the c_double and c_char arrays used in the SAAL functions"""
+        xa_spvec = (c_double * XA_SPVEC_SIZE)()
+        xs_spvec = (c_char * XS_SPVEC_SIZE)()
+        return xa_spvec, xs_spvec
+
+    @staticmethod
+    def destroy_all() -> None:
+        """Remove all SP vectors from memory"""
+        DLLs.sp_vec.SpVecRemoveAllSats()
+
+    @staticmethod
+    def get_number_in_memory() -> int:
+        """Get the number of SP vectors in memory"""
+        return DLLs.sp_vec.SpVecGetCount()
+
+    @staticmethod
+    def get_loaded_keys() -> Array[c_longlong]:
+        """Get the keys of all SP vectors in memory in the order they were loaded"""
+        keys = (c_longlong * SPVector.get_number_in_memory())()
+        DLLs.sp_vec.SpVecGetLoaded(IDX_ORDER_READ, keys)
+        return keys
+
+    @property
+    def c_arrays(self) -> tuple[Array[c_double], Array[c_char]]:
+        """The numeric and text fields as C arrays to be used by the SAAL library"""
+        xa_spvec, xs_spvec = SPVector.get_null_pointers()
+        self.write_c_arrays(xa_spvec, xs_spvec)
+        return xa_spvec, xs_spvec
+
+    def write_c_arrays(self, c_double_array: Array[c_double], c_char_array: Array[c_char]) -> None:
+        """Write the fields of the SP vector into existing C arrays
+
+        :param c_double_array: The c_double array to receive the numeric fields
+        :param c_char_array: The c_char array to receive the string fields
+
+        .. note::
+
+            This is used to fill catalog rows in place.
+        """
+        els = self.cartesian_elements
+        c_double_array[XA_SPVEC_SATNUM] = float(self.satellite_id)
+        c_double_array[XA_SPVEC_EPOCH] = self.epoch.utc_ds50
+        c_double_array[XA_SPVEC_REVNUM] = float(self.revolution_number)
+        c_double_array[XA_SPVEC_ELSETNUM] = float(self.element_set_number)
+        c_double_array[XA_SPVEC_BTERM] = self.b_term
+        c_double_array[XA_SPVEC_AGOM] = self.agom
+        c_double_array[XA_SPVEC_OGPARM] = self.outgassing_parameter
+        c_double_array[XA_SPVEC_INPCOORD] = SPVEC_INPCOORD_TMDAT
+        c_double_array[XA_SPVEC_POS1 : XA_SPVEC_POS1 + 3] = [els.x, els.y, els.z]
+        c_double_array[XA_SPVEC_VEL1 : XA_SPVEC_VEL1 + 3] = [
+            els.vx * KILOMETERS_TO_METERS,
+            els.vy * KILOMETERS_TO_METERS,
+            els.vz * KILOMETERS_TO_METERS,
+        ]
+        text = f"{self.classification.value}{self.designator: <{MAX_DESIGNATOR_LENGTH}}"
+        c_char_array[: len(text)] = text.encode()  # type: ignore
+
+    @property
+    def lines(self) -> tuple[str, str]:
+        """The two lines of the 1P/2P card generated by the library"""
+        line_1 = (c_char * XS_SPVEC_SIZE)()
+        line_2 = (c_char * XS_SPVEC_SIZE)()
+        xa_spvec, xs_spvec = self.c_arrays
+        DLLs.sp_vec.SpVecArrayToLines(xa_spvec, xs_spvec, line_1, line_2)
+        return line_1.value.decode().rstrip(), line_2.value.decode().rstrip()
+
+    def load(self) -> None:
+        """Load the SP vector into memory"""
+        if not self.loaded:
+            xa_spvec, xs_spvec = self.c_arrays
+            key = DLLs.sp_vec.SpVecAddSatFrArray(xa_spvec, xs_spvec)
+            if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
+                raise PySAALError
+            self.key = key
+            self.loaded = True
+
+    def add_maneuvers(self, maneuvers: Sequence[ImpulsiveManeuver]) -> None:
+        """Attach impulsive maneuvers to the SP vector
+
+        :param maneuvers: The maneuvers to add
+        :raises PySAALError: If the library is unable to load the SP vector or rejects a maneuver
+
+        .. note::
+
+            The SP vector is loaded into memory if it is not already.  Maneuvers must be added before the SP vector is
+            initialized for propagation.
+        """
+        self.load()
+        key = self.key
+        if key is None:
+            raise PySAALError
+        for maneuver in maneuvers:
+            maneuver.add_to_key(key)
+
+    def destroy(self) -> None:
+        """Remove the SP vector from memory"""
+        if self.loaded and self.key is not None:
+            DLLs.sp_vec.SpVecRemoveSat(self.key)
+            self.key = None
+            self.loaded = False
+
     @property
     def designator(self):
         """The 8-character designator of the satellite"""
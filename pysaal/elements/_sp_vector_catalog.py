@@ -0,0 +1,178 @@
+from ctypes import Array, c_char, c_double
+from pathlib import Path
+from typing import Sequence
+
+from pysaal.configs import MAX_DESIGNATOR_LENGTH
+from pysaal.elements._element_catalog import _ElementCatalog
+from pysaal.elements._sp_vector import SPVector
+from pysaal.enums import PySAALKeyErrorCode
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._sp_vec import (
+    XA_SPVEC_AGOM,
+    XA_SPVEC_BTERM,
+    XA_SPVEC_EPOCH,
+    XA_SPVEC_POS1,
+    XA_SPVEC_SATNUM,
+    XA_SPVEC_SIZE,
+    XA_SPVEC_VEL1,
+    XS_SPVEC_SATNAME_1_8,
+    XS_SPVEC_SIZE,
+)
+from pysaal.math.constants import METERS_TO_KILOMETERS
+
+
+class SPVectorCatalog(_ElementCatalog):
+    """Collection of SP vectors stored in contiguous 512-element records.
+
+    Cards are parsed and generated by the SpVec library, so bulk loading and writing never formats text in Python.
+
+    :example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+
+        from pysaal.elements import SPVectorCatalog
+
+        catalog = SPVectorCatalog.from_file(Path("vectors.txt"))
+        catalog.write(Path("hand_off.txt"))
+    """
+
+    NUMERIC_SIZE = XA_SPVEC_SIZE
+    TEXT_SIZE = XS_SPVEC_SIZE
+
+    def __getitem__(self, index: int) -> SPVector:
+        if index < 0:
+            index += len(self)
+        sp = SPVector.from_c_arrays(self.c_double_block[index], self.c_char_block[index])
+        if self.keys[index]:
+            sp.key = self.keys[index]
+            sp.loaded = True
+        return sp
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "SPVectorCatalog":
+        """Load every SP vector in a file and retrieve the records into a catalog
+
+        :param file_path: The path to the file of 1P/2P cards
+        :raises PySAALError: If the library is unable to load the file
+
+        .. note::
+
+            The SP vectors remain loaded in memory and are referenced by :attr:`keys`.
+        """
+        count_before = SPVector.get_number_in_memory()
+        status = DLLs.sp_vec.SpVecLoadFile(file_path.as_posix().encode())
+        if status:
+            raise PySAALError
+        new_keys = SPVector.get_loaded_keys()[count_before:]
+        catalog = cls(len(new_keys))
+        for i, key in enumerate(new_keys):
+            status = DLLs.sp_vec.SpVecDataToArray(key, catalog.c_double_block[i], catalog.c_char_block[i])
+            if status:
+                raise PySAALError
+            catalog.keys[i] = key
+        return catalog
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[tuple[str, str]]) -> "SPVectorCatalog":
+        """Parse pairs of 1P/2P card lines into a catalog
+
+        :param lines: The first and second line of each card
+        :raises PySAALError: If the library is unable to parse one of the cards
+        """
+        catalog = cls(len(lines))
+        for i, (line_1, line_2) in enumerate(lines):
+            status = DLLs.sp_vec.SpVecLinesToArray(
+                line_1.encode(), line_2.encode(), catalog.c_double_block[i], catalog.c_char_block[i]
+            )
+            if status:
+                raise PySAALError
+        return catalog
+
+    @classmethod
+    def from_sp_vectors(cls, sp_vectors: Sequence[SPVector]) -> "SPVectorCatalog":
+        """Write existing SP vector objects into a catalog
+
+        :param sp_vectors: The SP vectors to copy
+        """
+        catalog = cls(len(sp_vectors))
+        for i, sp in enumerate(sp_vectors):
+            sp.write_c_arrays(catalog.c_double_block[i], catalog.c_char_block[i])
+        return catalog
+
+    def load(self) -> None:
+        """Load every record that is not already in memory"""
+        for i in range(len(self)):
+            if not self.keys[i]:
+                key = DLLs.sp_vec.SpVecAddSatFrArray(self.c_double_block[i], self.c_char_block[i])
+                if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
+                    raise PySAALError
+                self.keys[i] = key
+
+    def destroy(self) -> None:
+        """Remove every loaded record of the catalog from memory"""
+        for i in range(len(self)):
+            if self.keys[i]:
+                DLLs.sp_vec.SpVecRemoveSat(self.keys[i])
+                self.keys[i] = 0
+
+    def write(self, file_path: Path) -> None:
+        """Write the catalog to a file of 1P/2P cards
+
+        :param file_path: The path of the file to write
+
+        .. note::
+
+            The cards are generated by the library into a single pair of reused line buffers.
+        """
+        line_1 = (c_char * XS_SPVEC_SIZE)()
+        line_2 = (c_char * XS_SPVEC_SIZE)()
+        with open(file_path, "wb") as f:
+            for xa_spvec, xs_spvec in zip(self.c_double_block, self.c_char_block):
+                DLLs.sp_vec.SpVecArrayToLines(xa_spvec, xs_spvec, line_1, line_2)
+                f.write(line_1.value.rstrip())
+                f.write(b"\n")
+                f.write(line_2.value.rstrip())
+                f.write(b"\n")
+
+    @property
+    def satellite_ids(self) -> list[int]:
+        """Satellite ID of every record"""
+        return [int(satellite_id) for satellite_id in self.get_column(XA_SPVEC_SATNUM)]
+
+    @property
+    def designators(self) -> list[str]:
+        """8-character designator of every record"""
+        return self.get_text_column(XS_SPVEC_SATNAME_1_8, MAX_DESIGNATOR_LENGTH)
+
+    @property
+    def epochs(self) -> Array[c_double]:
+        """UTC epoch of every record as days since 1950"""
+        return self.get_column(XA_SPVEC_EPOCH)
+
+    @property
+    def positions(self) -> Array[Array[c_double]]:
+        """``(N, 3)`` positions in :math:`km`"""
+        return self.get_columns(XA_SPVEC_POS1, 3)
+
+    @property
+    def velocities(self) -> Array[Array[c_double]]:
+        r"""``(N, 3)`` velocities in :math:`\frac{km}{s}`"""
+        velocities = self.get_columns(XA_SPVEC_VEL1, 3)
+        for velocity in velocities:
+            velocity[0] *= METERS_TO_KILOMETERS
+            velocity[1] *= METERS_TO_KILOMETERS
+            velocity[2] *= METERS_TO_KILOMETERS
+        return velocities
+
+    @property
+    def b_terms(self) -> Array[c_double]:
+        r"""Ballistic coefficient of every record in :math:`\frac{m^2}{kg}`"""
+        return self.get_column(XA_SPVEC_BTERM)
+
+    @property
+    def agoms(self) -> Array[c_double]:
+        r"""Solar radiation pressure coefficient of every record in :math:`\frac{m^2}{kg}`"""
+        return self.get_column(XA_SPVEC_AGOM)
@@ -1,12 +1,25 @@
-from ctypes import Array, c_char, c_double, c_longlong
+from collections import deque
+from ctypes import Array, c_char, c_double, c_int, c_longlong
 from pathlib import Path
+from threading import Thread, current_thread
+from typing import Callable, Optional, Sequence
+from weakref import finalize
 
 from pysaal.elements._cartesian_elements import CartesianElements
+from pysaal.elements._impulsive_maneuver import ImpulsiveManeuver
 from pysaal.elements._lla import LLA
 from pysaal.elements._propagated_tle import PropagatedTLE
-from pysaal.enums import Classification, PySAALKeyErrorCode, SGP4EpochType, SGP4ErrorCode, TLEType
+from pysaal.enums import (
+    Classification,
+    PySAALKeyErrorCode,
+    SGP4EphemerisType,
+    SGP4EpochType,
+    SGP4ErrorCode,
+    TLEType,
+)
 from pysaal.exceptions import PySAALError
 from pysaal.lib import DLLs
+from pysaal.lib._main_dll import IDX_ORDER_READ
 from pysaal.lib._tle import (
     XA_TLE_AGOMGP,
     XA_TLE_BSTAR,
@@ -32,13 +45,50 @@ from pysaal.lib._tle import (
     XS_TLE_SECCLASS_0_1,
     XS_TLE_SIZE,
 )
-from pysaal.math.constants import B_STAR_TO_B_TERM_COEFFICIENT
+from pysaal.math.constants import B_STAR_TO_B_TERM_COEFFICIENT, MINUTES_IN_DAY
 from pysaal.math.linalg import Vector3D
-from pysaal.time import Epoch
+from pysaal.time import Epoch, TimeSpan
+
+
+#: Keys of garbage-collected TLEs waiting to be removed by :attr:`TLE.library_owner`
+_PENDING_REMOVALS: deque = deque()
+
+
+def _remove_key(key: int) -> None:
+    """Remove a key from the TLE and SGP4 trees of the library"""
+    TLE._finalizers.pop(key, None)
+    DLLs.tle.TleRemoveSat(key)
+    DLLs.sgp4_prop.Sgp4RemoveSat(key)
+
+
+def _discard_pending_key(key: int) -> bool:
+    """Take a key off the removal queue, returning True if it was queued"""
+    try:
+        _PENDING_REMOVALS.remove(key)
+    except ValueError:
+        return False
+    return True
+
+
+def _release_key(key: int) -> None:
+    """Remove the key of a garbage-collected TLE, or queue it if another thread owns the library"""
+    owner = TLE.library_owner
+    if owner is not None and owner is not current_thread():
+        TLE._finalizers.pop(key, None)
+        _PENDING_REMOVALS.append(key)
+        notify = TLE.pending_removal_callback
+        if notify is not None and len(_PENDING_REMOVALS) == 1:
+            notify()
+    else:
+        _remove_key(key)
 
 
 class TLE:
-    """Class for Two-Line Element Sets (TLEs)."""
+    """Class for Two-Line Element Sets (TLEs).
+
+    A TLE loaded with :meth:`load` owns its key, and the key is removed from memory when the TLE is garbage
+    collected.  TLEs created with :meth:`from_key` or by indexing a catalog only reference a key owned elsewhere.
+    """
 
     #: Numbers above this value will not parse in accordance with the alpha-5 format.
     MAX_SATELLITE_ID = 339999
@@ -46,6 +96,17 @@ class TLE:
     #: Designators longer than this will not fit entirely in the allocated space for a TLE.
     MAX_DESIGNATOR_LENGTH = 8
 
+    #: Finalizers of the keys owned by live TLE objects
+    _finalizers: dict[int, finalize] = {}
+
+    #: Thread that owns the library, such as the thread of a :class:`DLLExecutor`.  While set, keys of TLEs that are
+    #: garbage collected on other threads are queued for :meth:`remove_pending_keys` instead of being removed.
+    library_owner: Optional[Thread] = None
+
+    #: Called when the first key is queued for :attr:`library_owner`, so the owner can call
+    #: :meth:`remove_pending_keys`.  It runs inside finalizers and must not block or acquire locks.
+    pending_removal_callback: Optional[Callable[[], None]] = None
+
     def __init__(self):
 
         self.c_double_array, self.c_char_array = TLE.get_null_pointers()
@@ -59,6 +120,9 @@ class TLE:
         #: The name associated with the TLE
         self.name = self.designator
 
+        self._catalog_keys: Optional[Array[c_longlong]] = None
+        self._catalog_index = 0
+
     @classmethod
     def from_lines(cls, line_1: str, line_2: str) -> "TLE":
         """Create a TLE object from two TLE lines.
@@ -139,14 +203,84 @@ class TLE:
     @staticmethod
     def destroy_all() -> None:
         """Remove all TLEs from memory"""
+        for tracker in TLE._finalizers.values():
+            tracker.detach()
+        TLE._finalizers.clear()
+        _PENDING_REMOVALS.clear()
         DLLs.tle.TleRemoveAllSats()
         DLLs.sgp4_prop.Sgp4RemoveAllSats()
 
+    @staticmethod
+    def remove_key(key: int) -> None:
+        """Remove a single TLE from memory
+
+        :param key: The key associated with the TLE in memory
+
+        .. note::
+
+            If the key is owned by a TLE object, the object no longer removes it when garbage collected.
+        """
+        tracker = TLE._finalizers.pop(key, None)
+        if tracker is not None:
+            tracker.detach()
+        _discard_pending_key(key)
+        _remove_key(key)
+
+    @staticmethod
+    def remove_pending_keys() -> int:
+        """Remove the keys of garbage-collected TLEs that were queued for :attr:`library_owner`
+
+        :return: The number of keys removed
+
+        .. note::
+
+            This must only be called by the thread that owns the library.
+        """
+        count = 0
+        while _PENDING_REMOVALS:
+            _remove_key(_PENDING_REMOVALS.popleft())
+            count += 1
+        return count
+
     @staticmethod
     def get_number_in_memory() -> int:
         """Get the number of TLEs in memory"""
         return DLLs.tle.TleGetCount()
 
+    @staticmethod
+    def get_memory_usage() -> dict[str, int]:
+        """Report how many satellites are held by the library
+
+        :return: The number of TLEs in memory (``"tle"``), the number initialized for SGP4 propagation (``"sgp4"``)
+            and the number owned by live TLE objects that are removed automatically (``"tracked"``)
+        """
+        return {
+            "tle": DLLs.tle.TleGetCount(),
+            "sgp4": DLLs.sgp4_prop.Sgp4GetCount(),
+            "tracked": len(TLE._finalizers),
+        }
+
+    @staticmethod
+    def get_unused_satellite_ids(count: int) -> list[int]:
+        """Get satellite IDs that are not used by any TLE in memory, counting down from :attr:`MAX_SATELLITE_ID`
+
+        :param count: The number of IDs to return
+        :raises PySAALError: If there are not enough unused IDs
+
+        .. note::
+
+            These IDs are intended for temporary element sets that are loaded immediately and removed after use.
+        """
+        satellite_ids: list[int] = []
+        satellite_id = TLE.MAX_SATELLITE_ID
+        while len(satellite_ids) < count:
+            if satellite_id <= 0:
+                raise PySAALError
+            if DLLs.tle.TleGetSatKey(satellite_id) <= 0:
+                satellite_ids.append(satellite_id)
+            satellite_id -= 1
+        return satellite_ids
+
     @property
     def state(self) -> PropagatedTLE:
         """Full orbit state at the current epoch.  See :ref:`propagated_tle` for details."""
@@ -209,24 +343,56 @@ class TLE:
         return (pri_state.position - sec_state.position).magnitude
 
     def destroy(self) -> None:
-        """Remove the TLE from memory"""
+        """Remove the TLE from memory
+
+        .. note::
+
+            If the TLE is a view of a catalog row, the key is also cleared from :attr:`TLECatalog.keys`.  The key is
+            left in memory if the catalog no longer holds it in that row.
+        """
         if self.loaded and self.key is not None:
-            DLLs.tle.TleRemoveSat(self.key)
-            DLLs.sgp4_prop.Sgp4RemoveSat(self.key)
+            if self._catalog_keys is None:
+                TLE.remove_key(self.key)
+            elif self._catalog_keys[self._catalog_index] == self.key:
+                TLE.remove_key(self.key)
+                self._catalog_keys[self._catalog_index] = 0
             self.key = None
             self.loaded = False
 
     def load(self) -> None:
-        """Load the TLE into memory"""
+        """Load the TLE into memory
+
+        .. note::
+
+            The TLE owns the new key and removes it from memory when it is garbage collected.  Call :meth:`destroy`
+            to release it earlier.  If a garbage-collected TLE with the same :attr:`sat_key` is still queued for
+            :attr:`library_owner`, its key is removed first.
+        """
         if not self.loaded:
+            self._remove_pending_sat_key()
             key = DLLs.tle.TleAddSatFrArray(self.c_double_array, self.c_char_array)
             if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
                 raise PySAALError
             status = DLLs.sgp4_prop.Sgp4InitSat(key)
             if status != SGP4ErrorCode.NONE.value:
+                _remove_key(key)
                 raise PySAALError
             self.key = key
             self.loaded = True
+            self._track_key()
+
+    def _remove_pending_sat_key(self) -> None:
+        """Remove the key of a garbage-collected copy of this element set that is still queued for removal"""
+        if _PENDING_REMOVALS:
+            sat_key = self.sat_key
+            if _discard_pending_key(sat_key):
+                _remove_key(sat_key)
+
+    def _track_key(self) -> None:
+        """Remove the key of the TLE from memory once the TLE is garbage collected"""
+        tracker = finalize(self, _release_key, self.key)
+        tracker.atexit = False
+        TLE._finalizers[self.key] = tracker
 
     def get_state_at_epoch(self, epoch: Epoch) -> PropagatedTLE:
         """Get the full orbit state at a given epoch
@@ -248,11 +414,121 @@ class TLE:
             raise PySAALError
         return PropagatedTLE.from_c_array(xa_sgp4_out)
 
+    async def aget_state_at_epoch(self, epoch: Epoch) -> PropagatedTLE:
+        """Get the full orbit state at a given epoch without blocking the event loop
+
+        :param epoch: The epoch at which to calculate the state
+        :raises PySAALError: If there is an error during propagation
+
+        .. note::
+
+            The request is sent to the library-owner thread by :meth:`AsyncPropagator.get_default`, which coalesces
+            concurrent requests for the same TLE and epoch.
+        """
+        from pysaal.concurrency import AsyncPropagator
+
+        return await AsyncPropagator.get_default().get_state_at_epoch(self, epoch)
+
+    def get_ephemeris(
+        self, span: TimeSpan, step: float, ephemeris_type: SGP4EphemerisType = SGP4EphemerisType.TEME
+    ) -> Array[Array[c_double]]:
+        r"""Generate an ephemeris over a time span with a fixed step in a single library call
+
+        :param span: The time span covered by the ephemeris
+        :param step: The step between ephemeris points in :math:`minutes`
+        :param ephemeris_type: The inertial frame of the ephemeris
+        :raises PySAALError: If there is an error during propagation
+        :return: ``(M, 7)`` rows of UTC epoch as days since 1950, position in :math:`km` and velocity in
+            :math:`\frac{km}{s}`
+        """
+        if not self.loaded:
+            self.load()
+        size = int(span.minutes // step) + 2
+        ephemeris = ((c_double * 7) * size)()
+        count = c_int()
+        error = DLLs.sgp4_prop.Sgp4GenEphems(
+            self.key, span.start.utc_ds50, span.end.utc_ds50, step, ephemeris_type.value, size, ephemeris, count
+        )
+        if error:
+            raise PySAALError
+        return ((c_double * 7) * count.value).from_buffer(ephemeris)
+
+    def reepoch(self, epoch: Epoch) -> "TLE":
+        """Get a new TLE whose epoch is moved to the given epoch with SGP4
+
+        :param epoch: The epoch of the new TLE
+        :raises PySAALError: If the library is unable to reepoch the TLE
+
+        .. note::
+
+            The TLE is loaded into memory if it is not already.  The returned TLE is not loaded.
+        """
+        if not self.loaded:
+            self.load()
+        line_1 = (c_char * XS_TLE_SIZE)()
+        line_2 = (c_char * XS_TLE_SIZE)()
+        status = DLLs.sgp4_prop.Sgp4ReepochTLE(self.key, epoch.utc_ds50, line_1, line_2)
+        if status:
+            raise PySAALError
+        return TLE.from_lines(line_1.value.decode().strip(), line_2.value.decode().strip())
+
+    def reepoch_csv(self, epoch: Epoch) -> str:
+        """Get the CSV representation of the TLE moved to the given epoch with SGP4
+
+        :param epoch: The epoch of the new element set
+        :raises PySAALError: If the library is unable to reepoch the TLE
+        """
+        if not self.loaded:
+            self.load()
+        csv_line = (c_char * XS_TLE_SIZE)()
+        status = DLLs.sgp4_prop.Sgp4ReepochCsv(self.key, epoch.utc_ds50, csv_line)
+        if status:
+            raise PySAALError
+        return csv_line.value.decode().strip()
+
+    def add_maneuvers(self, maneuvers: Sequence[ImpulsiveManeuver]) -> None:
+        """Attach impulsive maneuvers to an SP element set
+
+        :param maneuvers: The maneuvers to add
+        :raises ValueError: If the TLE is not an SP element set
+        :raises PySAALError: If the library is unable to load the TLE or rejects a maneuver
+
+        .. note::
+
+            SGP4 ignores maneuvers, so only SP element sets accept them.  The TLE is added to memory without SGP4
+            initialization if it is not already loaded.  See :class:`ManeuverPlanner` to evaluate maneuvers with SGP4.
+        """
+        if self.ephemeris_type != TLEType.SP:
+            raise ValueError("Maneuvers can only be added to SP element sets.")
+        if not self.loaded:
+            self._remove_pending_sat_key()
+            key = DLLs.tle.TleAddSatFrArray(self.c_double_array, self.c_char_array)
+            if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
+                raise PySAALError
+            self.key = key
+            self.loaded = True
+            self._track_key()
+        for maneuver in maneuvers:
+            maneuver.add_to_key(self.key)
+
+    def get_decay_epoch(self, f10_average: float) -> Epoch:
+        """Estimate the epoch at which the satellite decays
+
+        :param f10_average: The average F10.7 solar flux in :math:`SFU`
+        :raises PySAALError: If the library is unable to estimate a decay time
+        """
+        if not self.loaded:
+            self.load()
+        decay_ds50 = c_double()
+        if DLLs.el_ops.FindSatDecayTime(self.key, f10_average, decay_ds50):
+            raise PySAALError
+        return Epoch(decay_ds50.value)
+
     @staticmethod
     def get_loaded_keys() -> Array[c_longlong]:
-        """Get the keys of all TLEs in memory"""
+        """Get the keys of all TLEs in memory in the order they were loaded"""
         keys = (c_longlong * TLE.get_number_in_memory())()
-        DLLs.tle.TleGetLoaded(9, keys)
+        DLLs.tle.TleGetLoaded(IDX_ORDER_READ, keys)
         return keys
 
     @property
@@ -433,6 +709,28 @@ class TLE:
         self.c_double_array[XA_TLE_MNMOTN] = value
         self.update()
 
+    @property
+    def sat_key(self) -> int:
+        """Key that the library assigns to this element set, whether or not it is loaded
+
+        .. note::
+
+            The library identifies an element set by its satellite ID, epoch and ephemeris type, so TLEs that only
+            differ in other fields share a key and cannot be loaded at the same time.
+        """
+        year = c_int()
+        days = c_double()
+        DLLs.time_func.UTCToYrDays(self.c_double_array[XA_TLE_EPOCH], year, days)
+        ephemeris_type = int(self.c_double_array[XA_TLE_EPHTYPE])
+        return DLLs.tle.TleFieldsToSatKey(self.satellite_id, year.value, days.value, ephemeris_type)
+
+    @property
+    def is_geo(self) -> bool:
+        """Flag indicating if the library classifies the orbit as geosynchronous (False if the mean motion is unset)"""
+        if self.mean_motion <= 0:
+            return False
+        return bool(DLLs.el_ops.IsGeoOrbit(self.inclination, MINUTES_IN_DAY / self.mean_motion))
+
     @property
     def revolution_number(self) -> int:
         """Revolution number"""
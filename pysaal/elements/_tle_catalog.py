@@ -0,0 +1,259 @@
+from ctypes import Array, c_char, c_double
+from pathlib import Path
+from typing import Optional, Sequence
+
+from pysaal.elements._element_catalog import _ElementCatalog
+from pysaal.elements._tle import TLE
+from pysaal.elements._tle_validator import TLEValidator
+from pysaal.elements._tle_writer import TLEWriter
+from pysaal.enums import PySAALKeyErrorCode, SGP4ErrorCode, TLEFormat
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._tle import (
+    XA_TLE_ECCEN,
+    XA_TLE_EPOCH,
+    XA_TLE_INCLI,
+    XA_TLE_MNANOM,
+    XA_TLE_MNMOTN,
+    XA_TLE_NODE,
+    XA_TLE_OMEGA,
+    XA_TLE_SATNUM,
+    XA_TLE_SIZE,
+    XS_TLE_SATNAME_1_12,
+    XS_TLE_SIZE,
+)
+from pysaal.time import Epoch
+
+
+class TLECatalog(_ElementCatalog):
+    """Collection of TLEs stored in contiguous XA_TLE/XS_TLE records.
+
+    Indexing returns a :class:`TLE` whose arrays are views into the catalog rows, so edits made through the TLE are
+    visible in the catalog columns without copying.
+
+    :example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+
+        from pysaal.elements import TLECatalog
+        from pysaal.time import Epoch
+
+        with TLECatalog.from_file(Path("catalog.tle")) as catalog:
+            midnight = catalog.reepoch(Epoch.from_components(2024, 12, 6, 0, 0, 0.0))
+        midnight.write(Path("catalog_0000z.tle"))
+
+    .. note::
+
+        Keys loaded by a catalog are owned by the catalog rather than the TLEs returned by indexing.  Use the catalog
+        as a context manager or call :meth:`destroy` to remove them from memory.  Calling :meth:`TLE.destroy` on an
+        indexed TLE removes that single record and clears it from :attr:`keys`.
+    """
+
+    NUMERIC_SIZE = XA_TLE_SIZE
+    TEXT_SIZE = XS_TLE_SIZE
+
+    def __getitem__(self, index: int) -> TLE:
+        if index < 0:
+            index += len(self)
+        tle = TLE()
+        tle.c_double_array = self.c_double_block[index]
+        tle.c_char_array = self.c_char_block[index]
+        tle.name = tle.designator
+        if self.keys[index]:
+            tle.key = self.keys[index]
+            tle.loaded = True
+            tle._catalog_keys = self.keys
+            tle._catalog_index = index
+        return tle
+
+    @classmethod
+    def from_file(cls, file_path: Path, validator: Optional[TLEValidator] = None) -> "TLECatalog":
+        """Load every TLE in a file and retrieve the records into a catalog
+
+        :param file_path: The path to the file of TLEs
+        :param validator: If provided, the lines are checked before parsing and invalid TLEs are dropped
+        :raises PySAALError: If the library is unable to load the file or initialize a TLE for propagation
+
+        .. note::
+
+            The TLEs remain loaded in memory and are referenced by :attr:`keys`.  If any TLE cannot be initialized,
+            every TLE loaded from the file is removed before raising.
+        """
+        if validator is not None:
+            catalog = cls.from_lines(TLEValidator.read_lines(file_path), validator)
+            catalog.load()
+            return catalog
+        keys_before = set(TLE.get_loaded_keys())
+        status = DLLs.tle.TleLoadFile(file_path.as_posix().encode())
+        if status:
+            raise PySAALError
+        new_keys = [key for key in TLE.get_loaded_keys() if key not in keys_before]
+        catalog = cls(len(new_keys))
+        for i, key in enumerate(new_keys):
+            status = DLLs.tle.TleDataToArray(key, catalog.c_double_block[i], catalog.c_char_block[i])
+            if status or DLLs.sgp4_prop.Sgp4InitSat(key) != SGP4ErrorCode.NONE.value:
+                for new_key in new_keys:
+                    TLE.remove_key(new_key)
+                raise PySAALError
+            catalog.keys[i] = key
+        return catalog
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[tuple[str, str]], validator: Optional[TLEValidator] = None) -> "TLECatalog":
+        """Parse pairs of TLE lines into a catalog
+
+        :param lines: The first and second line of each TLE
+        :param validator: If provided, invalid TLEs are dropped instead of being passed to the library
+        :raises PySAALError: If the library is unable to parse one of the TLEs
+        """
+        if validator is not None:
+            lines = list(validator.filter(lines))
+        catalog = cls(len(lines))
+        for i, (line_1, line_2) in enumerate(lines):
+            status = DLLs.tle.TleLinesToArray(
+                line_1.encode(), line_2.encode(), catalog.c_double_block[i], catalog.c_char_block[i]
+            )
+            if status:
+                raise PySAALError
+        return catalog
+
+    @classmethod
+    def from_tles(cls, tles: Sequence[TLE]) -> "TLECatalog":
+        """Copy existing TLE objects into a catalog
+
+        :param tles: The TLEs to copy
+        """
+        catalog = cls(len(tles))
+        for i, tle in enumerate(tles):
+            catalog.c_double_block[i][:] = tle.c_double_array[:]
+            catalog.c_char_block[i].raw = tle.c_char_array.raw
+        return catalog
+
+    def load_record(self, index: int) -> int:
+        """Load a single record into memory and initialize it for propagation if it is not already loaded
+
+        :param index: The index of the record
+        :raises PySAALError: If the library is unable to load or initialize the record
+        :return: The key of the record
+        """
+        if not self.keys[index]:
+            key = DLLs.tle.TleAddSatFrArray(self.c_double_block[index], self.c_char_block[index])
+            if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
+                raise PySAALError
+            if DLLs.sgp4_prop.Sgp4InitSat(key) != SGP4ErrorCode.NONE.value:
+                TLE.remove_key(key)
+                raise PySAALError
+            self.keys[index] = key
+        return self.keys[index]
+
+    def load(self) -> None:
+        """Load every record that is not already in memory and initialize it for propagation"""
+        for i in range(len(self)):
+            self.load_record(i)
+
+    def destroy(self) -> None:
+        """Remove every loaded record of the catalog from memory"""
+        for i in range(len(self)):
+            if self.keys[i]:
+                TLE.remove_key(self.keys[i])
+                self.keys[i] = 0
+
+    def write(self, file_path: Path, tle_format: TLEFormat = TLEFormat.TWO_LINE) -> None:
+        """Write the catalog to a file of TLEs
+
+        :param file_path: The path of the file to write
+        :param tle_format: The format of the records.  See :ref:`tle_format` for options.
+
+        .. note::
+
+            The lines are generated by the library into a single pair of reused line buffers.  See
+            :class:`TLEWriter` to stream to a file-like object.
+        """
+        TLEWriter(tle_format).write(self, file_path)
+
+    def reepoch(self, epoch: Epoch) -> "TLECatalog":
+        """Move every TLE in the catalog to a common epoch with SGP4
+
+        :param epoch: The epoch of the new TLEs
+        :raises PySAALError: If the library is unable to reepoch or parse one of the TLEs
+        :return: A new catalog that is not loaded into memory
+
+        .. note::
+
+            Records that are not already in memory are loaded first.  Each reepoched TLE is written by the library
+            into a pair of reused line buffers and parsed directly into the rows of the new catalog.
+        """
+        self.load()
+        result = TLECatalog(len(self))
+        line_1 = (c_char * XS_TLE_SIZE)()
+        line_2 = (c_char * XS_TLE_SIZE)()
+        utc_ds50 = epoch.utc_ds50
+        for key, xa_tle, xs_tle in zip(self.keys, result.c_double_block, result.c_char_block):
+            if DLLs.sgp4_prop.Sgp4ReepochTLE(key, utc_ds50, line_1, line_2):
+                raise PySAALError
+            if DLLs.tle.TleLinesToArray(line_1.value, line_2.value, xa_tle, xs_tle):
+                raise PySAALError
+        return result
+
+    async def apropagate(self, epochs: Sequence[Epoch]) -> list[Array[Array[c_double]]]:
+        r"""Propagate every TLE in the catalog to several epochs without blocking the event loop
+
+        :param epochs: The output epochs
+        :raises PySAALError: If there is an error during propagation
+        :return: ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}` for every record
+
+        .. note::
+
+            The records are copied and propagated by the library-owner thread of
+            :meth:`AsyncPropagator.get_default`, so the keys of the catalog are not used.
+        """
+        from pysaal.concurrency import AsyncPropagator
+
+        return await AsyncPropagator.get_default().propagate_catalog(self, epochs)
+
+    @property
+    def satellite_ids(self) -> list[int]:
+        """Satellite ID of every record"""
+        return [int(satellite_id) for satellite_id in self.get_column(XA_TLE_SATNUM)]
+
+    @property
+    def designators(self) -> list[str]:
+        """8-character designator of every record"""
+        return self.get_text_column(XS_TLE_SATNAME_1_12, TLE.MAX_DESIGNATOR_LENGTH)
+
+    @property
+    def epochs(self) -> Array[c_double]:
+        """UTC epoch of every record as days since 1950"""
+        return self.get_column(XA_TLE_EPOCH)
+
+    @property
+    def inclinations(self) -> Array[c_double]:
+        """Inclination of every record in :math:`degrees`"""
+        return self.get_column(XA_TLE_INCLI)
+
+    @property
+    def raans(self) -> Array[c_double]:
+        """Right ascension of the ascending node of every record in :math:`degrees`"""
+        return self.get_column(XA_TLE_NODE)
+
+    @property
+    def eccentricities(self) -> Array[c_double]:
+        """Eccentricity of every record (unitless)"""
+        return self.get_column(XA_TLE_ECCEN)
+
+    @property
+    def arguments_of_perigee(self) -> Array[c_double]:
+        """Argument of perigee of every record in :math:`degrees`"""
+        return self.get_column(XA_TLE_OMEGA)
+
+    @property
+    def mean_anomalies(self) -> Array[c_double]:
+        """Mean anomaly of every record in :math:`degrees`"""
+        return self.get_column(XA_TLE_MNANOM)
+
+    @property
+    def mean_motions(self) -> Array[c_double]:
+        r"""Mean motion of every record in :math:`\frac{rev}{day}`"""
+        return self.get_column(XA_TLE_MNMOTN)
@@ -0,0 +1,144 @@
+from array import array
+from bisect import bisect_right
+from ctypes import Array, c_double
+from pathlib import Path
+from typing import Optional, Sequence
+
+from pysaal.elements._tle import TLE
+from pysaal.elements._tle_catalog import TLECatalog
+from pysaal.elements._tle_validator import TLEValidator
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.time import Epoch
+
+
+class TLEHistory:
+    """Element-set history of many satellites indexed by satellite ID and epoch.
+
+    Every element set is kept in a single :class:`TLECatalog`.  For each satellite, the epochs are stored in a sorted
+    ``array('d')`` alongside an ``array('q')`` of catalog rows, so the set in effect at a time is found by binary
+    search instead of a scan.  Records are only loaded into memory when they are first used for propagation.
+
+    :example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+
+        from pysaal.elements import TLEHistory
+        from pysaal.time import Epoch
+
+        history = TLEHistory.from_file(Path("history.tle"))
+        tle = history.get_tle(25544, Epoch.from_components(2020, 1, 1, 0, 0, 0.0))
+        states = history.get_states(25544, [Epoch.from_components(year, 1, 1, 0, 0, 0.0) for year in range(2020, 2025)])
+    """
+
+    def __init__(self, catalog: TLECatalog):
+
+        #: Every element set of the history
+        self.catalog = catalog
+
+        rows_by_satellite: dict[int, list[tuple[float, int]]] = {}
+        for row, (satellite_id, utc_ds50) in enumerate(zip(catalog.satellite_ids, catalog.epochs)):
+            rows_by_satellite.setdefault(satellite_id, []).append((utc_ds50, row))
+
+        self._epochs: dict[int, array] = {}
+        self._rows: dict[int, array] = {}
+        for satellite_id, records in rows_by_satellite.items():
+            records.sort()
+            self._epochs[satellite_id] = array("d", [utc_ds50 for utc_ds50, _ in records])
+            self._rows[satellite_id] = array("q", [row for _, row in records])
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def __contains__(self, satellite_id: int) -> bool:
+        return satellite_id in self._epochs
+
+    @classmethod
+    def from_file(cls, file_path: Path, validator: Optional[TLEValidator] = None) -> "TLEHistory":
+        """Build a history from a 2LE or 3LE file that may hold many element sets per satellite
+
+        :param file_path: The path to the file of TLEs
+        :param validator: If provided, invalid TLEs are dropped before parsing
+        :raises PySAALError: If the library is unable to parse one of the TLEs
+        """
+        return cls(TLECatalog.from_lines(TLEValidator.read_lines(file_path), validator))
+
+    @classmethod
+    def from_tles(cls, tles: Sequence[TLE]) -> "TLEHistory":
+        """Build a history from existing TLE objects
+
+        :param tles: The element sets in any order
+        """
+        return cls(TLECatalog.from_tles(tles))
+
+    @property
+    def satellite_ids(self) -> list[int]:
+        """Satellite ID of every satellite in the history"""
+        return list(self._epochs)
+
+    def get_epochs(self, satellite_id: int) -> array:
+        """Get the sorted UTC epochs of the element sets of a satellite as days since 1950
+
+        :param satellite_id: The satellite ID
+        :raises KeyError: If the satellite is not in the history
+        """
+        return self._epochs[satellite_id]
+
+    def get_history(self, satellite_id: int) -> list[TLE]:
+        """Get every element set of a satellite in epoch order
+
+        :param satellite_id: The satellite ID
+        :raises KeyError: If the satellite is not in the history
+        """
+        return [self.catalog[row] for row in self._rows[satellite_id]]
+
+    def get_index(self, satellite_id: int, epoch: Epoch) -> int:
+        """Get the catalog row of the element set in effect at a time
+
+        :param satellite_id: The satellite ID
+        :param epoch: The time of interest
+        :raises KeyError: If the satellite is not in the history
+        :raises ValueError: If the time precedes the first element set of the satellite
+        :return: The row of the latest element set with an epoch at or before the time
+        """
+        position = bisect_right(self._epochs[satellite_id], epoch.utc_ds50) - 1
+        if position < 0:
+            raise ValueError(f"No element set of satellite {satellite_id} is in effect at {epoch.dtg_20}.")
+        return self._rows[satellite_id][position]
+
+    def get_tle(self, satellite_id: int, epoch: Epoch) -> TLE:
+        """Get the element set in effect at a time
+
+        :param satellite_id: The satellite ID
+        :param epoch: The time of interest
+        :raises KeyError: If the satellite is not in the history
+        :raises ValueError: If the time precedes the first element set of the satellite
+        """
+        return self.catalog[self.get_index(satellite_id, epoch)]
+
+    def get_states(self, satellite_id: int, epochs: Sequence[Epoch]) -> Array[Array[c_double]]:
+        r"""Propagate each time from the element set in effect at that time
+
+        :param satellite_id: The satellite ID
+        :param epochs: The times of interest
+        :raises KeyError: If the satellite is not in the history
+        :raises ValueError: If a time precedes the first element set of the satellite
+        :raises PySAALError: If there is an error during propagation
+        :return: ``(N, 6)`` TEME states in :math:`km` and :math:`\frac{km}{s}`
+        """
+        states = ((c_double * 6) * len(epochs))()
+        position = (c_double * 3)()
+        velocity = (c_double * 3)()
+        for epoch, state in zip(epochs, states):
+            key = self.catalog.load_record(self.get_index(satellite_id, epoch))
+            if DLLs.sgp4_prop.Sgp4PropDs50UtcPosVel(key, epoch.utc_ds50, position, velocity):
+                raise PySAALError
+            state[:3] = position[:]
+            state[3:] = velocity[:]
+        return states
+
+    def destroy(self) -> None:
+        """Remove every element set of the history that was loaded for propagation from memory"""
+        self.catalog.destroy()
@@ -0,0 +1,173 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pysaal.enums import TLEValidationCode
+
+#: Columns and valid closed range of each angle on line 2
+_ANGLE_FIELDS = [
+    (slice(8, 16), 0.0, 180.0, TLEValidationCode.INCLINATION),
+    (slice(17, 25), 0.0, 360.0, TLEValidationCode.RAAN),
+    (slice(34, 42), 0.0, 360.0, TLEValidationCode.ARGUMENT_OF_PERIGEE),
+    (slice(43, 51), 0.0, 360.0, TLEValidationCode.MEAN_ANOMALY),
+]
+
+
+class TLEValidator:
+    """Batch validator for TLE lines that runs before anything is passed to the library.
+
+    Each pair of lines is checked for length, line numbers, satellite number agreement, checksums and the ranges of
+    the epoch and orbital elements using only fixed-column string slicing, so corrupt records can be counted or dropped
+    without a call to ``TleLinesToArray``.
+
+    .. note::
+
+        Lines generated by the library are 68 characters long and do not carry a checksum, so the checksum is only
+        compared when the 69th character is present unless ``require_checksum`` is set.
+
+    :example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+
+        from pysaal.elements import TLECatalog, TLEValidator
+
+        validator = TLEValidator()
+        lines, mask, codes = validator.validate_file(Path("vendor.tle"))
+        print(f"{mask.count(False)} corrupt records")
+
+        catalog = TLECatalog.from_file(Path("vendor.tle"), validator)
+    """
+
+    #: Length of a TLE line without its checksum
+    LINE_LENGTH = 68
+
+    def __init__(self, require_checksum: bool = False):
+
+        #: Flag indicating if lines without a checksum are rejected
+        self.require_checksum = require_checksum
+
+    @staticmethod
+    def get_checksum(line: str) -> int:
+        """Compute the modulo-10 checksum of the first 68 characters of a line
+
+        :param line: The TLE line
+        :return: The sum of the digits, with each minus sign counted as 1, modulo 10
+        """
+        total = 0
+        for character in line[: TLEValidator.LINE_LENGTH]:
+            if character.isdigit():
+                total += ord(character) - 48
+            elif character == "-":
+                total += 1
+        return total % 10
+
+    def _get_line_error(self, line: str, line_number: str) -> TLEValidationCode:
+        if not TLEValidator.LINE_LENGTH <= len(line) <= TLEValidator.LINE_LENGTH + 1:
+            return TLEValidationCode.LINE_LENGTH
+        if line[0] != line_number or line[1] != " ":
+            return TLEValidationCode.LINE_NUMBER
+        if len(line) > TLEValidator.LINE_LENGTH:
+            checksum = line[TLEValidator.LINE_LENGTH]
+            if not checksum.isdigit() or int(checksum) != TLEValidator.get_checksum(line):
+                return TLEValidationCode.CHECKSUM
+        elif self.require_checksum:
+            return TLEValidationCode.CHECKSUM
+        return TLEValidationCode.VALID
+
+    def get_error_code(self, line_1: str, line_2: str) -> TLEValidationCode:
+        """Check a single pair of TLE lines
+
+        :param line_1: The first line of the TLE
+        :param line_2: The second line of the TLE
+        :return: The first failed check, or :attr:`TLEValidationCode.VALID`
+        """
+        line_1 = line_1.rstrip()
+        line_2 = line_2.rstrip()
+        for line, line_number in ((line_1, "1"), (line_2, "2")):
+            code = self._get_line_error(line, line_number)
+            if code != TLEValidationCode.VALID:
+                return code
+
+        if line_1[2:7] != line_2[2:7]:
+            return TLEValidationCode.SATELLITE_ID_MISMATCH
+
+        try:
+            day = float(line_1[20:32])
+            int(line_1[18:20])
+        except ValueError:
+            return TLEValidationCode.EPOCH
+        if not 1.0 <= day < 367.0:
+            return TLEValidationCode.EPOCH
+
+        for columns, lower, upper, code in _ANGLE_FIELDS:
+            try:
+                angle = float(line_2[columns])
+            except ValueError:
+                return code
+            if not lower <= angle <= upper:
+                return code
+
+        if not line_2[26:33].strip().isdigit():
+            return TLEValidationCode.ECCENTRICITY
+
+        try:
+            mean_motion = float(line_2[52:63])
+        except ValueError:
+            return TLEValidationCode.MEAN_MOTION
+        if mean_motion <= 0:
+            return TLEValidationCode.MEAN_MOTION
+
+        return TLEValidationCode.VALID
+
+    def validate(self, lines: Iterable[tuple[str, str]]) -> tuple[list[bool], list[TLEValidationCode]]:
+        """Check many pairs of TLE lines
+
+        :param lines: The first and second line of each TLE
+        :return: A mask that is ``True`` for every valid TLE and the error code of every TLE
+        """
+        codes = [self.get_error_code(line_1, line_2) for line_1, line_2 in lines]
+        return [code == TLEValidationCode.VALID for code in codes], codes
+
+    def filter(self, lines: Iterable[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+        """Yield only the valid pairs of TLE lines
+
+        :param lines: The first and second line of each TLE
+        """
+        for line_1, line_2 in lines:
+            if self.get_error_code(line_1, line_2) == TLEValidationCode.VALID:
+                yield line_1, line_2
+
+    @staticmethod
+    def read_lines(file_path: Path) -> list[tuple[str, str]]:
+        """Read the line pairs of a 2LE or 3LE file without parsing them
+
+        :param file_path: The path to the file of TLEs
+        :return: Every line that starts with ``1`` paired with the line that follows it
+
+        .. note::
+
+            Blank lines, name lines and lines that are not preceded by a line 1 are skipped.  A line 1 that is the
+            last line of the file is paired with an empty line 2 so that it is reported as invalid.
+        """
+        with open(file_path, "r", errors="replace") as f:
+            rows = [row.rstrip("\r\n") for row in f]
+        pairs = []
+        i = 0
+        while i < len(rows):
+            if rows[i].startswith("1"):
+                pairs.append((rows[i], rows[i + 1] if i + 1 < len(rows) else ""))
+                i += 2
+            else:
+                i += 1
+        return pairs
+
+    def validate_file(self, file_path: Path) -> tuple[list[tuple[str, str]], list[bool], list[TLEValidationCode]]:
+        """Check every TLE in a 2LE or 3LE file before it is parsed
+
+        :param file_path: The path to the file of TLEs
+        :return: The line pairs read from the file, the validity mask and the error code of every pair
+        """
+        lines = TLEValidator.read_lines(file_path)
+        mask, codes = self.validate(lines)
+        return lines, mask, codes
@@ -0,0 +1,121 @@
+from ctypes import Array, c_char, c_double, c_longlong
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Sequence, Union
+
+from pysaal.elements._tle import TLE
+from pysaal.enums import TLEFormat
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._tle import XS_TLE_SATNAME_1_12, XS_TLE_SIZE
+
+if TYPE_CHECKING:
+    from pysaal.elements._tle_catalog import TLECatalog
+
+
+class TLEWriter:
+    """Bulk exporter that streams TLEs as 2LE, 3LE or CSV records.
+
+    Every record is generated by the library (``TleGPArrayToLines`` or ``TleGPArrayToCsv``) into one pair of line
+    buffers that is reused for the whole export, and the encoded records are passed straight to a buffered binary
+    stream.  No :class:`TLE` object or intermediate string is created per record when exporting a
+    :class:`TLECatalog` or a set of keys.
+
+    :example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+
+        from pysaal.elements import TLE, TLECatalog, TLEWriter
+        from pysaal.enums import TLEFormat
+
+        catalog = TLECatalog.from_file(Path("catalog.tle"))
+        TLEWriter(TLEFormat.CSV).write(catalog, Path("catalog.csv"))
+        TLEWriter(TLEFormat.THREE_LINE).write_keys(TLE.get_loaded_keys(), Path("catalog.3le"))
+    """
+
+    #: Default size of the write buffer used when the destination is a path in :math:`bytes`
+    DEFAULT_BUFFER_SIZE = 1 << 20
+
+    def __init__(self, tle_format: TLEFormat = TLEFormat.TWO_LINE, buffer_size: int = DEFAULT_BUFFER_SIZE):
+
+        #: The format of the exported records.  See :ref:`tle_format` for options.
+        self.tle_format = tle_format
+
+        #: Size of the write buffer used when the destination is a path in :math:`bytes`
+        self.buffer_size = buffer_size
+
+        self._line_1 = (c_char * XS_TLE_SIZE)()
+        self._line_2 = (c_char * XS_TLE_SIZE)()
+        self._xa_tle, self._xs_tle = TLE.get_null_pointers()
+
+    def _format(self, xa_tle: Array[c_double], xs_tle: Array[c_char], name: bytes) -> bytes:
+        if self.tle_format == TLEFormat.CSV:
+            DLLs.tle.TleGPArrayToCsv(xa_tle, xs_tle, self._line_1)
+            return self._line_1.value.strip() + b"\n"
+        DLLs.tle.TleGPArrayToLines(xa_tle, xs_tle, self._line_1, self._line_2)
+        record = self._line_1.value.strip() + b"\n" + self._line_2.value.strip() + b"\n"
+        if self.tle_format == TLEFormat.THREE_LINE:
+            record = name + b"\n" + record
+        return record
+
+    @staticmethod
+    def _get_name(xs_tle: Array[c_char]) -> bytes:
+        start = XS_TLE_SATNAME_1_12
+        return xs_tle.raw[start : start + TLE.MAX_DESIGNATOR_LENGTH].split(b"\x00")[0].strip()
+
+    def _get_records(self, tles: Union["TLECatalog", Sequence[TLE]]) -> Iterator[bytes]:
+        from pysaal.elements._tle_catalog import TLECatalog
+
+        if isinstance(tles, TLECatalog):
+            for xa_tle, xs_tle in zip(tles.c_double_block, tles.c_char_block):
+                yield self._format(xa_tle, xs_tle, TLEWriter._get_name(xs_tle))
+        else:
+            for tle in tles:
+                yield self._format(tle.c_double_array, tle.c_char_array, tle.name.encode())
+
+    def _get_key_records(self, keys: Iterable[int]) -> Iterator[bytes]:
+        for key in keys:
+            if DLLs.tle.TleDataToArray(c_longlong(key), self._xa_tle, self._xs_tle):
+                raise PySAALError
+            yield self._format(self._xa_tle, self._xs_tle, TLEWriter._get_name(self._xs_tle))
+
+    def _stream(self, records: Iterator[bytes], destination: Union[Path, BinaryIO]) -> int:
+        count = 0
+        if isinstance(destination, Path):
+            with open(destination, "wb", buffering=self.buffer_size) as f:
+                for record in records:
+                    f.write(record)
+                    count += 1
+        else:
+            for record in records:
+                destination.write(record)
+                count += 1
+        return count
+
+    def write(self, tles: Union["TLECatalog", Sequence[TLE]], destination: Union[Path, BinaryIO]) -> int:
+        """Export a catalog or a sequence of TLEs
+
+        :param tles: A :class:`TLECatalog` or any sequence of :class:`TLE` objects
+        :param destination: The path of the file to write or a binary file-like object
+        :return: The number of records written
+
+        .. note::
+
+            The name line of a 3LE is the :attr:`TLE.name` of each TLE, or the designator of each catalog record.
+        """
+        return self._stream(self._get_records(tles), destination)
+
+    def write_keys(self, keys: Iterable[int], destination: Union[Path, BinaryIO]) -> int:
+        """Export TLEs that are loaded in memory
+
+        :param keys: The keys of the TLEs to export
+        :param destination: The path of the file to write or a binary file-like object
+        :raises PySAALError: If one of the keys does not reference a loaded TLE
+        :return: The number of records written
+
+        .. note::
+
+            Each record is retrieved with ``TleDataToArray`` into a single reused pair of arrays.
+        """
+        return self._stream(self._get_key_records(keys), destination)
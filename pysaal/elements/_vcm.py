@@ -0,0 +1,388 @@
+from ctypes import Array, c_char, c_double, c_longlong
+from typing import Sequence
+
+from pysaal.elements._cartesian_elements import CartesianElements
+from pysaal.elements._impulsive_maneuver import ImpulsiveManeuver
+from pysaal.enums import PySAALKeyErrorCode
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._main_dll import IDX_ORDER_READ
+from pysaal.lib._vcm import (
+    VCMSTRLEN,
+    XA_VCM_AGOM,
+    XA_VCM_BDOT,
+    XA_VCM_BTERM,
+    XA_VCM_COVELEMS,
+    XA_VCM_COVMTXSIZE,
+    XA_VCM_ECIPOSX,
+    XA_VCM_ECIVELX,
+    XA_VCM_EDR,
+    XA_VCM_EFGPOSX,
+    XA_VCM_EFGVELX,
+    XA_VCM_EPOCHDS50UTC,
+    XA_VCM_J2KPOSX,
+    XA_VCM_J2KVELX,
+    XA_VCM_OGPARM,
+    XA_VCM_POSUSIG,
+    XA_VCM_REVNUM,
+    XA_VCM_RMS,
+    XA_VCM_SATNUM,
+    XA_VCM_SIZE,
+    XA_VCM_VELUSIG,
+    XS_VCM_COMMNAME,
+    XS_VCM_COORDSYS,
+    XS_VCM_DRAGMOD,
+    XS_VCM_GEONAME,
+    XS_VCM_SATNAME,
+    XS_VCM_SIZE,
+)
+from pysaal.math.linalg import Vector3D
+from pysaal.time import Epoch
+
+
+class VCM:
+    """Class for Vector Covariance Messages (VCMs)."""
+
+    #: Designators longer than this will not fit entirely in the allocated space for a VCM.
+    MAX_DESIGNATOR_LENGTH = 8
+
+    #: Common names longer than this will not fit entirely in the allocated space for a VCM.
+    MAX_COMMON_NAME_LENGTH = 25
+
+    #: Number of elements in the lower triangle of a 6x6 covariance matrix
+    LOWER_TRIANGLE_SIZE = 21
+
+    def __init__(self):
+
+        self.c_double_array, self.c_char_array = VCM.get_null_pointers()
+
+        #: Flag indicating if the VCM is loaded into memory
+        self.loaded = False
+
+        #: The key used to reference the VCM in memory
+        self.key = None
+
+    @classmethod
+    def from_string(cls, vcm_string: str) -> "VCM":
+        """Create a VCM object from its 1-line or concatenated multi-line string format.
+
+        :param vcm_string: The VCM text
+        :raises PySAALError: If the library is unable to parse the string
+        """
+        vcm = cls()
+        status = DLLs.vcm.VcmStringToArray(vcm_string.encode(), vcm.c_double_array, vcm.c_char_array)
+        if status:
+            raise PySAALError
+        return vcm
+
+    @classmethod
+    def from_key(cls, key: c_longlong) -> "VCM":
+        """Instantiate a VCM from a known key in memory
+
+        :param key: The key associated with the VCM in memory
+        """
+        vcm = cls()
+        status = DLLs.vcm.VcmRetrieveAllData(key, vcm.c_char_array, vcm.c_double_array)
+        if status:
+            raise PySAALError
+        vcm.loaded = True
+        vcm.key = key
+        return vcm
+
+    @classmethod
+    def from_c_arrays(cls, c_double_array: Array[c_double], c_char_array: Array[c_char]) -> "VCM":
+        """Instantiate a VCM from c arrays that correspond to the required arguments for the SAAL functions
+
+        :param c_double_array: The c_double array containing the VCM numeric fields
+        :param c_char_array: The c_char array containing the VCM string fields
+
+        .. note::
+
+            The arrays are referenced rather than copied, which allows a VCM to act as a view of a catalog row.
+        """
+        vcm = cls()
+        vcm.c_double_array = c_double_array
+        vcm.c_char_array = c_char_array
+        return vcm
+
+    @staticmethod
+    def get_null_pointers() -> tuple[Array[c_double], Array[c_char]]:
+        """Get null pointers for the c_double and c_char arrays used in the SAAL functions"""
+        xa_vcm = (c_double * XA_VCM_SIZE)()
+        xs_vcm = (c_char * XS_VCM_SIZE)()
+        return xa_vcm, xs_vcm
+
+    @staticmethod
+    def destroy_all() -> None:
+        """Remove all VCMs from memory"""
+        DLLs.vcm.VcmRemoveAllSats()
+
+    @staticmethod
+    def get_number_in_memory() -> int:
+        """Get the number of VCMs in memory"""
+        return DLLs.vcm.VcmGetCount()
+
+    @staticmethod
+    def get_loaded_keys() -> Array[c_longlong]:
+        """Get the keys of all VCMs in memory in the order they were loaded"""
+        keys = (c_longlong * VCM.get_number_in_memory())()
+        DLLs.vcm.VcmGetLoaded(IDX_ORDER_READ, keys)
+        return keys
+
+    def load(self) -> None:
+        """Load the VCM into memory
+
+        .. note::
+
+            The library also loads the timing constants of the VCM, so the cache of
+            :attr:`Epoch.TIME_SCALE_CONVERTER` is cleared.
+        """
+        if not self.loaded:
+            key = DLLs.vcm.VcmAddSatFrFields(self.c_char_array, self.c_double_array)
+            Epoch.TIME_SCALE_CONVERTER.clear_cache()
+            if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
+                raise PySAALError
+            self.key = key
+            self.loaded = True
+
+    def add_maneuvers(self, maneuvers: Sequence[ImpulsiveManeuver]) -> None:
+        """Attach impulsive maneuvers to the VCM
+
+        :param maneuvers: The maneuvers to add
+        :raises PySAALError: If the library is unable to load the VCM or rejects a maneuver
+
+        .. note::
+
+            The VCM is loaded into memory if it is not already.  Maneuvers must be added before the VCM is
+            initialized for propagation.
+        """
+        self.load()
+        key = self.key
+        if key is None:
+            raise PySAALError
+        for maneuver in maneuvers:
+            maneuver.add_to_key(key)
+
+    def destroy(self) -> None:
+        """Remove the VCM from memory"""
+        if self.loaded and self.key is not None:
+            DLLs.vcm.VcmRemoveSat(self.key)
+            self.key = None
+            self.loaded = False
+
+    def update(self) -> None:
+        """Updates the VCM in memory
+
+        .. note::
+
+            The satellite number and epoch of a VCM in memory are not changed by an update.
+        """
+        if self.loaded and self.key is not None:
+            DLLs.vcm.VcmUpdateSatFrFields(self.key, self.c_char_array, self.c_double_array)
+
+    def _get_text(self, start: int, length: int) -> str:
+        return self.c_char_array[start : start + length].rstrip(b"\x00").decode().strip()
+
+    def _set_text(self, start: int, length: int, value: str) -> None:
+        self.c_char_array[start : start + length] = f"{value: <{length}}".encode()  # type: ignore
+
+    def _get_cartesian(self, position_index: int, velocity_index: int) -> CartesianElements:
+        return CartesianElements(
+            *self.c_double_array[position_index : position_index + 3],
+            *self.c_double_array[velocity_index : velocity_index + 3],
+        )
+
+    def _set_cartesian(self, position_index: int, velocity_index: int, value: CartesianElements) -> None:
+        self.c_double_array[position_index : position_index + 3] = [value.x, value.y, value.z]
+        self.c_double_array[velocity_index : velocity_index + 3] = [value.vx, value.vy, value.vz]
+
+    @property
+    def lines(self) -> str:
+        """The multi-line text representation of the VCM"""
+        vcm_string = (c_char * VCMSTRLEN)()
+        DLLs.vcm.VcmArrayToVcmLines(self.c_double_array, self.c_char_array, vcm_string)
+        return vcm_string.value.decode().rstrip()
+
+    @property
+    def designator(self) -> str:
+        """8-character designator of the satellite"""
+        return self._get_text(XS_VCM_SATNAME, VCM.MAX_DESIGNATOR_LENGTH)
+
+    @designator.setter
+    def designator(self, value: str):
+        if len(value) > VCM.MAX_DESIGNATOR_LENGTH:
+            raise ValueError(f"Name exceeds maximum length of {VCM.MAX_DESIGNATOR_LENGTH}")
+        self._set_text(XS_VCM_SATNAME, VCM.MAX_DESIGNATOR_LENGTH, value)
+        self.update()
+
+    @property
+    def common_name(self) -> str:
+        """25-character common name of the satellite"""
+        return self._get_text(XS_VCM_COMMNAME, VCM.MAX_COMMON_NAME_LENGTH)
+
+    @common_name.setter
+    def common_name(self, value: str):
+        if len(value) > VCM.MAX_COMMON_NAME_LENGTH:
+            raise ValueError(f"Common name exceeds maximum length of {VCM.MAX_COMMON_NAME_LENGTH}")
+        self._set_text(XS_VCM_COMMNAME, VCM.MAX_COMMON_NAME_LENGTH, value)
+        self.update()
+
+    @property
+    def geopotential_model(self) -> str:
+        """Name of the geopotential model used to generate the VCM (e.g. EGM-96)"""
+        return self._get_text(XS_VCM_GEONAME, 6)
+
+    @property
+    def drag_model(self) -> str:
+        """Name of the atmospheric drag model used to generate the VCM"""
+        return self._get_text(XS_VCM_DRAGMOD, 12)
+
+    @property
+    def coordinate_system(self) -> str:
+        """Coordinate system of the VCM state"""
+        return self._get_text(XS_VCM_COORDSYS, 5)
+
+    @property
+    def satellite_id(self) -> int:
+        """The unique satellite ID"""
+        return int(self.c_double_array[XA_VCM_SATNUM])
+
+    @satellite_id.setter
+    def satellite_id(self, value: int):
+        self.c_double_array[XA_VCM_SATNUM] = float(value)
+        self.update()
+
+    @property
+    def epoch(self) -> Epoch:
+        """Epoch of the VCM"""
+        return Epoch(self.c_double_array[XA_VCM_EPOCHDS50UTC])
+
+    @epoch.setter
+    def epoch(self, value: Epoch):
+        self.c_double_array[XA_VCM_EPOCHDS50UTC] = value.utc_ds50
+        self.update()
+
+    @property
+    def revolution_number(self) -> int:
+        """Revolution number at epoch"""
+        return int(self.c_double_array[XA_VCM_REVNUM])
+
+    @revolution_number.setter
+    def revolution_number(self, value: int):
+        self.c_double_array[XA_VCM_REVNUM] = value
+        self.update()
+
+    @property
+    def cartesian_elements(self) -> CartesianElements:
+        r"""TEME position and velocity elements in :math:`km` and :math:`\frac{km}{s}`"""
+        return self._get_cartesian(XA_VCM_ECIPOSX, XA_VCM_ECIVELX)
+
+    @cartesian_elements.setter
+    def cartesian_elements(self, value: CartesianElements):
+        self._set_cartesian(XA_VCM_ECIPOSX, XA_VCM_ECIVELX, value)
+        self.update()
+
+    @property
+    def j2000_elements(self) -> CartesianElements:
+        r"""J2000 position and velocity elements in :math:`km` and :math:`\frac{km}{s}`"""
+        return self._get_cartesian(XA_VCM_J2KPOSX, XA_VCM_J2KVELX)
+
+    @j2000_elements.setter
+    def j2000_elements(self, value: CartesianElements):
+        self._set_cartesian(XA_VCM_J2KPOSX, XA_VCM_J2KVELX, value)
+        self.update()
+
+    @property
+    def efg_elements(self) -> CartesianElements:
+        r"""Earth-fixed position and velocity elements in :math:`km` and :math:`\frac{km}{s}`"""
+        return self._get_cartesian(XA_VCM_EFGPOSX, XA_VCM_EFGVELX)
+
+    @property
+    def position(self) -> Vector3D:
+        """TEME position of the satellite in :math:`km`"""
+        return self.cartesian_elements.position
+
+    @property
+    def velocity(self) -> Vector3D:
+        r"""TEME velocity of the satellite in :math:`\frac{km}{s}`"""
+        return self.cartesian_elements.velocity
+
+    @property
+    def b_term(self) -> float:
+        r"""Ballistic coefficient in :math:`\frac{m^2}{kg}`"""
+        return self.c_double_array[XA_VCM_BTERM]
+
+    @b_term.setter
+    def b_term(self, value: float):
+        self.c_double_array[XA_VCM_BTERM] = value
+        self.update()
+
+    @property
+    def b_dot(self) -> float:
+        r"""Rate of change of the ballistic coefficient in :math:`\frac{m^2}{kg \cdot s}`"""
+        return self.c_double_array[XA_VCM_BDOT]
+
+    @b_dot.setter
+    def b_dot(self, value: float):
+        self.c_double_array[XA_VCM_BDOT] = value
+        self.update()
+
+    @property
+    def agom(self) -> float:
+        r"""Solar radiation pressure coefficient in :math:`\frac{m^2}{kg}`"""
+        return self.c_double_array[XA_VCM_AGOM]
+
+    @agom.setter
+    def agom(self, value: float):
+        self.c_double_array[XA_VCM_AGOM] = value
+        self.update()
+
+    @property
+    def energy_dissipation_rate(self) -> float:
+        r"""Energy dissipation rate in :math:`\frac{W}{kg}`"""
+        return self.c_double_array[XA_VCM_EDR]
+
+    @property
+    def outgassing_parameter(self) -> float:
+        r"""Outgassing parameter in :math:`\frac{km}{s^2}`"""
+        return self.c_double_array[XA_VCM_OGPARM]
+
+    @outgassing_parameter.setter
+    def outgassing_parameter(self, value: float):
+        self.c_double_array[XA_VCM_OGPARM] = value
+        self.update()
+
+    @property
+    def rms(self) -> float:
+        """Weighted RMS of the last differential correction"""
+        return self.c_double_array[XA_VCM_RMS]
+
+    @property
+    def position_sigmas(self) -> Vector3D:
+        """UVW position standard deviations in :math:`km`"""
+        return Vector3D(*self.c_double_array[XA_VCM_POSUSIG : XA_VCM_POSUSIG + 3])
+
+    @property
+    def velocity_sigmas(self) -> Vector3D:
+        r"""UVW velocity standard deviations in :math:`\frac{km}{s}`"""
+        return Vector3D(*self.c_double_array[XA_VCM_VELUSIG : XA_VCM_VELUSIG + 3])
+
+    @property
+    def covariance_size(self) -> int:
+        """Dimension of the covariance matrix carried by the VCM (6 or 9)"""
+        return int(self.c_double_array[XA_VCM_COVMTXSIZE])
+
+    @property
+    def covariance(self) -> Array[Array[c_double]]:
+        """The 6x6 covariance matrix as carried by the VCM
+
+        .. note::
+
+            For VCMs carrying a 9x9 matrix, this is the upper-left 6x6 block.
+        """
+        lower_triangle = (c_double * VCM.LOWER_TRIANGLE_SIZE)(
+            *self.c_double_array[XA_VCM_COVELEMS : XA_VCM_COVELEMS + VCM.LOWER_TRIANGLE_SIZE]
+        )
+        matrix = ((c_double * 6) * 6)()
+        DLLs.astro_func.LTA21ToMtx6x6(lower_triangle, matrix)
+        return matrix
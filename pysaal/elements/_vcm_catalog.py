@@ -0,0 +1,224 @@
+from ctypes import Array, c_char, c_double
+from pathlib import Path
+from typing import Sequence
+
+from pysaal.elements._element_catalog import _ElementCatalog
+from pysaal.elements._vcm import VCM
+from pysaal.enums import PySAALKeyErrorCode
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._vcm import (
+    VCMSTRLEN,
+    XA_VCM_AGOM,
+    XA_VCM_BDOT,
+    XA_VCM_BTERM,
+    XA_VCM_COVELEMS,
+    XA_VCM_ECIPOSX,
+    XA_VCM_EDR,
+    XA_VCM_EFGPOSX,
+    XA_VCM_EPOCHDS50UTC,
+    XA_VCM_J2KPOSX,
+    XA_VCM_OGPARM,
+    XA_VCM_POSUSIG,
+    XA_VCM_SATNUM,
+    XA_VCM_SIZE,
+    XS_VCM_SATNAME,
+    XS_VCM_SIZE,
+)
+from pysaal.time import Epoch
+
+
+class VCMCatalog(_ElementCatalog):
+    """Collection of VCMs stored in contiguous 512-element records.
+
+    Parsing is performed entirely by the SAAL library and the records are retrieved directly into the catalog blocks,
+    so loading a file with thousands of VCMs requires no Python-side text processing.  Fields for the whole catalog are
+    available as columns through the properties below or :meth:`get_column` and :meth:`get_columns`.
+
+    :example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+
+        from pysaal.elements import VCMCatalog
+
+        catalog = VCMCatalog.from_file(Path("vcms.txt"))
+        epochs = catalog.epochs
+        states = catalog.teme_states
+        print(len(catalog), epochs[0], states[0][0])
+    """
+
+    NUMERIC_SIZE = XA_VCM_SIZE
+    TEXT_SIZE = XS_VCM_SIZE
+
+    def __getitem__(self, index: int) -> VCM:
+        if index < 0:
+            index += len(self)
+        vcm = VCM.from_c_arrays(self.c_double_block[index], self.c_char_block[index])
+        if self.keys[index]:
+            vcm.key = self.keys[index]
+            vcm.loaded = True
+        return vcm
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "VCMCatalog":
+        """Load every VCM in a file and retrieve the records into a catalog
+
+        :param file_path: The path to the VCM file
+        :raises PySAALError: If the library is unable to load the file
+
+        .. note::
+
+            The VCMs remain loaded in memory and are referenced by :attr:`keys`.  The library also loads the timing
+            constants of each VCM, so the cache of :attr:`Epoch.TIME_SCALE_CONVERTER` is cleared.
+        """
+        count_before = VCM.get_number_in_memory()
+        status = DLLs.vcm.VcmLoadFile(file_path.as_posix().encode())
+        Epoch.TIME_SCALE_CONVERTER.clear_cache()
+        if status:
+            raise PySAALError
+        new_keys = VCM.get_loaded_keys()[count_before:]
+        catalog = cls(len(new_keys))
+        for i, key in enumerate(new_keys):
+            status = DLLs.vcm.VcmRetrieveAllData(key, catalog.c_char_block[i], catalog.c_double_block[i])
+            if status:
+                raise PySAALError
+            catalog.keys[i] = key
+        return catalog
+
+    @classmethod
+    def from_strings(cls, vcm_strings: Sequence[str]) -> "VCMCatalog":
+        """Parse VCMs in their 1-line or concatenated multi-line string format into a catalog
+
+        :param vcm_strings: The VCM text for each record
+        :raises PySAALError: If the library is unable to parse one of the strings
+        """
+        catalog = cls(len(vcm_strings))
+        for i, vcm_string in enumerate(vcm_strings):
+            status = DLLs.vcm.VcmStringToArray(
+                vcm_string.encode(), catalog.c_double_block[i], catalog.c_char_block[i]
+            )
+            if status:
+                raise PySAALError
+        return catalog
+
+    @classmethod
+    def from_vcms(cls, vcms: Sequence[VCM]) -> "VCMCatalog":
+        """Copy existing VCM objects into a catalog
+
+        :param vcms: The VCMs to copy
+        """
+        catalog = cls(len(vcms))
+        for i, vcm in enumerate(vcms):
+            catalog.c_double_block[i] = vcm.c_double_array
+            catalog.c_char_block[i] = vcm.c_char_array
+        return catalog
+
+    def load(self) -> None:
+        """Load every record that is not already in memory
+
+        .. note::
+
+            The library also loads the timing constants of each VCM, so the cache of
+            :attr:`Epoch.TIME_SCALE_CONVERTER` is cleared.
+        """
+        for i in range(len(self)):
+            if not self.keys[i]:
+                key = DLLs.vcm.VcmAddSatFrFields(self.c_char_block[i], self.c_double_block[i])
+                Epoch.TIME_SCALE_CONVERTER.clear_cache()
+                if key == PySAALKeyErrorCode.BAD_KEY.value or key == PySAALKeyErrorCode.DUPLICATE_KEY.value:
+                    raise PySAALError
+                self.keys[i] = key
+
+    def destroy(self) -> None:
+        """Remove every loaded record of the catalog from memory"""
+        for i in range(len(self)):
+            if self.keys[i]:
+                DLLs.vcm.VcmRemoveSat(self.keys[i])
+                self.keys[i] = 0
+
+    def write(self, file_path: Path) -> None:
+        """Write the catalog to a text file in the multi-line VCM format
+
+        :param file_path: The path of the file to write
+
+        .. note::
+
+            The text is generated by the library into a single reused buffer.
+        """
+        vcm_string = (c_char * VCMSTRLEN)()
+        with open(file_path, "wb") as f:
+            for xa_vcm, xs_vcm in zip(self.c_double_block, self.c_char_block):
+                DLLs.vcm.VcmArrayToVcmLines(xa_vcm, xs_vcm, vcm_string)
+                f.write(vcm_string.value.rstrip())
+                f.write(b"\n")
+
+    @property
+    def satellite_ids(self) -> list[int]:
+        """Satellite ID of every record"""
+        return [int(satellite_id) for satellite_id in self.get_column(XA_VCM_SATNUM)]
+
+    @property
+    def designators(self) -> list[str]:
+        """8-character designator of every record"""
+        return self.get_text_column(XS_VCM_SATNAME, VCM.MAX_DESIGNATOR_LENGTH)
+
+    @property
+    def epochs(self) -> Array[c_double]:
+        """UTC epoch of every record as days since 1950"""
+        return self.get_column(XA_VCM_EPOCHDS50UTC)
+
+    @property
+    def teme_states(self) -> Array[Array[c_double]]:
+        r"""``(N, 6)`` TEME positions and velocities in :math:`km` and :math:`\frac{km}{s}`"""
+        return self.get_columns(XA_VCM_ECIPOSX, 6)
+
+    @property
+    def j2000_states(self) -> Array[Array[c_double]]:
+        r"""``(N, 6)`` J2000 positions and velocities in :math:`km` and :math:`\frac{km}{s}`"""
+        return self.get_columns(XA_VCM_J2KPOSX, 6)
+
+    @property
+    def efg_states(self) -> Array[Array[c_double]]:
+        r"""``(N, 6)`` Earth-fixed positions and velocities in :math:`km` and :math:`\frac{km}{s}`"""
+        return self.get_columns(XA_VCM_EFGPOSX, 6)
+
+    @property
+    def uvw_sigmas(self) -> Array[Array[c_double]]:
+        r"""``(N, 6)`` UVW position and velocity standard deviations in :math:`km` and :math:`\frac{km}{s}`"""
+        return self.get_columns(XA_VCM_POSUSIG, 6)
+
+    @property
+    def b_terms(self) -> Array[c_double]:
+        r"""Ballistic coefficient of every record in :math:`\frac{m^2}{kg}`"""
+        return self.get_column(XA_VCM_BTERM)
+
+    @property
+    def b_dots(self) -> Array[c_double]:
+        r"""Ballistic coefficient rate of every record in :math:`\frac{m^2}{kg \cdot s}`"""
+        return self.get_column(XA_VCM_BDOT)
+
+    @property
+    def agoms(self) -> Array[c_double]:
+        r"""Solar radiation pressure coefficient of every record in :math:`\frac{m^2}{kg}`"""
+        return self.get_column(XA_VCM_AGOM)
+
+    @property
+    def energy_dissipation_rates(self) -> Array[c_double]:
+        r"""Energy dissipation rate of every record in :math:`\frac{W}{kg}`"""
+        return self.get_column(XA_VCM_EDR)
+
+    @property
+    def outgassing_parameters(self) -> Array[c_double]:
+        r"""Outgassing parameter of every record in :math:`\frac{km}{s^2}`"""
+        return self.get_column(XA_VCM_OGPARM)
+
+    @property
+    def covariances(self) -> Array[Array[Array[c_double]]]:
+        """``(N, 6, 6)`` covariance matrices as carried by the VCMs"""
+        lower_triangles = self.get_columns(XA_VCM_COVELEMS, VCM.LOWER_TRIANGLE_SIZE)
+        matrices = (((c_double * 6) * 6) * len(self))()
+        for lower_triangle, matrix in zip(lower_triangles, matrices):
+            DLLs.astro_func.LTA21ToMtx6x6(lower_triangle, matrix)
+        return matrices
@@ -5,6 +5,12 @@ from pysaal.enums._sgp4_ephemeris_type import SGP4EphemerisType
 from pysaal.enums._sgp4_error_code import SGP4ErrorCode
 from pysaal.enums._sgp4_epoch_type import SGP4EpochType
 from pysaal.enums._earth_model import EarthModel
+from pysaal.enums._covariance_frame import CovarianceFrame
+from pysaal.enums._reference_frame import ReferenceFrame
+from pysaal.enums._tle_format import TLEFormat
+from pysaal.enums._tle_validation_code import TLEValidationCode
+from pysaal.enums._time_scale import TimeScale
+from pysaal.enums._fk_model import FKModel
 
 __all__ = [
     "TLEType",
@@ -14,4 +20,10 @@ __all__ = [
     "SGP4ErrorCode",
     "SGP4EpochType",
     "EarthModel",
+    "CovarianceFrame",
+    "ReferenceFrame",
+    "TLEFormat",
+    "TLEValidationCode",
+    "TimeScale",
+    "FKModel",
 ]
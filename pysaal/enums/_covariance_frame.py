@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class CovarianceFrame(Enum):
+    ECI = "ECI"
+    UVW = "UVW"
+    PTW = "PTW"
+    EFG = "EFG"
+    EQUINOCTIAL = "EQNX"
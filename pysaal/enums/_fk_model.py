@@ -0,0 +1,12 @@
+from enum import Enum
+
+from pysaal.lib._env_const import XF_FKMOD_4, XF_FKMOD_5
+
+
+class FKModel(Enum):
+
+    #: Fourth Fundamental Catalog
+    FK4 = XF_FKMOD_4
+
+    #: Fifth Fundamental Catalog
+    FK5 = XF_FKMOD_5
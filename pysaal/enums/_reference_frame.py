@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class ReferenceFrame(Enum):
+    TEME = "TEME"
+    J2000 = "J2000"
+    EFG = "EFG"
+    LLH = "LLH"
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class TimeScale(Enum):
+
+    #: Coordinated Universal Time
+    UTC = "UTC"
+
+    #: International Atomic Time
+    TAI = "TAI"
+
+    #: Universal Time corrected for polar motion
+    UT1 = "UT1"
+
+    #: Terrestrial Time (Ephemeris Time in the SAAL documentation)
+    TT = "TT"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class TLEFormat(Enum):
+
+    #: Two lines per element set
+    TWO_LINE = "2LE"
+
+    #: A name line followed by the two lines of the element set
+    THREE_LINE = "3LE"
+
+    #: One comma-separated line per element set
+    CSV = "CSV"
@@ -0,0 +1,40 @@
+from enum import Enum
+
+
+class TLEValidationCode(Enum):
+
+    #: The lines passed every check
+    VALID = 0
+
+    #: A line is not 68 or 69 characters long
+    LINE_LENGTH = 1
+
+    #: A line does not start with the expected line number
+    LINE_NUMBER = 2
+
+    #: The satellite numbers of the two lines differ
+    SATELLITE_ID_MISMATCH = 3
+
+    #: The last character of a line does not match its modulo-10 checksum
+    CHECKSUM = 4
+
+    #: The epoch cannot be parsed or the day of year is out of range
+    EPOCH = 5
+
+    #: The inclination cannot be parsed or is outside of [0, 180] degrees
+    INCLINATION = 6
+
+    #: The right ascension of the ascending node cannot be parsed or is outside of [0, 360] degrees
+    RAAN = 7
+
+    #: The eccentricity field is not made of digits
+    ECCENTRICITY = 8
+
+    #: The argument of perigee cannot be parsed or is outside of [0, 360] degrees
+    ARGUMENT_OF_PERIGEE = 9
+
+    #: The mean anomaly cannot be parsed or is outside of [0, 360] degrees
+    MEAN_ANOMALY = 10
+
+    #: The mean motion cannot be parsed or is not positive
+    MEAN_MOTION = 11
@@ -0,0 +1,3 @@
+from pysaal.fitting._tle_fitter import TLEFit, TLEFitter
+
+__all__ = ["TLEFit", "TLEFitter"]
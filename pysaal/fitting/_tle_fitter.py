@@ -0,0 +1,323 @@
+from concurrent.futures import ProcessPoolExecutor
+from ctypes import c_double
+from itertools import repeat
+from math import inf, sqrt
+from typing import Optional, Sequence
+
+from pysaal.elements import TLE, ConvertElements, TLECatalog
+from pysaal.enums import TLEType
+from pysaal.exceptions import PySAALError
+from pysaal.lib import DLLs
+from pysaal.lib._tle import (
+    XA_TLE_AGOMGP,
+    XA_TLE_BSTAR,
+    XA_TLE_BTERM,
+    XA_TLE_ECCEN,
+    XA_TLE_INCLI,
+    XA_TLE_MNANOM,
+    XA_TLE_MNMOTN,
+    XA_TLE_NODE,
+    XA_TLE_OMEGA,
+    XA_TLE_SATNUM,
+    XA_TLE_SIZE,
+)
+from pysaal.time import Epoch
+
+#: Finite-difference step of each solve-for field of the XA_TLE array
+_STEPS = {
+    XA_TLE_INCLI: 1e-4,
+    XA_TLE_NODE: 1e-4,
+    XA_TLE_ECCEN: 1e-6,
+    XA_TLE_OMEGA: 1e-4,
+    XA_TLE_MNANOM: 1e-4,
+    XA_TLE_MNMOTN: 1e-6,
+    XA_TLE_BSTAR: 1e-6,
+    XA_TLE_BTERM: 1e-4,
+    XA_TLE_AGOMGP: 1e-4,
+}
+
+#: Relative damping added to the diagonal of the normal equations
+_DAMPING = 1e-9
+
+#: Number of times a correction is halved before the fit is declared stalled
+_MAX_HALVINGS = 6
+
+#: Largest eccentricity accepted by a correction, which leaves room for the finite-difference step
+_MAX_ECCENTRICITY = 0.999
+
+
+class TLEFit:
+    """Result of fitting a TLE to an ephemeris."""
+
+    def __init__(self, tle: TLE, rms: float, iterations: int, converged: bool):
+
+        #: The fitted TLE
+        self.tle = tle
+
+        #: Root mean square of the position residuals in :math:`km`
+        self.rms = rms
+
+        #: Number of differential-correction iterations performed
+        self.iterations = iterations
+
+        #: Flag indicating if the change in RMS fell below the tolerance before the iteration cap
+        self.converged = converged
+
+
+class TLEFitter:
+    """Least-squares differential correction of TLEs to ephemeris spans.
+
+    The fit is seeded with ``Sgp4PosVelToTleArr`` at the middle of the span.  Each iteration loads the nominal TLE and
+    one finite-difference perturbation per solve-for parameter, then propagates all of them to every ephemeris time
+    with a single ``Sgp4PropAllSats`` call per time.  The position residuals and partials form normal equations that
+    are solved for the correction, which is halved until it reduces the RMS.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.elements import TLE
+        from pysaal.fitting import TLEFitter
+        from pysaal.time import TimeSpan
+
+        line_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+        line_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+        truth = TLE.from_lines(line_1, line_2)
+        ephemeris = truth.get_ephemeris(TimeSpan(truth.epoch, truth.epoch + 1), 10.0)
+
+        fit = TLEFitter(solve_b_star=True).fit(ephemeris, truth.satellite_id)
+        print(fit.rms, fit.tle.lines)
+    """
+
+    #: Default maximum number of differential-correction iterations
+    DEFAULT_MAX_ITERATIONS = 20
+
+    #: Default relative change in RMS below which the fit is converged
+    DEFAULT_TOLERANCE = 1e-6
+
+    def __init__(
+        self,
+        tle_type: TLEType = TLEType.SGP4,
+        solve_b_star: bool = False,
+        solve_agom: bool = False,
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+        tolerance: float = DEFAULT_TOLERANCE,
+    ):
+        """Configure the fitter
+
+        :param tle_type: The type of TLE to fit.  Must be SGP, SGP4 or XP.
+        :param solve_b_star: Flag to solve for the drag term (B* for SGP/SGP4, ballistic coefficient for XP)
+        :param solve_agom: Flag to solve for the solar radiation pressure coefficient.  Only available for XP.
+        :param max_iterations: Maximum number of differential-correction iterations
+        :param tolerance: Relative change in RMS below which the fit is converged
+        :raises ValueError: If the TLE type is SP or AGOM is requested for a non-XP TLE
+        """
+        if tle_type == TLEType.SP:
+            raise ValueError("SP element sets cannot be fit with SGP4.")
+        if solve_agom and tle_type != TLEType.XP:
+            raise ValueError("AGOM can only be solved for XP element sets.")
+
+        #: The type of TLE to fit
+        self.tle_type = tle_type
+
+        #: Flag to solve for the drag term
+        self.solve_b_star = solve_b_star
+
+        #: Flag to solve for the solar radiation pressure coefficient
+        self.solve_agom = solve_agom
+
+        #: Maximum number of differential-correction iterations
+        self.max_iterations = max_iterations
+
+        #: Relative change in RMS below which the fit is converged
+        self.tolerance = tolerance
+
+    @property
+    def parameter_indices(self) -> list[int]:
+        """Indices of the XA_TLE fields solved for by the fit"""
+        indices = [XA_TLE_INCLI, XA_TLE_NODE, XA_TLE_ECCEN, XA_TLE_OMEGA, XA_TLE_MNANOM, XA_TLE_MNMOTN]
+        if self.solve_b_star:
+            indices.append(XA_TLE_BTERM if self.tle_type == TLEType.XP else XA_TLE_BSTAR)
+        if self.solve_agom:
+            indices.append(XA_TLE_AGOMGP)
+        return indices
+
+    @staticmethod
+    def _solve(matrix: list[list[float]], vector: list[float]) -> list[float]:
+        """Solve a small dense linear system by Gaussian elimination with partial pivoting
+
+        :raises ValueError: If the system is singular
+        """
+        size = len(vector)
+        augmented = [row[:] + [value] for row, value in zip(matrix, vector)]
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda r: abs(augmented[r][col]))
+            augmented[col], augmented[pivot] = augmented[pivot], augmented[col]
+            if augmented[col][col] == 0:
+                raise ValueError("The normal equations of the fit are singular.")
+            for row in range(col + 1, size):
+                factor = augmented[row][col] / augmented[col][col]
+                for k in range(col, size + 1):
+                    augmented[row][k] -= factor * augmented[col][k]
+        solution = [0.0] * size
+        for row in reversed(range(size)):
+            total = augmented[row][size] - sum(augmented[row][k] * solution[k] for k in range(row + 1, size))
+            solution[row] = total / augmented[row][row]
+        return solution
+
+    def _evaluate(
+        self,
+        catalog: TLECatalog,
+        nominal: Sequence[float],
+        ephemeris: Sequence[Sequence[float]],
+        satellite_ids: Sequence[int],
+    ) -> tuple[float, list[list[float]], list[float]]:
+        """Propagate the nominal and perturbed TLEs and return the RMS, partials and residuals"""
+        indices = self.parameter_indices
+        catalog.destroy()
+        for row, xa_tle in enumerate(catalog.c_double_block):
+            xa_tle[:] = nominal  # type: ignore
+            xa_tle[XA_TLE_SATNUM] = float(satellite_ids[row])
+            if row:
+                xa_tle[indices[row - 1]] += _STEPS[indices[row - 1]]
+        catalog.load()
+
+        states = ((c_double * 6) * len(catalog))()
+        partials: list[list[float]] = []
+        residuals: list[float] = []
+        for point in ephemeris:
+            if DLLs.sgp4_prop.Sgp4PropAllSats(catalog.keys, len(catalog), point[0], states):
+                raise PySAALError
+            for axis in range(3):
+                residuals.append(point[axis + 1] - states[0][axis])
+                partials.append(
+                    [(states[k + 1][axis] - states[0][axis]) / _STEPS[index] for k, index in enumerate(indices)]
+                )
+        rms = sqrt(sum(r * r for r in residuals) / len(ephemeris))
+        return rms, partials, residuals
+
+    def _try_evaluate(
+        self,
+        catalog: TLECatalog,
+        nominal: Sequence[float],
+        ephemeris: Sequence[Sequence[float]],
+        satellite_ids: Sequence[int],
+    ) -> tuple[float, list[list[float]], list[float]]:
+        try:
+            return self._evaluate(catalog, nominal, ephemeris, satellite_ids)
+        except PySAALError:
+            return inf, [], []
+
+    def fit(self, ephemeris: Sequence[Sequence[float]], satellite_id: int) -> TLEFit:
+        r"""Fit a TLE to an ephemeris by differential correction
+
+        :param ephemeris: ``(M, 7)`` rows of UTC epoch as days since 1950 followed by the TEME position in :math:`km`
+            and velocity in :math:`\frac{km}{s}`
+        :param satellite_id: The satellite ID of the fitted TLE
+        :raises ValueError: If the ephemeris has fewer than three points
+        :raises PySAALError: If the seed TLE cannot be propagated
+
+        .. note::
+
+            J2000 ephemerides (e.g. from ExtEphem) must be rotated to TEME first, for example with
+            :class:`pysaal.frames.FrameConverter`.  The perturbed TLEs are loaded under temporary satellite IDs from
+            :meth:`TLE.get_unused_satellite_ids` and are removed before returning.
+        """
+        if len(ephemeris) < 3:
+            raise ValueError("At least three ephemeris points are required to fit a TLE.")
+        seed = ephemeris[len(ephemeris) // 2]
+        seed_catalog, _ = ConvertElements.tle.from_teme_states(
+            [seed[1:7]], [Epoch(seed[0])], [satellite_id], self.tle_type
+        )
+        nominal = list(seed_catalog.c_double_block[0])
+        indices = self.parameter_indices
+        catalog = TLECatalog(len(indices) + 1)
+        temporary_ids = TLE.get_unused_satellite_ids(len(catalog))
+
+        try:
+            rms, partials, residuals = self._evaluate(catalog, nominal, ephemeris, temporary_ids)
+            iterations = 0
+            converged = False
+            while iterations < self.max_iterations and not converged:
+                iterations += 1
+                size = len(indices)
+                normal = [[sum(p[i] * p[j] for p in partials) for j in range(size)] for i in range(size)]
+                for i in range(size):
+                    normal[i][i] *= 1.0 + _DAMPING
+                gradient = [sum(p[i] * r for p, r in zip(partials, residuals)) for i in range(size)]
+                try:
+                    correction = TLEFitter._solve(normal, gradient)
+                except ValueError:
+                    break
+
+                scale = 1.0
+                for _ in range(_MAX_HALVINGS):
+                    candidate = nominal[:]
+                    for index, delta in zip(indices, correction):
+                        candidate[index] += scale * delta
+                    candidate[XA_TLE_ECCEN] = min(max(candidate[XA_TLE_ECCEN], 0.0), _MAX_ECCENTRICITY)
+                    new_rms, new_partials, new_residuals = self._try_evaluate(
+                        catalog, candidate, ephemeris, temporary_ids
+                    )
+                    if new_rms <= rms:
+                        break
+                    scale *= 0.5
+                else:
+                    break
+
+                converged = rms == 0 or (rms - new_rms) / rms < self.tolerance
+                nominal, rms, partials, residuals = candidate, new_rms, new_partials, new_residuals
+        finally:
+            catalog.destroy()
+
+        tle = TLE()
+        tle.c_double_array[:] = nominal  # type: ignore
+        tle.c_double_array[XA_TLE_SATNUM] = float(satellite_id)
+        tle.c_char_array.raw = seed_catalog.c_char_block[0].raw
+        tle.name = tle.designator
+        return TLEFit(tle, rms, iterations, converged)
+
+    def fit_many(
+        self,
+        ephemerides: Sequence[Sequence[Sequence[float]]],
+        satellite_ids: Sequence[int],
+        max_workers: Optional[int] = None,
+    ) -> list[TLEFit]:
+        """Fit TLEs to many ephemerides in parallel worker processes
+
+        :param ephemerides: One ``(M, 7)`` TEME ephemeris per satellite
+        :param satellite_ids: The satellite ID of each fitted TLE
+        :param max_workers: Number of worker processes.  Defaults to the number of processors.  A value of 1 fits
+            every satellite in the calling process.
+        :raises ValueError: If the number of ephemerides and satellite IDs differ
+
+        .. note::
+
+            The SAAL libraries keep their state per process, so the fits run in separate processes rather than threads.
+            Ephemerides are sent to the workers as plain lists and the fitted XA_TLE/XS_TLE records are sent back.
+        """
+        if len(ephemerides) != len(satellite_ids):
+            raise ValueError("The number of ephemerides and satellite IDs must be the same.")
+        if max_workers == 1:
+            return [self.fit(ephemeris, satellite_id) for ephemeris, satellite_id in zip(ephemerides, satellite_ids)]
+
+        rows = [[list(point[:7]) for point in ephemeris] for ephemeris in ephemerides]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_fit_in_worker, repeat(self), rows, satellite_ids))
+
+        fits = []
+        for xa_tle, xs_tle, rms, iterations, converged in results:
+            tle = TLE()
+            tle.c_double_array[:] = xa_tle  # type: ignore
+            tle.c_char_array.raw = xs_tle
+            tle.name = tle.designator
+            fits.append(TLEFit(tle, rms, iterations, converged))
+        return fits
+
+
+def _fit_in_worker(
+    fitter: TLEFitter, ephemeris: list[list[float]], satellite_id: int
+) -> tuple[list[float], bytes, float, int, bool]:
+    """Fit a single TLE in a worker process and return the picklable fields of the result"""
+    fit = fitter.fit(ephemeris, satellite_id)
+    return list(fit.tle.c_double_array[:XA_TLE_SIZE]), fit.tle.c_char_array.raw, fit.rms, fit.iterations, fit.converged
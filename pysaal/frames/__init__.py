@@ -0,0 +1,3 @@
+from pysaal.frames._frame_converter import FrameConverter
+
+__all__ = ["FrameConverter"]
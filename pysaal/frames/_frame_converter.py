@@ -0,0 +1,209 @@
+from ctypes import Array, c_double
+from typing import Callable, Sequence
+
+from pysaal.enums import ReferenceFrame
+from pysaal.lib import DLLs
+from pysaal.time import Epoch
+
+#: Frames that are related by linear transforms, in the order they are chained
+_LINEAR_FRAMES = [ReferenceFrame.J2000, ReferenceFrame.TEME, ReferenceFrame.EFG]
+
+#: SPECTR compatibility flag passed to the J2000 rotations so that "of date" coordinates are TEME of date
+_SPECTR = 1
+
+
+class FrameConverter:
+    """Batch conversion of states between TEME, J2000, EFG and geodetic coordinates.
+
+    Each conversion between the linear frames is captured once per epoch as a 6x6 transform by pushing unit vectors
+    through the SAAL routines (``RotJ2KToDate``, ``RotDateToJ2K``, ``ECIToEFGTime`` and ``EFGToECITime``).  The
+    transforms are cached by epoch, so a catalog propagated onto a common time grid only calls the library once per
+    grid point instead of once per state.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.enums import ReferenceFrame
+        from pysaal.frames import FrameConverter
+        from pysaal.time import Epoch
+
+        converter = FrameConverter()
+        epoch = Epoch(27368.0)
+        states = [[6778.0, 0.0, 0.0, 0.0, 7.668, 0.0], [0.0, 42164.0, 0.0, -3.075, 0.0, 0.0]]
+        j2000 = converter.convert(states, [epoch, epoch], ReferenceFrame.TEME, ReferenceFrame.J2000)
+    """
+
+    #: Default number of nutation terms used by the J2000 rotations (4 is least accurate, 106 is most accurate)
+    DEFAULT_NUTATION_TERMS = 106
+
+    #: Default number of transforms held in the cache before it is emptied
+    DEFAULT_MAX_CACHE_SIZE = 100000
+
+    def __init__(self, nutation_terms: int = DEFAULT_NUTATION_TERMS, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE):
+
+        #: Number of nutation terms used by the J2000 rotations
+        self.nutation_terms = nutation_terms
+
+        #: Number of transforms held in the cache before it is emptied
+        self.max_cache_size = max_cache_size
+
+        self._transforms: dict[tuple, tuple[float, ...]] = {}
+
+    @property
+    def cache_size(self) -> int:
+        """Number of transforms held in the cache"""
+        return len(self._transforms)
+
+    def clear_cache(self) -> None:
+        """Remove every cached transform"""
+        self._transforms.clear()
+
+    def _store(self, key: tuple, transform: tuple[float, ...]) -> None:
+        if len(self._transforms) >= self.max_cache_size:
+            self._transforms.clear()
+        self._transforms[key] = transform
+
+    @staticmethod
+    def _get_path(source: ReferenceFrame, target: ReferenceFrame) -> list[ReferenceFrame]:
+        """Linear frames visited when converting from source to target"""
+        start = _LINEAR_FRAMES.index(source)
+        end = _LINEAR_FRAMES.index(target)
+        if start <= end:
+            return _LINEAR_FRAMES[start : end + 1]
+        return _LINEAR_FRAMES[end : start + 1][::-1]
+
+    def _get_step(self, source: ReferenceFrame, target: ReferenceFrame, epoch: Epoch) -> Callable:
+        if source == ReferenceFrame.J2000:
+            return lambda *vectors: DLLs.astro_func.RotJ2KToDate(_SPECTR, self.nutation_terms, epoch.tai_ds50, *vectors)
+        if target == ReferenceFrame.J2000:
+            return lambda *vectors: DLLs.astro_func.RotDateToJ2K(_SPECTR, self.nutation_terms, epoch.tai_ds50, *vectors)
+        if target == ReferenceFrame.EFG:
+            return lambda *vectors: DLLs.astro_func.ECIToEFGTime(epoch.utc_ds50, *vectors)
+        return lambda *vectors: DLLs.astro_func.EFGToECITime(epoch.utc_ds50, *vectors)
+
+    @staticmethod
+    def _build_transform(steps: Sequence[Callable]) -> tuple[float, ...]:
+        """Capture a chain of linear position/velocity routines as a row-major 6x6 matrix"""
+        vectors = ((c_double * 3) * 4)()
+        columns = []
+        for column in range(6):
+            for vector in vectors:
+                vector[:] = [0.0, 0.0, 0.0]
+            vectors[column // 3][column % 3] = 1.0
+            pos_in, vel_in, pos_out, vel_out = vectors
+            for step in steps:
+                step(pos_in, vel_in, pos_out, vel_out)
+                pos_in, vel_in, pos_out, vel_out = pos_out, vel_out, pos_in, vel_in
+            columns.append([*pos_in, *vel_in])
+        return tuple(columns[c][r] for r in range(6) for c in range(6))
+
+    def get_transform(self, source: ReferenceFrame, target: ReferenceFrame, epoch: Epoch) -> tuple[float, ...]:
+        """Get the row-major 6x6 matrix that maps a state in the source frame to the target frame
+
+        :param source: The frame of the input state.  Must be TEME, J2000 or EFG.
+        :param target: The frame of the output state.  Must be TEME, J2000 or EFG.
+        :param epoch: The epoch of the state
+        """
+        key = (source, target, epoch.utc_ds50)
+        transform = self._transforms.get(key)
+        if transform is None:
+            path = FrameConverter._get_path(source, target)
+            steps = [self._get_step(a, b, epoch) for a, b in zip(path, path[1:])]
+            transform = FrameConverter._build_transform(steps)
+            self._store(key, transform)
+        return transform
+
+    def get_teme_epoch_to_date_transform(self, frame_epoch: Epoch, epoch: Epoch) -> tuple[float, ...]:
+        """Get the row-major 6x6 matrix that maps a state from TEME of a fixed epoch to TEME of date
+
+        :param frame_epoch: The epoch that defines the input TEME frame
+        :param epoch: The date of the output TEME frame
+        """
+        key = ("TEME_EPOCH", frame_epoch.utc_ds50, epoch.utc_ds50)
+        transform = self._transforms.get(key)
+        if transform is None:
+            tai_frame, tai_date = frame_epoch.tai_ds50, epoch.tai_ds50
+
+            def step(*vectors):
+                DLLs.astro_func.TemeEpochToDate(self.nutation_terms, tai_frame, tai_date, *vectors)
+
+            transform = FrameConverter._build_transform([step])
+            self._store(key, transform)
+        return transform
+
+    @staticmethod
+    def _apply(transform: tuple[float, ...], state: Sequence[float], out: Array[c_double]) -> None:
+        width = len(out)
+        if width == 3:
+            for r in range(3):
+                row = 6 * r
+                out[r] = transform[row] * state[0] + transform[row + 1] * state[1] + transform[row + 2] * state[2]
+        else:
+            for r in range(6):
+                row = 6 * r
+                out[r] = sum(transform[row + c] * state[c] for c in range(6))
+
+    def convert(
+        self,
+        states: Sequence[Sequence[float]],
+        epochs: Sequence[Epoch],
+        source: ReferenceFrame,
+        target: ReferenceFrame,
+    ) -> Array[Array[c_double]]:
+        r"""Convert a batch of states between frames
+
+        :param states: ``(N, 3)`` positions or ``(N, 6)`` states in :math:`km` and :math:`\frac{km}{s}`.  LLH rows are
+            geodetic latitude and longitude in :math:`degrees` and height in :math:`km`.
+        :param epochs: The epoch of each state
+        :param source: The frame of the input states.  See :ref:`reference_frame` for options.
+        :param target: The frame of the output states
+        :raises ValueError: If the number of states and epochs differ
+        :return: ``(N, 6)`` states, or ``(N, 3)`` positions if the input has no velocity or either frame is LLH
+
+        .. note::
+
+            TEME is TEME of date, which is the output frame of SGP4.  LLH conversions pass through EFG and only carry
+            the position.
+        """
+        if len(states) != len(epochs):
+            raise ValueError("The number of states and epochs must be the same.")
+        width = 3 if source == ReferenceFrame.LLH or target == ReferenceFrame.LLH else 6
+        if states and len(states[0]) < 6:
+            width = 3
+        result = ((c_double * width) * len(states))()
+
+        linear_source = ReferenceFrame.EFG if source == ReferenceFrame.LLH else source
+        linear_target = ReferenceFrame.EFG if target == ReferenceFrame.LLH else target
+        scratch = (c_double * 3)()
+        for state, epoch, out in zip(states, epochs, result):
+            if source == ReferenceFrame.LLH:
+                scratch[:] = state[:3]  # type: ignore
+                DLLs.astro_func.LLHToEFGPos(scratch, out)
+                state = out[:]
+            if linear_source != linear_target:
+                FrameConverter._apply(self.get_transform(linear_source, linear_target, epoch), state, out)
+            elif source != ReferenceFrame.LLH:
+                out[:] = state[:width]  # type: ignore
+            if target == ReferenceFrame.LLH:
+                scratch[:] = out[:]
+                DLLs.astro_func.EFGPosToLLH(scratch, out)
+        return result
+
+    def teme_epoch_to_date(
+        self, states: Sequence[Sequence[float]], frame_epoch: Epoch, epochs: Sequence[Epoch]
+    ) -> Array[Array[c_double]]:
+        r"""Rotate states from TEME of a fixed epoch to TEME of the date of each state
+
+        :param states: ``(N, 3)`` positions or ``(N, 6)`` states in :math:`km` and :math:`\frac{km}{s}`
+        :param frame_epoch: The epoch that defines the input TEME frame
+        :param epochs: The epoch of each state
+        :raises ValueError: If the number of states and epochs differ
+        """
+        if len(states) != len(epochs):
+            raise ValueError("The number of states and epochs must be the same.")
+        width = 6 if states and len(states[0]) >= 6 else 3
+        result = ((c_double * width) * len(states))()
+        for state, epoch, out in zip(states, epochs, result):
+            FrameConverter._apply(self.get_teme_epoch_to_date_transform(frame_epoch, epoch), state, out)
+        return result
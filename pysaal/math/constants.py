@@ -9,3 +9,6 @@ SECONDS_TO_MINUTES = 1 / SECONDS_IN_MINUTE
 DAYS_TO_MINUTES = MINUTES_IN_DAY
 MINUTUES_TO_DAYS = 1 / DAYS_TO_MINUTES
 SECONDS_TO_DAYS = 1 / SECONDS_IN_DAY
+METERS_IN_KILOMETER = 1000
+KILOMETERS_TO_METERS = METERS_IN_KILOMETER
+METERS_TO_KILOMETERS = 1 / METERS_IN_KILOMETER
@@ -1,5 +1,7 @@
 from pysaal.time._epoch import Epoch
 from pysaal.time._time_constants import TimeConstants
 from pysaal.time._time_span import TimeSpan
+from pysaal.time._time_scale_converter import TimeScaleConverter
+from pysaal.time._greenwich_angle_cache import GreenwichAngleCache
 
-__all__ = ["Epoch", "TimeConstants", "TimeSpan"]
+__all__ = ["Epoch", "TimeConstants", "TimeSpan", "TimeScaleConverter", "GreenwichAngleCache"]
@@ -1,12 +1,30 @@
-from ctypes import c_char, c_double, c_int
+from ctypes import Array, c_char, c_double, c_int
 from datetime import datetime, timezone
+from math import floor
+from typing import Sequence
 
+from pysaal.enums import TimeScale
 from pysaal.lib import DLLs
+from pysaal.time._time_scale_converter import TimeScaleConverter
+
+#: Width of the date prefix, midnight time suffix and position of the decimal point of each fixed-width DTG format
+_DTG_LAYOUTS = {
+    20: (9, "0000 00.000", 16),
+    19: (9, "000000.000", 15),
+    17: (8, ".00000000", 8),
+    15: (5, "000000.000", 11),
+}
+
+#: Number of time-of-day units in a day for each DTG format (milliseconds, or 1e-8 days for DTG17)
+_DTG_UNITS_PER_DAY = {20: 86400000, 19: 86400000, 17: 100000000, 15: 86400000}
 
 
 class Epoch:
     """Class used to represent an epoch in DS50 format for use with the SAAL library"""
 
+    #: Converter shared by every epoch so that TAI, UT1 and TT are only computed once per unique UTC time
+    TIME_SCALE_CONVERTER = TimeScaleConverter()
+
     def __init__(self, epoch: float):
         """Basic constructor
 
@@ -125,17 +143,17 @@ class Epoch:
     @property
     def tai_ds50(self) -> float:
         """Return the TAI time in DS50 format."""
-        return DLLs.time_func.UTCToTAI(self.utc_ds50)
+        return Epoch.TIME_SCALE_CONVERTER.from_utc(self.utc_ds50, TimeScale.TAI)
 
     @property
     def ut1_ds50(self) -> float:
         """Return the UT1 time in DS50 format."""
-        return DLLs.time_func.UTCToUT1(self.utc_ds50)
+        return Epoch.TIME_SCALE_CONVERTER.from_utc(self.utc_ds50, TimeScale.UT1)
 
     @property
     def tt_ds50(self) -> float:
         """Return the TT time in DS50 format."""
-        return DLLs.time_func.UTCToET(self.utc_ds50)
+        return Epoch.TIME_SCALE_CONVERTER.from_utc(self.utc_ds50, TimeScale.TT)
 
     @property
     def dtg_20(self) -> str:
@@ -165,6 +183,114 @@ class Epoch:
         DLLs.time_func.UTCToDTG15(self.utc_ds50, dtg15)
         return dtg15.value.decode()
 
+    @staticmethod
+    def _get_dtg_function(length: int):
+        functions = {
+            20: DLLs.time_func.UTCToDTG20,
+            19: DLLs.time_func.UTCToDTG19,
+            17: DLLs.time_func.UTCToDTG17,
+            15: DLLs.time_func.UTCToDTG15,
+        }
+        if length not in functions:
+            raise ValueError(f"DTG length must be one of {sorted(functions)}.")
+        return functions[length]
+
+    @staticmethod
+    def _parse_time_of_day(dtg: str, length: int) -> float:
+        """Parse the time-of-day of a fixed-width DTG in days, raising ValueError if it does not fit the layout"""
+        prefix_length, _, decimal = _DTG_LAYOUTS[length]
+        if dtg[decimal] != ".":
+            raise ValueError
+        if length == 17:
+            return float(dtg[8:17])
+        if length == 20:
+            if dtg[8] != " " or dtg[13] != " ":
+                raise ValueError
+            hour, minute, second = int(dtg[9:11]), int(dtg[11:13]), float(dtg[14:20])
+        else:
+            if length == 19 and not dtg[4:7].isalpha():
+                raise ValueError
+            start = prefix_length
+            hour, minute, second = int(dtg[start : start + 2]), int(dtg[start + 2 : start + 4]), float(dtg[start + 4 :])
+        if not (0 <= hour < 24 and 0 <= minute < 60 and 0.0 <= second < 61.0):
+            raise ValueError
+        return (hour * 3600 + minute * 60 + second) / 86400.0
+
+    @staticmethod
+    def parse_dtgs(dtgs: Sequence[str]) -> Array[c_double]:
+        """Convert many DTG strings to UTC days since 1950
+
+        :param dtgs: DTG strings in any of the formats supported by :meth:`from_dtg`
+        :return: A contiguous array of UTC times
+
+        .. note::
+
+            For the fixed-width DTG20, DTG19, DTG17 and DTG15 layouts, the library converts each unique date prefix
+            once and the time of day is parsed without a library call.  Any other string is passed to ``DTGToUTC``.
+        """
+        result = (c_double * len(dtgs))()
+        days: dict[str, float] = {}
+        for i, dtg in enumerate(dtgs):
+            length = len(dtg)
+            if length in _DTG_LAYOUTS:
+                prefix_length, midnight, _ = _DTG_LAYOUTS[length]
+                try:
+                    time_of_day = Epoch._parse_time_of_day(dtg, length)
+                except ValueError:
+                    pass
+                else:
+                    prefix = dtg[:prefix_length]
+                    day = days.get(prefix)
+                    if day is None:
+                        day = DLLs.time_func.DTGToUTC((prefix + midnight).encode())
+                        days[prefix] = day
+                    if day:
+                        result[i] = day + time_of_day
+                        continue
+            result[i] = DLLs.time_func.DTGToUTC(dtg.encode())
+        return result
+
+    @staticmethod
+    def format_dtgs(utc_ds50s: Sequence[float], length: int = 20) -> list[str]:
+        """Convert many UTC times to DTG strings
+
+        :param utc_ds50s: UTC times as days since 1950
+        :param length: The DTG format: 20 for "YYYY/DOY HHMM SS.SSS", 19 for "YYYYMonDDHHMMSS.SSS", 17 for
+            "YYYY/DOY.DDDDDDDD" or 15 for "YYDOYHHMMSS.SSS"
+        :raises ValueError: If the length is not a supported DTG format
+
+        .. note::
+
+            The date prefix is generated by the library once per unique day into a single reused buffer, and the time
+            of day is rounded to the precision of the format and formatted without a library call.
+        """
+        to_dtg = Epoch._get_dtg_function(length)
+        prefix_length = _DTG_LAYOUTS[length][0]
+        units_per_day = _DTG_UNITS_PER_DAY[length]
+        buffer = (c_char * length)()
+        prefixes: dict[int, str] = {}
+        dtgs = []
+        for utc_ds50 in utc_ds50s:
+            day = floor(utc_ds50)
+            units = round((utc_ds50 - day) * units_per_day)
+            if units >= units_per_day:
+                day += 1
+                units -= units_per_day
+            prefix = prefixes.get(day)
+            if prefix is None:
+                to_dtg(float(day), buffer)
+                prefix = buffer.raw[:prefix_length].decode()
+                prefixes[day] = prefix
+            if length == 17:
+                dtgs.append(f"{prefix}.{units:08d}")
+                continue
+            seconds, milliseconds = divmod(units, 1000)
+            minutes, seconds = divmod(seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            separator = " " if length == 20 else ""
+            dtgs.append(f"{prefix}{hours:02d}{minutes:02d}{separator}{seconds:02d}.{milliseconds:03d}")
+        return dtgs
+
     @classmethod
     def from_year_and_days(cls, year: int, days: float) -> "Epoch":
         """Instantiate an Epoch from a year and days.
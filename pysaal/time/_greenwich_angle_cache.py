@@ -0,0 +1,84 @@
+from ctypes import Array, c_double
+from typing import Optional, Sequence
+
+from pysaal.enums import FKModel
+from pysaal.lib import DLLs
+
+
+class GreenwichAngleCache:
+    """Batch evaluation of the right ascension of Greenwich memoized by time.
+
+    Sensor and Earth-fixed pipelines evaluate the Greenwich angle on the same time grid for every satellite, so each
+    angle is computed once per unique time and theory and reused afterwards.  When the theory of the environment
+    constants is used, ``EnvGetFkPtr`` is called once per batch instead of once per time.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.enums import FKModel
+        from pysaal.time import GreenwichAngleCache
+
+        cache = GreenwichAngleCache()
+        grid = [25934.0 + i / 1440 for i in range(1440)]
+        angles = cache.get_angles(grid)
+        fk4_angles = cache.get_angles(grid, FKModel.FK4)
+    """
+
+    #: Default number of angles held in the cache before it is emptied
+    DEFAULT_MAX_CACHE_SIZE = 100000
+
+    def __init__(self, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE):
+
+        #: Number of angles held in the cache before it is emptied
+        self.max_cache_size = max_cache_size
+
+        self._angles: dict[tuple[int, float], float] = {}
+
+    @property
+    def cache_size(self) -> int:
+        """Number of angles held in the cache"""
+        return len(self._angles)
+
+    def clear_cache(self) -> None:
+        """Remove every cached angle"""
+        self._angles.clear()
+
+    def get_angles(self, utc_ds50s: Sequence[float], fk_model: Optional[FKModel] = None) -> Array[c_double]:
+        """Get the Greenwich angle at many times in :math:`radians`
+
+        :param utc_ds50s: Times as days since 1950, passed to the library the same way as :attr:`Epoch.greenwich_angle`
+        :param fk_model: The theory to use.  The FK model of the environment constants is used if not provided.
+        :return: A contiguous array of angles
+        """
+        if fk_model is None:
+            fk_index = DLLs.env_const.EnvGetFkIdx()
+            fk_pointer = DLLs.env_const.EnvGetFkPtr()
+
+            def theta(utc_ds50: float) -> float:
+                return DLLs.time_func.ThetaGrnwch(utc_ds50, fk_pointer)
+
+        elif fk_model == FKModel.FK4:
+            fk_index, theta = fk_model.value, DLLs.time_func.ThetaGrnwchFK4
+        else:
+            fk_index, theta = fk_model.value, DLLs.time_func.ThetaGrnwchFK5
+
+        angles = (c_double * len(utc_ds50s))()
+        for i, utc_ds50 in enumerate(utc_ds50s):
+            key = (fk_index, utc_ds50)
+            angle = self._angles.get(key)
+            if angle is None:
+                if len(self._angles) >= self.max_cache_size:
+                    self._angles.clear()
+                angle = theta(utc_ds50)
+                self._angles[key] = angle
+            angles[i] = angle
+        return angles
+
+    def get_angle(self, utc_ds50: float, fk_model: Optional[FKModel] = None) -> float:
+        """Get the Greenwich angle at a single time in :math:`radians`
+
+        :param utc_ds50: The time as days since 1950
+        :param fk_model: The theory to use.  The FK model of the environment constants is used if not provided.
+        """
+        return self.get_angles([utc_ds50], fk_model)[0]
@@ -1,6 +1,8 @@
-from ctypes import c_double, c_int
+from ctypes import Array, c_double, c_int
 from pathlib import Path
+from typing import Sequence
 
+from pysaal.exceptions import PySAALError
 from pysaal.lib import DLLs
 from pysaal.time._epoch import Epoch
 from pysaal.time._time_span import TimeSpan
@@ -32,6 +34,7 @@ class TimeConstants:
     @staticmethod
     def load_file(file_path: Path) -> None:
         DLLs.time_func.TConLoadFile(file_path.as_posix().encode())
+        Epoch.TIME_SCALE_CONVERTER.clear_cache()
 
     @staticmethod
     def get_loaded_time_span() -> TimeSpan:
@@ -40,3 +43,91 @@ class TimeConstants:
         end = c_double()
         DLLs.time_func.TConTimeSpan(num_loaded, start, end)
         return TimeSpan(Epoch(start.value), Epoch(end.value))
+
+    @staticmethod
+    def add_records(
+        epochs: Sequence[float],
+        tai_minus_utc: Sequence[float],
+        ut1_minus_utc: Sequence[float],
+        ut1_rate: Sequence[float],
+        polar_x: Sequence[float],
+        polar_y: Sequence[float],
+    ) -> None:
+        r"""Add timing constants records to memory from columns without any file I/O
+
+        :param epochs: Reference time of each record in UTC days since 1950
+        :param tai_minus_utc: TAI minus UTC offset of each record in :math:`seconds`
+        :param ut1_minus_utc: UT1 minus UTC offset of each record in :math:`seconds`
+        :param ut1_rate: UT1 rate of change versus UTC of each record in :math:`\frac{ms}{day}`
+        :param polar_x: Polar wander in the X direction of each record in :math:`arcseconds`
+        :param polar_y: Polar wander in the Y direction of each record in :math:`arcseconds`
+        :raises ValueError: If the columns are not the same length
+        :raises PySAALError: If the library rejects one of the records
+
+        .. note::
+
+            Records are added with ``TConAddOne``.  ``TConAddARec`` is not used because the library only keeps the
+            latest record added through it.
+        """
+        columns = (tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y)
+        if any(len(column) != len(epochs) for column in columns):
+            raise ValueError("Every column must be the same length as the epochs.")
+        try:
+            for record in zip(epochs, *columns):
+                if DLLs.time_func.TConAddOne(*record):
+                    raise PySAALError
+        finally:
+            Epoch.TIME_SCALE_CONVERTER.clear_cache()
+
+    @staticmethod
+    def remove_all() -> None:
+        """Remove every timing constants record from memory"""
+        DLLs.time_func.TConRemoveAll()
+        Epoch.TIME_SCALE_CONVERTER.clear_cache()
+
+    @staticmethod
+    def replace_records(
+        epochs: Sequence[float],
+        tai_minus_utc: Sequence[float],
+        ut1_minus_utc: Sequence[float],
+        ut1_rate: Sequence[float],
+        polar_x: Sequence[float],
+        polar_y: Sequence[float],
+    ) -> None:
+        """Replace every timing constants record in memory with records from columns
+
+        See :meth:`add_records` for a description of the parameters.
+        """
+        columns = (tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y)
+        if any(len(column) != len(epochs) for column in columns):
+            raise ValueError("Every column must be the same length as the epochs.")
+        TimeConstants.remove_all()
+        TimeConstants.add_records(epochs, *columns)
+
+    @staticmethod
+    def get_columns(epochs: Sequence[float]) -> tuple[Array[c_double], ...]:
+        r"""Look up the timing constants at many times
+
+        :param epochs: UTC times as days since 1950
+        :return: Contiguous columns of TAI minus UTC and UT1 minus UTC in :math:`seconds`, UT1 rate in
+            :math:`\frac{ms}{day}` and polar wander in X and Y in :math:`arcseconds`
+
+        .. note::
+
+            The library is called once per unique time and the outputs are written through a single set of reused
+            buffers.
+        """
+        columns = tuple((c_double * len(epochs))() for _ in range(5))
+        outputs = tuple(c_double() for _ in range(5))
+        found: dict[float, int] = {}
+        for i, utc_ds50 in enumerate(epochs):
+            j = found.get(utc_ds50)
+            if j is None:
+                DLLs.time_func.UTCToTConRec(utc_ds50, *outputs)
+                for column, output in zip(columns, outputs):
+                    column[i] = output.value
+                found[utc_ds50] = i
+            else:
+                for column in columns:
+                    column[i] = column[j]
+        return columns
@@ -0,0 +1,123 @@
+from ctypes import Array, c_double
+from typing import Sequence
+
+from pysaal.enums import TimeScale
+from pysaal.lib import DLLs
+from pysaal.math.constants import SECONDS_TO_DAYS
+
+#: Offset of Terrestrial Time from International Atomic Time in :math:`days`
+_TT_MINUS_TAI = 32.184 * SECONDS_TO_DAYS
+
+#: Number of fixed-point iterations used to invert the UTC to UT1 conversion
+_UT1_ITERATIONS = 3
+
+
+class TimeScaleConverter:
+    """Batch conversion of DS50 times between UTC, TAI, UT1 and TT with results cached per unique UTC epoch.
+
+    Each scale of a UTC epoch is computed the first time it is requested and reused for every later conversion, so a
+    catalog propagated onto a common time grid only calls the library once per grid point and scale.  Every
+    :class:`Epoch` shares the converter held by :attr:`Epoch.TIME_SCALE_CONVERTER`.
+
+    .. note::
+
+        The cache must be cleared when timing constants are loaded.  :class:`TimeConstants` and the VCM loaders do this
+        for the shared converter, since every VCM also carries timing constants.
+
+    :example:
+
+    .. code-block:: python
+
+        from pysaal.enums import TimeScale
+        from pysaal.time import TimeScaleConverter
+
+        converter = TimeScaleConverter()
+        tt = converter.convert([25934.0, 25934.5, 25935.0], TimeScale.UTC, TimeScale.TT)
+    """
+
+    #: Default number of conversions held in the cache before it is emptied
+    DEFAULT_MAX_CACHE_SIZE = 100000
+
+    def __init__(self, max_cache_size: int = DEFAULT_MAX_CACHE_SIZE):
+
+        #: Number of conversions held in the cache before it is emptied
+        self.max_cache_size = max_cache_size
+
+        self._values: dict[tuple[TimeScale, float], float] = {}
+
+    @property
+    def cache_size(self) -> int:
+        """Number of conversions held in the cache"""
+        return len(self._values)
+
+    def clear_cache(self) -> None:
+        """Remove every cached conversion"""
+        self._values.clear()
+
+    @staticmethod
+    def _compute(utc_ds50: float, target: TimeScale) -> float:
+        if target == TimeScale.TAI:
+            return DLLs.time_func.UTCToTAI(utc_ds50)
+        if target == TimeScale.UT1:
+            return DLLs.time_func.UTCToUT1(utc_ds50)
+        return DLLs.time_func.UTCToET(utc_ds50)
+
+    def from_utc(self, utc_ds50: float, target: TimeScale) -> float:
+        """Convert a single UTC time to another scale
+
+        :param utc_ds50: The UTC time as days since 1950
+        :param target: The scale of the output.  See :ref:`time_scale` for options.
+        """
+        if target == TimeScale.UTC:
+            return utc_ds50
+        key = (target, utc_ds50)
+        value = self._values.get(key)
+        if value is None:
+            if len(self._values) >= self.max_cache_size:
+                self._values.clear()
+            value = TimeScaleConverter._compute(utc_ds50, target)
+            self._values[key] = value
+        return value
+
+    def to_utc(self, ds50: float, source: TimeScale) -> float:
+        """Convert a single time to UTC
+
+        :param ds50: The time as days since 1950
+        :param source: The scale of the input
+
+        .. note::
+
+            UT1 has no inverse in the library, so it is inverted by fixed-point iteration on the UTC to UT1 offset.
+        """
+        if source == TimeScale.UTC:
+            return ds50
+        if source == TimeScale.TAI:
+            return DLLs.time_func.TAIToUTC(ds50)
+        if source == TimeScale.TT:
+            return DLLs.time_func.TAIToUTC(ds50 - _TT_MINUS_TAI)
+        utc_ds50 = ds50
+        for _ in range(_UT1_ITERATIONS):
+            utc_ds50 = ds50 - (DLLs.time_func.UTCToUT1(utc_ds50) - utc_ds50)
+        return utc_ds50
+
+    def convert(self, values: Sequence[float], source: TimeScale, target: TimeScale) -> Array[c_double]:
+        """Convert a batch of DS50 times between scales
+
+        :param values: The times as days since 1950
+        :param source: The scale of the input.  See :ref:`time_scale` for options.
+        :param target: The scale of the output
+        :return: A contiguous array of the converted times
+        """
+        result = (c_double * len(values))()
+        if source == target:
+            result[:] = values  # type: ignore
+            return result
+        converted: dict[float, float] = {}
+        for i, ds50 in enumerate(values):
+            value = converted.get(ds50)
+            if value is None:
+                utc_ds50 = self.to_utc(ds50, source)
+                value = self.from_utc(utc_ds50, target)
+                converted[ds50] = value
+            result[i] = value
+        return result
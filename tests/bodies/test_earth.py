@@ -1,5 +1,10 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from pysaal.bodies import Earth
-from pysaal.enums import EarthModel
+from pysaal.enums import EarthModel, FKModel
+from pysaal.lib._env_const import XF_GEOCON_MU
 
 
 def test_j2():
@@ -90,3 +95,24 @@ def test_flattening():
 
 def test_rotation_rate():
     assert Earth.get_rotation_rate() == 0.0043752690880113
+
+
+def test_get_constants():
+    constants = Earth.get_constants()
+    assert Earth.get_constants() is constants
+    assert constants.model == Earth.get_model()
+    assert constants.j2 == Earth.get_j2()
+    assert constants.mu == Earth._get_constant(XF_GEOCON_MU)
+    assert constants.fk_model == FKModel.FK5
+    with pytest.raises(FrozenInstanceError):
+        constants.mu = 0.0  # type: ignore
+
+
+def test_use_model():
+    default_model = Earth.get_model()
+    with Earth.use_model(EarthModel.WGS_84) as constants:
+        assert constants.model == EarthModel.WGS_84
+        assert constants.mu == 398600.5
+        assert Earth.get_mu() == 398600.5
+    assert Earth.get_model() == default_model
+    assert Earth.get_constants().model == default_model
@@ -0,0 +1,47 @@
+import pytest
+
+from pysaal.bodies import EclipseTimeline, Sun
+from pysaal.elements import TLE
+from pysaal.time import TimeSpan
+
+LINE_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+LINE_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+
+
+@pytest.fixture
+def iss_timeline():
+    tle = TLE.from_lines(LINE_1, LINE_2)
+    timeline = EclipseTimeline.from_tle(tle, TimeSpan(tle.epoch, tle.epoch + 1))
+    yield timeline
+    tle.destroy()
+
+
+def test_get_shadow_functions():
+    sun = [Sun.RADIUS * 215, 0.0, 0.0]
+    penumbra, umbra = EclipseTimeline.get_shadow_functions([-7000.0, 0.0, 0.0], sun)
+    assert penumbra < 0 and umbra < 0
+    penumbra, umbra = EclipseTimeline.get_shadow_functions([7000.0, 0.0, 0.0], sun)
+    assert penumbra > 0 and umbra > 0
+
+
+def test_umbra_inside_penumbra(iss_timeline):
+    assert len(iss_timeline.umbra) > 10
+    assert len(iss_timeline.penumbra) >= len(iss_timeline.umbra)
+    for umbra in iss_timeline.umbra:
+        assert any(p.start <= umbra.start and umbra.end <= p.end for p in iss_timeline.penumbra)
+
+
+def test_umbra_duration(iss_timeline):
+    for umbra in iss_timeline.umbra:
+        if umbra.start > iss_timeline.span.start and umbra.end < iss_timeline.span.end:
+            assert 20 < umbra.minutes < 40
+
+
+def test_from_catalog():
+    tle = TLE.from_lines(LINE_1, LINE_2)
+    span = TimeSpan(tle.epoch, tle.epoch + 0.25)
+    timelines = EclipseTimeline.from_catalog([tle], span)
+    single = EclipseTimeline.from_tle(tle, span)
+    assert timelines[0].satellite_id == 25544
+    assert timelines[0].umbra[0].start.utc_ds50 == pytest.approx(single.umbra[0].start.utc_ds50)
+    tle.destroy()
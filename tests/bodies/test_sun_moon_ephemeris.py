@@ -0,0 +1,40 @@
+import pytest
+
+from pysaal.bodies import Moon, Sun, SunMoonEphemeris
+from pysaal.time import Epoch
+
+START = Epoch(27368.0)
+
+
+def test_get_jpl_positions():
+    epochs = [START, START + 0.5]
+    sun, moon = SunMoonEphemeris.get_jpl_positions(epochs)
+    for i, epoch in enumerate(epochs):
+        sun_vec = Sun.get_jpl_position(epoch)
+        moon_vec = Moon.get_jpl_position(epoch)
+        assert sun[i][0] == sun_vec.x
+        assert sun[i][2] == sun_vec.z
+        assert moon[i][1] == moon_vec.y
+
+
+def test_get_positions():
+    cache = SunMoonEphemeris(START, START + 3)
+    epochs = [START + 0.1, START + 1.37, START + 2.99]
+    sun, moon = cache.get_positions(epochs)
+    jpl_sun, jpl_moon = SunMoonEphemeris.get_jpl_positions(epochs)
+    for i in range(len(epochs)):
+        for axis in range(3):
+            assert sun[i][axis] == pytest.approx(jpl_sun[i][axis], abs=1e-3)
+            assert moon[i][axis] == pytest.approx(jpl_moon[i][axis], abs=1e-3)
+
+
+def test_outside_window():
+    cache = SunMoonEphemeris(START, START + 1)
+    epoch = START + 5
+    assert not cache.covers(epoch)
+    assert cache.get_sun_position(epoch).x == Sun.get_jpl_position(epoch).x
+
+
+def test_invalid_window():
+    with pytest.raises(ValueError, match="must be after the start"):
+        SunMoonEphemeris(START, START)
@@ -0,0 +1,10 @@
+import pytest
+
+from pysaal.concurrency import DLLExecutor
+
+
+@pytest.fixture(autouse=True)
+def shutdown_default_executor():
+    yield
+    if DLLExecutor._default is not None:
+        DLLExecutor._default.shutdown()
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from pysaal.concurrency import AsyncPropagator, DLLExecutor
+from pysaal.elements import TLE, TLECatalog
+
+LINE_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+LINE_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+
+
+def test_aget_state_at_epoch():
+    tle = TLE.from_lines(LINE_1, LINE_2)
+    epoch = tle.epoch + 0.5
+    expected = tle.get_state_at_epoch(epoch).cartesian_elements
+    tle.destroy()
+
+    async def main():
+        return await tle.aget_state_at_epoch(epoch)
+
+    state = asyncio.run(main())
+    assert not tle.loaded
+    tle.load()
+    tle.destroy()
+    assert state.cartesian_elements.x == pytest.approx(expected.x)
+    assert state.cartesian_elements.vz == pytest.approx(expected.vz)
+
+
+def test_requests_are_coalesced():
+    tle = TLE.from_lines(LINE_1, LINE_2)
+    epochs = [tle.epoch + 0.1 * i for i in range(4)]
+
+    async def main(propagator):
+        requests = [propagator.get_state_at_epoch(tle, epoch) for epoch in epochs * 5]
+        return await asyncio.gather(*requests)
+
+    with DLLExecutor() as executor:
+        propagator = AsyncPropagator(executor, window_seconds=0.05)
+        states = asyncio.run(main(propagator))
+        assert propagator.batch_count == 1
+        assert executor.request_count == 1
+    assert len(states) == 20
+    assert states[0] is states[4]
+    assert states[0] is not states[1]
+
+
+def test_apropagate():
+    catalog = TLECatalog.from_lines([(LINE_1, LINE_2)] * 3)
+    first = catalog[0]
+    epochs = [first.epoch + 0.25, first.epoch + 0.5]
+    expected = first.get_state_at_epoch(epochs[1]).cartesian_elements
+    first.destroy()
+
+    async def main():
+        return await catalog.apropagate(epochs)
+
+    results = asyncio.run(main())
+    assert not catalog.loaded
+    assert len(results) == 3
+    for states in results:
+        assert states[1][0] == pytest.approx(expected.x)
+        assert states[1][3] == pytest.approx(expected.vx)
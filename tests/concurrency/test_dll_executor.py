@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from pysaal.concurrency import DLLExecutor
+from pysaal.elements import TLE
+from pysaal.elements._tle import _PENDING_REMOVALS
+from pysaal.enums import ReferenceFrame
+from pysaal.exceptions import PySAALError
+from pysaal.frames import FrameConverter
+from pysaal.time import Epoch
+
+LINE_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+LINE_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+
+
+def test_propagate_from_many_threads():
+    tle = TLE.from_lines(LINE_1, LINE_2)
+    epochs = [tle.epoch + 0.1 * i for i in range(5)]
+    expected = [tle.get_state_at_epoch(epoch).cartesian_elements for epoch in epochs]
+
+    with DLLExecutor() as executor:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = list(pool.map(lambda _: executor.propagate(tle, epochs), range(32)))
+        results = [future.result() for future in futures]
+        assert executor.cache_size == 0
+    assert tle.loaded
+    assert TLE.get_number_in_memory() == 1
+    tle.destroy()
+    for states in results:
+        for state, cartesian in zip(states, expected):
+            assert state[0] == pytest.approx(cartesian.x)
+            assert state[4] == pytest.approx(cartesian.vy)
+
+
+def test_load_tle_is_released_after_batch():
+    tle = TLE.from_lines(LINE_1, LINE_2)
+    tle.destroy()
+
+    with DLLExecutor() as executor:
+        executor.propagate(tle, [tle.epoch]).result()
+        assert executor.cache_size == 0
+    tle.load()
+    assert TLE.get_number_in_memory() == 1
+    tle.destroy()
+
+
+def test_garbage_collected_keys_are_removed_by_owner():
+    release = Event()
+    with DLLExecutor() as executor:
+        blocker = executor.submit(release.wait)
+        tle = TLE.from_lines(LINE_1, LINE_2)
+        tle.load()
+        key = tle.key
+        del tle
+        assert key in _PENDING_REMOVALS
+        assert TLE.get_number_in_memory() == 1
+        release.set()
+        blocker.result()
+        executor.submit(lambda: None).result()
+        assert key not in _PENDING_REMOVALS
+        assert TLE.get_number_in_memory() == 0
+
+
+def test_load_removes_pending_key():
+    release = Event()
+    with DLLExecutor() as executor:
+        blocker = executor.submit(release.wait)
+        tle = TLE.from_lines(LINE_1, LINE_2)
+        tle.load()
+        key = tle.key
+        del tle
+        tle = TLE.from_lines(LINE_1, LINE_2)
+        tle.load()
+        assert tle.key == key
+        assert key not in _PENDING_REMOVALS
+        assert TLE.get_number_in_memory() == 1
+        release.set()
+        blocker.result()
+    tle.destroy()
+    assert TLE.get_number_in_memory() == 0
+
+
+def test_requests_are_batched():
+    release = Event()
+    executor = DLLExecutor()
+    blocker = executor.submit(release.wait)
+    futures = [executor.submit(lambda i=i: i * i) for i in range(10)]
+    release.set()
+    assert [future.result() for future in futures] == [i * i for i in range(10)]
+    assert blocker.result()
+    executor.shutdown()
+    assert executor.batch_count <= 3
+    assert executor.request_count == 11
+
+
+def test_convert():
+    states = [[6778.0, 0.0, 0.0, 0.0, 7.668, 0.0]]
+    epochs = [Epoch(27368.0)]
+    expected = FrameConverter().convert(states, epochs, ReferenceFrame.TEME, ReferenceFrame.J2000)
+    with DLLExecutor() as executor:
+        result = executor.convert(states, epochs, ReferenceFrame.TEME, ReferenceFrame.J2000).result()
+    assert result[0][:] == pytest.approx(expected[0][:])
+
+
+def test_exceptions_are_returned():
+    with DLLExecutor() as executor:
+        future = executor.submit(TLE.from_key, 1)
+        with pytest.raises(PySAALError):
+            future.result()
+
+
+def test_submit_after_shutdown():
+    executor = DLLExecutor()
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
@@ -0,0 +1,45 @@
+import pytest
+
+from pysaal.conjunction import CollisionProbability
+from pysaal.covariance import CovarianceStack
+from pysaal.enums import CovarianceFrame
+
+
+def _get_isotropic_stack(size: int, variance: float) -> CovarianceStack:
+    stack = CovarianceStack(size, CovarianceFrame.ECI)
+    for matrix in stack.c_array:
+        for i in range(6):
+            matrix[i][i] = variance
+    return stack
+
+
+def test_compute_2d():
+    assert CollisionProbability.compute_2d(0, 0, 1, 1, 0.1) == pytest.approx(0.005, rel=1e-2)
+    assert CollisionProbability.compute_2d(0, 0, 1, 1, 10) == pytest.approx(1.0)
+    assert CollisionProbability.compute_2d(50, 0, 1, 1, 0.1) == pytest.approx(0.0)
+
+
+def test_compute():
+    primary_states = [[7000.0, 0.0, 0.0, 0.0, 7.5, 0.0], [7000.0, 0.0, 0.0, 0.0, 7.5, 0.0]]
+    secondary_states = [[7000.0, 0.0, 0.0, 0.0, 0.0, 7.5], [7010.0, 0.0, 0.0, 0.0, 0.0, 7.5]]
+    primary = _get_isotropic_stack(2, 0.5)
+    secondary = _get_isotropic_stack(2, 0.5)
+    pc = CollisionProbability.compute(primary_states, primary, secondary_states, secondary, [0.1, 0.1])
+    assert pc[0] == pytest.approx(CollisionProbability.compute_2d(0, 0, 1, 1, 0.1))
+    assert pc[0] > pc[1]
+    assert pc[1] == pytest.approx(CollisionProbability.compute_2d(10, 0, 1, 1, 0.1))
+
+
+def test_compute_uvw():
+    primary_states = [[7000.0, 0.0, 0.0, 0.0, 7.5, 0.0]]
+    secondary_states = [[7000.5, 0.0, 0.0, 0.0, 0.0, 7.5]]
+    eci = _get_isotropic_stack(1, 0.5)
+    uvw = eci.to_frame(CovarianceFrame.UVW, primary_states)
+    pc_eci = CollisionProbability.compute(primary_states, eci, secondary_states, eci, [0.02])
+    pc_uvw = CollisionProbability.compute(primary_states, uvw, secondary_states, eci, [0.02])
+    assert pc_uvw[0] == pytest.approx(pc_eci[0])
+
+
+def test_length_mismatch():
+    with pytest.raises(ValueError, match="same length"):
+        CollisionProbability.compute([], _get_isotropic_stack(1, 1.0), [], _get_isotropic_stack(1, 1.0), [0.1])
@@ -0,0 +1,69 @@
+import pytest
+
+from pysaal.covariance import CovarianceStack
+from pysaal.enums import CovarianceFrame
+from pysaal.time import Epoch
+
+STATES = [
+    [6778.0, 0.0, 0.0, 0.0, 7.668, 0.0],
+    [-4390.0, 4390.0, 2000.0, -5.1, -5.1, 1.2],
+]
+
+
+def _get_diagonal_stack(frame: CovarianceFrame) -> CovarianceStack:
+    stack = CovarianceStack(len(STATES), frame)
+    for matrix in stack.c_array:
+        for i in range(6):
+            matrix[i][i] = (i + 1) * 0.1
+    return stack
+
+
+def test_get_path():
+    assert CovarianceStack._get_path(CovarianceFrame.ECI, CovarianceFrame.PTW) == [
+        CovarianceFrame.ECI,
+        CovarianceFrame.UVW,
+        CovarianceFrame.PTW,
+    ]
+    assert CovarianceStack._get_path(CovarianceFrame.EFG, CovarianceFrame.UVW) == [
+        CovarianceFrame.EFG,
+        CovarianceFrame.ECI,
+        CovarianceFrame.UVW,
+    ]
+    assert CovarianceStack._get_path(CovarianceFrame.ECI, CovarianceFrame.EFG) == [
+        CovarianceFrame.ECI,
+        CovarianceFrame.EFG,
+    ]
+
+
+def test_lower_triangles():
+    stack = _get_diagonal_stack(CovarianceFrame.ECI)
+    rebuilt = CovarianceStack.from_lower_triangles(stack.lower_triangles, CovarianceFrame.ECI)
+    for i in range(6):
+        assert rebuilt[1][i][i] == stack[1][i][i]
+
+
+def test_uvw_round_trip():
+    eci = _get_diagonal_stack(CovarianceFrame.ECI)
+    ptw = eci.to_frame(CovarianceFrame.PTW, STATES)
+    assert ptw.frame == CovarianceFrame.PTW
+    eci_2 = ptw.to_frame(CovarianceFrame.ECI, STATES)
+    for i in range(6):
+        for j in range(6):
+            assert eci_2[1][i][j] == pytest.approx(eci[1][i][j], abs=1e-12)
+
+
+def test_efg_round_trip():
+    epochs = [Epoch(27368.0), Epoch(27368.5)]
+    eci = _get_diagonal_stack(CovarianceFrame.ECI)
+    efg = eci.to_frame(CovarianceFrame.EFG, epochs=epochs)
+    eci_2 = efg.to_frame(CovarianceFrame.ECI, epochs=epochs)
+    for i in range(6):
+        assert eci_2[0][i][i] == pytest.approx(eci[0][i][i])
+
+
+def test_missing_inputs():
+    eci = _get_diagonal_stack(CovarianceFrame.ECI)
+    with pytest.raises(ValueError, match="states are required"):
+        eci.to_frame(CovarianceFrame.UVW)
+    with pytest.raises(ValueError, match="epochs are required"):
+        eci.to_frame(CovarianceFrame.EFG)
@@ -8,6 +8,7 @@ from pysaal.elements import (
     KeplerianElements,
     MeanElements,
     SPVector,
+    VCM,
 )
 from pysaal.enums import Classification, TLEType
 
@@ -61,6 +62,18 @@ def expected_sp_vector(expected_tle):
     return sp
 
 
+@pytest.fixture
+def expected_vcm(expected_sp_vector):
+    vcm = VCM()
+    vcm.satellite_id = 25544
+    vcm.designator = "98067A"
+    vcm.epoch = expected_sp_vector.epoch
+    vcm.cartesian_elements = expected_sp_vector.cartesian_elements
+    vcm.b_term = expected_sp_vector.b_term
+    vcm.agom = expected_sp_vector.agom
+    return vcm
+
+
 @pytest.fixture
 def expected_equinoctial():
     return EquinoctialElements(
@@ -118,3 +118,24 @@ def test_tle_from_sp_vector(expected_sp_vector, expected_tle):
     expected_tle.destroy()
     assert max(dists) < 5
     assert max(dists) > 0
+
+
+def test_tle_from_teme_states(expected_tle):
+    state = expected_tle.cartesian_elements
+    states = [[state.x, state.y, state.z, state.vx, state.vy, state.vz]] * 2
+    epochs = [expected_tle.epoch, expected_tle.epoch]
+    tle_type = expected_tle.ephemeris_type
+    catalog, status = ConvertElements.tle.from_teme_states(states, epochs, [1, 2], tle_type, [expected_tle.b_star] * 2)
+    assert list(status) == [0, 0]
+    assert catalog.satellite_ids == [1, 2]
+    assert catalog.inclinations[0] == pytest.approx(expected_tle.inclination, abs=1e-3)
+    assert catalog.mean_motions[1] == pytest.approx(expected_tle.mean_motion, abs=1e-5)
+    assert catalog[0].b_star == pytest.approx(expected_tle.b_star)
+    expected_tle.destroy()
+
+
+def test_tle_from_teme_states_invalid(expected_tle):
+    with pytest.raises(ValueError, match="same length"):
+        ConvertElements.tle.from_teme_states([[7000.0, 0, 0, 0, 7.5, 0]], [expected_tle.epoch], [1, 2])
+    with pytest.raises(ValueError, match="SP element sets"):
+        ConvertElements.tle.from_teme_states([], [], [], TLEType.SP)
@@ -0,0 +1,43 @@
+from math import isnan
+
+import pytest
+
+from pysaal.elements import TLE, DecayScreener, TLECatalog
+from pysaal.lib._tle import XA_TLE_ECCEN, XA_TLE_INCLI, XA_TLE_MNMOTN, XA_TLE_SATNUM
+
+
+@pytest.fixture
+def catalog(expected_tle):
+    catalog = TLECatalog.from_tles([expected_tle] * 3)
+    catalog.set_column(XA_TLE_SATNUM, [25544, 25545, 25546])
+    catalog.set_column(XA_TLE_MNMOTN, [expected_tle.mean_motion, 1.0027, 12.0])
+    catalog.set_column(XA_TLE_INCLI, [expected_tle.inclination, 0.05, expected_tle.inclination])
+    catalog.set_column(XA_TLE_ECCEN, [expected_tle.eccentricity, 0.0001, 0.001])
+    yield catalog
+    catalog.destroy()
+
+
+def test_get_perigee_heights(catalog):
+    heights = DecayScreener.get_perigee_heights(catalog)
+    assert heights[0] == pytest.approx(410.0, abs=20.0)
+    assert heights[1] == pytest.approx(35786.0, abs=50.0)
+    assert heights[2] > DecayScreener.DEFAULT_MAX_PERIGEE_HEIGHT
+
+
+def test_screen_catalog(catalog, expected_tle):
+    decay_epochs = DecayScreener().screen_catalog(catalog)
+    assert decay_epochs[0] > expected_tle.epoch.utc_ds50
+    assert isnan(decay_epochs[1])
+    assert isnan(decay_epochs[2])
+    assert catalog.keys[0] and not catalog.keys[1] and not catalog.keys[2]
+    assert decay_epochs[0] == pytest.approx(catalog[0].get_decay_epoch(DecayScreener.DEFAULT_F10_AVERAGE).utc_ds50)
+
+
+def test_screen_loaded(catalog):
+    catalog.load()
+    keys, decay_epochs = DecayScreener().screen_loaded()
+    assert len(keys) == len(decay_epochs) == 3
+    assert not isnan(decay_epochs[0])
+    assert isnan(decay_epochs[1])
+    catalog.destroy()
+    assert TLE.get_number_in_memory() == 0
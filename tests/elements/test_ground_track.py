@@ -0,0 +1,48 @@
+import pytest
+
+from pysaal.elements import GroundTrack
+from pysaal.time import TimeSpan
+
+
+def test_get_time_grid(expected_tle):
+    span = TimeSpan(expected_tle.epoch, expected_tle.epoch + 1)
+    times = GroundTrack.get_time_grid(span, 10)
+    assert len(times) == 145
+    assert times[0] == expected_tle.epoch.utc_ds50
+    assert times[-1] == pytest.approx(span.end.utc_ds50)
+
+
+def test_from_tle(expected_tle):
+    span = TimeSpan(expected_tle.epoch, expected_tle.epoch + 0.1)
+    track = GroundTrack.from_tle(expected_tle, span, 5)
+    assert track.satellite_id == expected_tle.satellite_id
+    assert track[0].latitude == pytest.approx(expected_tle.latitude)
+    assert track[0].altitude == pytest.approx(expected_tle.altitude)
+    assert all(-180 <= lon < 180 for lon in track.longitudes)
+    assert all(abs(lat) <= expected_tle.inclination + 0.1 for lat in track.latitudes)
+    expected_tle.destroy()
+
+
+def test_from_catalog(expected_tle):
+    span = TimeSpan(expected_tle.epoch, expected_tle.epoch + 0.1)
+    tracks = GroundTrack.from_catalog([expected_tle, expected_tle], span, 5)
+    assert len(tracks) == 2
+    assert tracks[0].longitudes == tracks[1].longitudes
+    expected_tle.destroy()
+
+
+def test_split_at_antimeridian():
+    track = GroundTrack(1, 4)
+    track.times[:] = [0.0, 1.0, 2.0, 3.0]
+    track.c_array[0][:] = [0.0, 170.0, 400.0]
+    track.c_array[1][:] = [10.0, 178.0, 400.0]
+    track.c_array[2][:] = [20.0, -178.0, 400.0]
+    track.c_array[3][:] = [30.0, -170.0, 400.0]
+    segments = track.split_at_antimeridian()
+    assert len(segments) == 2
+    assert segments[0].longitudes == [170.0, 178.0, 180.0]
+    assert segments[1].longitudes == [-180.0, -178.0, -170.0]
+    assert segments[0].latitudes[-1] == pytest.approx(15.0)
+    assert segments[1].times[0] == pytest.approx(1.5)
+    geojson = track.to_geojson()
+    assert geojson["geometry"]["coordinates"][1][0] == [-180.0, pytest.approx(15.0)]
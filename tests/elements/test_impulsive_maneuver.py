@@ -0,0 +1,26 @@
+import pytest
+
+from pysaal.elements import ImpulsiveManeuver
+from pysaal.lib._el_ops import XA_VP_IMPULSE_V, XA_VP_REPETITIONS, XA_VP_TIMEVAL
+from pysaal.time import Epoch
+
+
+def test_c_array():
+    maneuver = ImpulsiveManeuver(Epoch(27368.5), [0.0, 0.002, 0.0], 2, 90.0)
+    xa_vp = maneuver.c_array
+    assert xa_vp[XA_VP_TIMEVAL] == 27368.5
+    assert xa_vp[XA_VP_IMPULSE_V] == 0.002
+    assert xa_vp[XA_VP_REPETITIONS] == 2
+
+
+def test_get_events():
+    events = ImpulsiveManeuver(Epoch(27368.5), [0.0, 0.002, 0.0], 2, 720.0).get_events()
+    assert [utc_ds50 for utc_ds50, _ in events] == pytest.approx([27368.5, 27369.0, 27369.5])
+
+
+def test_get_inertial_delta_v():
+    position = [7000.0, 0.0, 0.0]
+    velocity = [0.0, 7.5, 0.0]
+    assert ImpulsiveManeuver.get_inertial_delta_v(position, velocity, [0.001, 0.0, 0.0]) == pytest.approx([0.001, 0, 0])
+    assert ImpulsiveManeuver.get_inertial_delta_v(position, velocity, [0.0, 0.002, 0.0]) == pytest.approx([0, 0.002, 0])
+    assert ImpulsiveManeuver.get_inertial_delta_v(position, velocity, [0.0, 0.0, 0.003]) == pytest.approx([0, 0, 0.003])
@@ -0,0 +1,28 @@
+import pytest
+
+from pysaal.elements import TLE, ImpulsiveManeuver, ManeuverPlanner
+
+
+def test_propagate(expected_tle):
+    planner = ManeuverPlanner(expected_tle)
+    burn_epoch = expected_tle.epoch + 0.1
+    epochs = [expected_tle.epoch, expected_tle.epoch + 1.0]
+    coast = planner.propagate([], epochs)
+    burned = planner.propagate([ImpulsiveManeuver(burn_epoch, [0.0, 0.01, 0.0])], epochs)
+    assert burned[0][:] == pytest.approx(coast[0][:])
+    assert burned[1][:] != pytest.approx(coast[1][:])
+    assert TLE.get_number_in_memory() == 1
+    expected_tle.destroy()
+
+
+def test_sweep(expected_tle):
+    planner = ManeuverPlanner(expected_tle)
+    burn_epoch = expected_tle.epoch + 0.1
+    variants = [[ImpulsiveManeuver(burn_epoch, [0.0, dv, 0.0])] for dv in (0.0, 0.005)]
+    epochs = [expected_tle.epoch + 1.0]
+    serial = planner.sweep(variants, epochs, max_workers=1)
+    parallel = planner.sweep(variants, epochs, max_workers=2)
+    assert len(parallel) == 2
+    for expected, actual in zip(serial, parallel):
+        assert actual[0][:] == pytest.approx(expected[0][:])
+    expected_tle.destroy()
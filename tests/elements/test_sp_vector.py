@@ -1,6 +1,9 @@
 import pytest
 
 from pysaal.configs import MAX_DESIGNATOR_LENGTH, MAX_SATELLITE_ID
+from pysaal.defaults import DEFAULT_CLASSIFICATION
+from pysaal.elements import ImpulsiveManeuver, SPVector
+from pysaal.lib._sp_vec import XS_SPVEC_SECCLASS_0_1
 
 
 def test_designator(expected_sp_vector):
@@ -15,3 +18,47 @@ def test_satellite_id(expected_sp_vector):
     assert expected_sp_vector.satellite_id == 25545
     with pytest.raises(ValueError, match="Satellite ID cannot exceed"):
         expected_sp_vector.satellite_id = MAX_SATELLITE_ID + 1
+
+
+def test_lines(expected_sp_vector):
+    line_1, line_2 = expected_sp_vector.lines
+    sp = SPVector.from_lines(line_1, line_2)
+    assert sp.satellite_id == expected_sp_vector.satellite_id
+    assert sp.epoch.utc_ds50 == pytest.approx(expected_sp_vector.epoch.utc_ds50)
+    assert sp.position.x == pytest.approx(expected_sp_vector.position.x)
+    assert sp.velocity.y == pytest.approx(expected_sp_vector.velocity.y)
+    assert sp.b_term == pytest.approx(expected_sp_vector.b_term)
+
+
+def test_c_arrays(expected_sp_vector):
+    sp = SPVector.from_c_arrays(*expected_sp_vector.c_arrays)
+    assert sp.designator == "98067A"
+    assert sp.classification == expected_sp_vector.classification
+    assert sp.velocity.z == pytest.approx(expected_sp_vector.velocity.z)
+
+
+def test_c_arrays_without_classification(expected_sp_vector):
+    expected_sp_vector.designator = "98067A"
+    c_double_array, c_char_array = expected_sp_vector.c_arrays
+    c_char_array[XS_SPVEC_SECCLASS_0_1] = b"\x00"
+    sp = SPVector.from_c_arrays(c_double_array, c_char_array)
+    assert sp.classification == DEFAULT_CLASSIFICATION
+    assert sp.designator == "98067A"
+
+
+def test_load(expected_sp_vector):
+    expected_sp_vector.load()
+    assert expected_sp_vector.loaded
+    assert SPVector.get_number_in_memory() == 1
+    sp = SPVector.from_key(expected_sp_vector.key)
+    assert sp.satellite_id == expected_sp_vector.satellite_id
+    expected_sp_vector.destroy()
+    assert SPVector.get_number_in_memory() == 0
+
+
+def test_add_maneuvers(expected_sp_vector):
+    expected_sp_vector.add_maneuvers([ImpulsiveManeuver(expected_sp_vector.epoch + 0.1, [0.0, 0.001, 0.0])])
+    assert expected_sp_vector.loaded
+    assert SPVector.get_number_in_memory() == 1
+    expected_sp_vector.destroy()
+    assert SPVector.get_number_in_memory() == 0
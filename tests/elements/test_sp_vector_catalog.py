@@ -0,0 +1,30 @@
+import pytest
+
+from pysaal.elements import SPVector, SPVectorCatalog
+
+
+def test_from_sp_vectors(expected_sp_vector):
+    catalog = SPVectorCatalog.from_sp_vectors([expected_sp_vector, expected_sp_vector])
+    assert len(catalog) == 2
+    assert catalog.satellite_ids == [1, 1]
+    assert catalog.epochs[0] == expected_sp_vector.epoch.utc_ds50
+    assert catalog.positions[1][0] == expected_sp_vector.position.x
+    assert catalog.velocities[1][2] == pytest.approx(expected_sp_vector.velocity.z)
+    assert catalog[0].b_term == expected_sp_vector.b_term
+
+
+def test_from_lines(expected_sp_vector):
+    catalog = SPVectorCatalog.from_lines([expected_sp_vector.lines])
+    assert catalog[0].position.y == pytest.approx(expected_sp_vector.position.y)
+
+
+def test_write_and_load(expected_sp_vector, tmp_path):
+    SPVectorCatalog.from_sp_vectors([expected_sp_vector]).write(tmp_path / "sp.txt")
+    with open(tmp_path / "sp.txt", "r") as f:
+        lines = f.read().splitlines()
+    assert tuple(lines) == expected_sp_vector.lines
+    catalog = SPVectorCatalog.from_file(tmp_path / "sp.txt")
+    assert catalog.loaded
+    assert SPVector.get_number_in_memory() == 1
+    catalog.destroy()
+    assert SPVector.get_number_in_memory() == 0
@@ -1,7 +1,10 @@
+import gc
+
 import pytest
 
-from pysaal.elements import TLE
-from pysaal.lib._tle import XA_TLE_SIZE, XS_TLE_SIZE
+from pysaal.elements import TLE, ImpulsiveManeuver
+from pysaal.enums import TLEType
+from pysaal.lib._tle import XA_TLE_MNMOTN, XA_TLE_SIZE, XS_TLE_SIZE
 from pysaal.time import Epoch
 
 
@@ -93,6 +96,13 @@ def test_get_number_in_memory():
     assert TLE.get_number_in_memory() == 0
 
 
+def test_get_unused_satellite_ids(expected_tle):
+    expected_tle.satellite_id = TLE.MAX_SATELLITE_ID - 1
+    expected_tle.load()
+    assert TLE.get_unused_satellite_ids(2) == [TLE.MAX_SATELLITE_ID, TLE.MAX_SATELLITE_ID - 2]
+    expected_tle.destroy()
+
+
 def test_destroy(expected_tle):
     expected_tle.load()
     expected_tle.destroy()
@@ -109,6 +119,50 @@ def test_load(expected_tle):
     expected_tle.destroy()
 
 
+def test_add_maneuvers(expected_tle):
+    maneuver = ImpulsiveManeuver(expected_tle.epoch + 0.1, [0.0, 0.001, 0.0])
+    with pytest.raises(ValueError):
+        expected_tle.add_maneuvers([maneuver])
+    assert not expected_tle.loaded
+    expected_tle.ephemeris_type = TLEType.SP
+    expected_tle.add_maneuvers([maneuver])
+    assert expected_tle.loaded
+    assert TLE.get_number_in_memory() == 1
+    expected_tle.destroy()
+
+
+def test_garbage_collected_tle_is_removed(expected_line_1, expected_line_2):
+    tle = TLE.from_lines(expected_line_1, expected_line_2)
+    tle.load()
+    assert TLE.get_memory_usage() == {"tle": 1, "sgp4": 1, "tracked": 1}
+    del tle
+    gc.collect()
+    assert TLE.get_memory_usage() == {"tle": 0, "sgp4": 0, "tracked": 0}
+
+
+def test_from_key_does_not_own_key(expected_tle):
+    expected_tle.load()
+    copy = TLE.from_key(expected_tle.key)
+    del copy
+    gc.collect()
+    assert TLE.get_number_in_memory() == 1
+    expected_tle.destroy()
+    assert TLE.get_memory_usage()["tracked"] == 0
+
+
+def test_destroy_all_detaches_finalizers(expected_line_1, expected_line_2):
+    tle = TLE.from_lines(expected_line_1, expected_line_2)
+    tle.load()
+    TLE.destroy_all()
+    assert TLE.get_memory_usage() == {"tle": 0, "sgp4": 0, "tracked": 0}
+    other = TLE.from_lines(expected_line_1, expected_line_2)
+    other.load()
+    del tle
+    gc.collect()
+    assert TLE.get_number_in_memory() == 1
+    other.destroy()
+
+
 def test_epoch(expected_tle):
     assert expected_tle.epoch.utc_ds50 == 27368.99323416
     expected_tle.epoch = Epoch(27368.0)
@@ -155,3 +209,24 @@ def test_write_loaded_tles_to_file(expected_tle, tmp_path):
         lines = f.readlines()
         assert lines[0] == "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999\n"
         assert lines[1] == "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519\n"
+
+
+def test_reepoch(expected_tle):
+    epoch = expected_tle.epoch + 1
+    reepoched = expected_tle.reepoch(epoch)
+    assert not reepoched.loaded
+    assert reepoched.epoch.utc_ds50 == pytest.approx(epoch.utc_ds50)
+    expected = expected_tle.get_state_at_epoch(epoch).position
+    assert (reepoched.position - expected).magnitude < 1.0
+    assert "25544" in expected_tle.reepoch_csv(epoch)
+    reepoched.destroy()
+    expected_tle.destroy()
+
+
+def test_is_geo(expected_tle):
+    assert not expected_tle.is_geo
+    expected_tle.mean_motion = 1.0027
+    expected_tle.inclination = 0.05
+    assert expected_tle.is_geo
+    expected_tle.c_double_array[XA_TLE_MNMOTN] = 0.0
+    assert not expected_tle.is_geo
@@ -0,0 +1,102 @@
+import pytest
+
+from pysaal.elements import TLE, TLECatalog
+from pysaal.lib._tle import XA_TLE_INCLI, XA_TLE_SATNUM
+
+
+def test_from_lines(expected_line_1, expected_line_2):
+    catalog = TLECatalog.from_lines([(expected_line_1, expected_line_2)] * 2)
+    assert len(catalog) == 2
+    assert catalog.satellite_ids == [25544, 25544]
+    assert catalog.designators == ["98067A", "98067A"]
+    assert catalog.inclinations[0] == 51.6388
+    assert catalog[1].lines == (expected_line_1, expected_line_2)
+    assert not catalog.loaded
+
+
+def test_views(expected_tle):
+    catalog = TLECatalog.from_tles([expected_tle])
+    catalog[0].inclination = 52.0
+    assert catalog.inclinations[0] == 52.0
+    catalog.set_column(XA_TLE_INCLI, [53.0])
+    assert catalog[0].inclination == 53.0
+
+
+def test_write_and_load(expected_tle, tmp_path):
+    catalog = TLECatalog.from_tles([expected_tle])
+    catalog.write(tmp_path / "catalog.tle")
+    loaded = TLECatalog.from_file(tmp_path / "catalog.tle")
+    assert loaded.loaded
+    assert loaded[0].satellite_id == expected_tle.satellite_id
+    assert loaded.epochs[0] == pytest.approx(expected_tle.epoch.utc_ds50)
+    loaded.destroy()
+    assert TLE.get_number_in_memory() == 0
+
+
+def test_context_manager(expected_tle):
+    with TLECatalog.from_tles([expected_tle] * 2) as catalog:
+        catalog.load_record(0)
+        view = catalog[0]
+        assert TLE.get_memory_usage() == {"tle": 1, "sgp4": 1, "tracked": 0}
+    del view
+    assert not any(catalog.keys)
+    assert TLE.get_number_in_memory() == 0
+
+
+def test_destroy_view(expected_tle):
+    catalog = TLECatalog.from_tles([expected_tle] * 2)
+    catalog.set_column(XA_TLE_SATNUM, [25544, 25545])
+    catalog.load()
+    catalog[0].destroy()
+    assert not catalog.keys[0]
+    assert not catalog.loaded
+    assert TLE.get_number_in_memory() == 1
+    catalog.destroy()
+    assert TLE.get_number_in_memory() == 0
+
+
+def test_from_file_ignores_loaded_tles(expected_tle, tmp_path):
+    expected_tle.load()
+    catalog = TLECatalog.from_tles([expected_tle])
+    catalog.set_column(XA_TLE_SATNUM, [1])
+    catalog.write(tmp_path / "catalog.tle")
+    loaded = TLECatalog.from_file(tmp_path / "catalog.tle")
+    assert len(loaded) == 1
+    assert loaded.satellite_ids == [1]
+    loaded.destroy()
+    assert TLE.get_number_in_memory() == 1
+    expected_tle.destroy()
+
+
+def test_reepoch(expected_tle):
+    epoch = expected_tle.epoch + 1
+    single = expected_tle.reepoch(epoch)
+    expected_tle.destroy()
+    catalog = TLECatalog.from_tles([expected_tle])
+    reepoched = catalog.reepoch(epoch)
+    assert catalog.loaded
+    assert not reepoched.loaded
+    assert reepoched.epochs[0] == pytest.approx(epoch.utc_ds50)
+    assert reepoched[0].lines == single.lines
+    catalog.destroy()
+
+
+def test_binary_round_trip(expected_tle, tmp_path):
+    catalog = TLECatalog.from_tles([expected_tle] * 3)
+    catalog.save_binary(tmp_path / "catalog.bin")
+    opened = TLECatalog.from_binary(tmp_path / "catalog.bin")
+    assert len(opened) == 3
+    assert not opened.loaded
+    assert opened.satellite_ids == catalog.satellite_ids
+    assert opened.designators == catalog.designators
+    assert opened[2].lines == expected_tle.lines
+    opened.load_record(1)
+    assert opened.keys[1] and not opened.keys[0]
+    opened.destroy()
+    assert TLE.get_number_in_memory() == 0
+
+
+def test_from_binary_wrong_file(tmp_path):
+    (tmp_path / "catalog.tle").write_bytes(b"1 25544U" * 16)
+    with pytest.raises(ValueError):
+        TLECatalog.from_binary(tmp_path / "catalog.tle")
@@ -0,0 +1,43 @@
+import pytest
+
+from pysaal.elements import TLE, TLEHistory
+
+
+@pytest.fixture
+def history(expected_tle):
+    later = expected_tle.reepoch(expected_tle.epoch + 1)
+    latest = expected_tle.reepoch(expected_tle.epoch + 2)
+    expected_tle.destroy()
+    return TLEHistory.from_tles([latest, expected_tle, later])
+
+
+def test_get_epochs(history, expected_tle):
+    assert 25544 in history
+    assert history.satellite_ids == [25544]
+    epochs = history.get_epochs(25544)
+    assert list(epochs) == sorted(epochs)
+    assert epochs[0] == pytest.approx(expected_tle.epoch.utc_ds50)
+    assert [tle.epoch.utc_ds50 for tle in history.get_history(25544)] == pytest.approx(list(epochs))
+
+
+def test_get_tle(history, expected_tle):
+    assert history.get_tle(25544, expected_tle.epoch + 0.5).epoch.utc_ds50 == pytest.approx(expected_tle.epoch.utc_ds50)
+    assert history.get_tle(25544, expected_tle.epoch + 1).epoch.utc_ds50 == pytest.approx(
+        expected_tle.epoch.utc_ds50 + 1
+    )
+    assert history.get_tle(25544, expected_tle.epoch + 10).epoch.utc_ds50 == pytest.approx(
+        expected_tle.epoch.utc_ds50 + 2
+    )
+    with pytest.raises(ValueError):
+        history.get_index(25544, expected_tle.epoch - 1)
+    with pytest.raises(KeyError):
+        history.get_index(11111, expected_tle.epoch)
+
+
+def test_get_states(history, expected_tle):
+    epoch = expected_tle.epoch + 1.5
+    states = history.get_states(25544, [expected_tle.epoch, epoch])
+    expected = history.get_tle(25544, epoch).get_state_at_epoch(epoch)
+    assert states[1][0] == pytest.approx(expected.position.x)
+    history.destroy()
+    assert TLE.get_number_in_memory() == 0
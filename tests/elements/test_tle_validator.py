@@ -0,0 +1,56 @@
+import pytest
+
+from pysaal.elements import TLE, TLECatalog, TLEValidator
+from pysaal.enums import TLEValidationCode
+
+
+@pytest.fixture
+def iss_lines():
+    return (
+        "1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927",
+        "2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537",
+    )
+
+
+def test_get_checksum(iss_lines):
+    assert TLEValidator.get_checksum(iss_lines[0]) == 7
+    assert TLEValidator.get_checksum(iss_lines[1]) == 7
+
+
+def test_get_error_code(iss_lines, expected_line_1, expected_line_2):
+    validator = TLEValidator()
+    line_1, line_2 = iss_lines
+    assert validator.get_error_code(line_1, line_2) == TLEValidationCode.VALID
+    assert validator.get_error_code(expected_line_1, expected_line_2) == TLEValidationCode.VALID
+    assert TLEValidator(True).get_error_code(expected_line_1, expected_line_2) == TLEValidationCode.CHECKSUM
+    assert validator.get_error_code(line_1[:60], line_2) == TLEValidationCode.LINE_LENGTH
+    assert validator.get_error_code(line_2, line_1) == TLEValidationCode.LINE_NUMBER
+    assert validator.get_error_code(line_1[:-1] + "0", line_2) == TLEValidationCode.CHECKSUM
+    mismatch = line_2[:2] + "25545" + line_2[7:-1]
+    assert validator.get_error_code(line_1, mismatch) == TLEValidationCode.SATELLITE_ID_MISMATCH
+    inclined = line_2[:8] + " 191.6416" + line_2[17:-1]
+    assert validator.get_error_code(line_1, inclined[:68]) == TLEValidationCode.INCLINATION
+
+
+def test_validate(iss_lines):
+    line_1, line_2 = iss_lines
+    mask, codes = TLEValidator().validate([iss_lines, (line_1, line_2[:40])])
+    assert mask == [True, False]
+    assert codes == [TLEValidationCode.VALID, TLEValidationCode.LINE_LENGTH]
+
+
+def test_validate_file_and_ingest(iss_lines, tmp_path):
+    line_1, line_2 = iss_lines
+    file_path = tmp_path / "vendor.tle"
+    file_path.write_text("\n".join(["ISS (ZARYA)", line_1, line_2, line_1[:-1] + "0", line_2, line_1]) + "\n")
+    validator = TLEValidator()
+    lines, mask, codes = validator.validate_file(file_path)
+    assert len(lines) == 3
+    assert mask == [True, False, False]
+    assert codes[2] == TLEValidationCode.LINE_LENGTH
+
+    catalog = TLECatalog.from_file(file_path, validator)
+    assert len(catalog) == 1
+    assert catalog.loaded
+    catalog.destroy()
+    assert TLE.get_number_in_memory() == 0
@@ -0,0 +1,33 @@
+from io import BytesIO
+
+from pysaal.elements import TLE, TLECatalog, TLEWriter
+from pysaal.enums import TLEFormat
+
+
+def test_write_two_line(expected_tle, expected_line_1, expected_line_2):
+    stream = BytesIO()
+    count = TLEWriter().write(TLECatalog.from_tles([expected_tle] * 2), stream)
+    assert count == 2
+    assert stream.getvalue().decode().splitlines() == [expected_line_1, expected_line_2] * 2
+
+
+def test_write_three_line(expected_tle, expected_line_1, expected_line_2):
+    stream = BytesIO()
+    TLEWriter(TLEFormat.THREE_LINE).write([expected_tle], stream)
+    assert stream.getvalue().decode().splitlines() == [expected_tle.name, expected_line_1, expected_line_2]
+
+
+def test_write_csv(expected_tle):
+    stream = BytesIO()
+    TLEWriter(TLEFormat.CSV).write(TLECatalog.from_tles([expected_tle]), stream)
+    lines = stream.getvalue().decode().splitlines()
+    assert len(lines) == 1
+    assert str(expected_tle.satellite_id) in lines[0].split(",")[0]
+
+
+def test_write_keys(expected_tle, expected_line_1, expected_line_2, tmp_path):
+    expected_tle.load()
+    count = TLEWriter().write_keys(TLE.get_loaded_keys(), tmp_path / "loaded.tle")
+    assert count == 1
+    assert (tmp_path / "loaded.tle").read_text().splitlines() == [expected_line_1, expected_line_2]
+    expected_tle.destroy()
@@ -0,0 +1,70 @@
+import pytest
+
+from pysaal.elements import VCM, ImpulsiveManeuver
+from pysaal.lib._vcm import XA_VCM_COVELEMS, XA_VCM_SIZE, XS_VCM_SIZE
+from pysaal.time import Epoch
+
+
+def test_get_null_pointers():
+    xa_vcm, xs_vcm = VCM.get_null_pointers()
+    assert len(xa_vcm) == XA_VCM_SIZE
+    assert len(xs_vcm) == XS_VCM_SIZE
+
+
+def test_designator(expected_vcm):
+    assert expected_vcm.designator == "98067A"
+    with pytest.raises(ValueError, match="Name exceeds maximum length"):
+        expected_vcm.designator = "".join(["A" for _ in range(VCM.MAX_DESIGNATOR_LENGTH + 1)])
+
+
+def test_from_string(expected_vcm):
+    vcm = VCM.from_string(expected_vcm.lines)
+    assert vcm.satellite_id == expected_vcm.satellite_id
+    assert vcm.epoch.utc_ds50 == pytest.approx(expected_vcm.epoch.utc_ds50)
+    assert vcm.position.x == pytest.approx(expected_vcm.position.x)
+    assert vcm.velocity.z == pytest.approx(expected_vcm.velocity.z)
+    assert vcm.b_term == pytest.approx(expected_vcm.b_term)
+
+
+def test_from_c_arrays(expected_vcm):
+    vcm = VCM.from_c_arrays(expected_vcm.c_double_array, expected_vcm.c_char_array)
+    vcm.b_term = 0.02
+    assert expected_vcm.b_term == 0.02
+
+
+def test_load(expected_vcm):
+    expected_vcm.load()
+    assert expected_vcm.loaded
+    assert VCM.get_number_in_memory() == 1
+    vcm = VCM.from_key(expected_vcm.key)
+    assert vcm.satellite_id == expected_vcm.satellite_id
+    expected_vcm.destroy()
+    assert not expected_vcm.loaded
+    assert VCM.get_number_in_memory() == 0
+
+
+def test_add_maneuvers(expected_vcm):
+    expected_vcm.add_maneuvers([ImpulsiveManeuver(expected_vcm.epoch + 0.1, [0.0, 0.001, 0.0])])
+    assert expected_vcm.loaded
+    assert VCM.get_number_in_memory() == 1
+    expected_vcm.destroy()
+    assert VCM.get_number_in_memory() == 0
+
+
+def test_load_clears_time_scale_cache(expected_vcm):
+    assert Epoch(25934.0).tai_ds50
+    assert Epoch.TIME_SCALE_CONVERTER.cache_size > 0
+    expected_vcm.load()
+    assert Epoch.TIME_SCALE_CONVERTER.cache_size == 0
+    expected_vcm.destroy()
+
+
+def test_covariance(expected_vcm):
+    expected_vcm.c_double_array[XA_VCM_COVELEMS + 0] = 1.0
+    expected_vcm.c_double_array[XA_VCM_COVELEMS + 1] = 2.0
+    expected_vcm.c_double_array[XA_VCM_COVELEMS + 2] = 3.0
+    covariance = expected_vcm.covariance
+    assert covariance[0][0] == 1.0
+    assert covariance[1][0] == 2.0
+    assert covariance[0][1] == 2.0
+    assert covariance[1][1] == 3.0
@@ -0,0 +1,36 @@
+import pytest
+
+from pysaal.elements import VCM, VCMCatalog
+from pysaal.lib._vcm import XA_VCM_BTERM
+
+
+def test_from_strings(expected_vcm):
+    catalog = VCMCatalog.from_strings([expected_vcm.lines, expected_vcm.lines])
+    assert len(catalog) == 2
+    assert catalog.satellite_ids == [25544, 25544]
+    assert catalog.designators == ["98067A", "98067A"]
+    assert catalog.epochs[1] == pytest.approx(expected_vcm.epoch.utc_ds50)
+    assert not catalog.loaded
+
+
+def test_columns(expected_vcm):
+    catalog = VCMCatalog.from_vcms([expected_vcm])
+    states = catalog.teme_states
+    assert states[0][0] == expected_vcm.position.x
+    assert states[0][5] == expected_vcm.velocity.z
+    assert catalog.b_terms[0] == expected_vcm.b_term
+    assert catalog.agoms[0] == expected_vcm.agom
+    catalog.set_column(XA_VCM_BTERM, [0.02])
+    assert catalog[0].b_term == 0.02
+
+
+def test_write_and_load(expected_vcm, tmp_path):
+    catalog = VCMCatalog.from_vcms([expected_vcm])
+    catalog.write(tmp_path / "vcm.txt")
+    loaded = VCMCatalog.from_file(tmp_path / "vcm.txt")
+    assert loaded.loaded
+    assert VCM.get_number_in_memory() == 1
+    assert loaded[0].satellite_id == expected_vcm.satellite_id
+    assert loaded.teme_states[0][0] == pytest.approx(expected_vcm.position.x)
+    loaded.destroy()
+    assert VCM.get_number_in_memory() == 0
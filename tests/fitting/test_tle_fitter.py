@@ -0,0 +1,47 @@
+import pytest
+
+from pysaal.elements import TLE
+from pysaal.enums import TLEType
+from pysaal.fitting import TLEFitter
+from pysaal.time import TimeSpan
+
+LINE_1 = "1 25544U 98067A   24340.99323416 +.00018216  00000 0  32316-3 0 0999"
+LINE_2 = "2 25544  51.6388 184.2057 0007028 306.7642 201.1123 15.5026597648519"
+
+
+@pytest.fixture
+def truth_ephemeris():
+    truth = TLE.from_lines(LINE_1, LINE_2)
+    ephemeris = truth.get_ephemeris(TimeSpan(truth.epoch, truth.epoch + 0.5), 10.0)
+    rows = [list(row) for row in ephemeris]
+    truth.destroy()
+    return rows
+
+
+def test_fit(truth_ephemeris):
+    fit = TLEFitter(solve_b_star=True).fit(truth_ephemeris, 25544)
+    assert fit.rms < 0.5
+    assert fit.iterations >= 1
+    assert fit.tle.satellite_id == 25544
+    assert fit.tle.inclination == pytest.approx(51.6388, abs=0.05)
+    assert TLE.get_number_in_memory() == 0
+
+
+def test_fit_many(truth_ephemeris):
+    fitter = TLEFitter(max_iterations=5)
+    serial = fitter.fit_many([truth_ephemeris], [1], max_workers=1)
+    parallel = fitter.fit_many([truth_ephemeris, truth_ephemeris], [1, 2], max_workers=2)
+    assert [fit.tle.satellite_id for fit in parallel] == [1, 2]
+    assert parallel[0].rms == pytest.approx(serial[0].rms)
+
+
+def test_parameter_indices():
+    assert len(TLEFitter().parameter_indices) == 6
+    assert len(TLEFitter(TLEType.XP, solve_b_star=True, solve_agom=True).parameter_indices) == 8
+    with pytest.raises(ValueError, match="AGOM"):
+        TLEFitter(solve_agom=True)
+
+
+def test_too_few_points(truth_ephemeris):
+    with pytest.raises(ValueError, match="three ephemeris points"):
+        TLEFitter().fit(truth_ephemeris[:2], 1)
@@ -0,0 +1,77 @@
+from ctypes import c_double
+
+import pytest
+
+from pysaal.enums import ReferenceFrame
+from pysaal.frames import FrameConverter
+from pysaal.lib import DLLs
+from pysaal.time import Epoch
+
+EPOCH = Epoch(27368.0)
+STATES = [
+    [6778.0, 0.0, 0.0, 0.0, 7.668, 0.0],
+    [-4390.0, 4390.0, 2000.0, -5.1, -5.1, 1.2],
+]
+
+
+def test_get_path():
+    assert FrameConverter._get_path(ReferenceFrame.J2000, ReferenceFrame.EFG) == [
+        ReferenceFrame.J2000,
+        ReferenceFrame.TEME,
+        ReferenceFrame.EFG,
+    ]
+    assert FrameConverter._get_path(ReferenceFrame.EFG, ReferenceFrame.TEME) == [
+        ReferenceFrame.EFG,
+        ReferenceFrame.TEME,
+    ]
+
+
+def test_teme_to_efg():
+    converter = FrameConverter()
+    efg = converter.convert(STATES, [EPOCH, EPOCH], ReferenceFrame.TEME, ReferenceFrame.EFG)
+    pos, vel = (c_double * 3)(), (c_double * 3)()
+    pos_efg, vel_efg = (c_double * 3)(), (c_double * 3)()
+    for state, row in zip(STATES, efg):
+        pos[:] = state[:3]
+        vel[:] = state[3:]
+        DLLs.astro_func.ECIToEFGTime(EPOCH.utc_ds50, pos, vel, pos_efg, vel_efg)
+        assert row[:3] == pytest.approx(pos_efg[:])
+        assert row[3:] == pytest.approx(vel_efg[:])
+    assert converter.cache_size == 1
+
+
+def test_j2000_round_trip():
+    converter = FrameConverter()
+    epochs = [EPOCH, EPOCH + 0.5]
+    j2000 = converter.convert(STATES, epochs, ReferenceFrame.TEME, ReferenceFrame.J2000)
+    assert j2000[0][0] != pytest.approx(STATES[0][0], abs=1e-6)
+    teme = converter.convert(j2000, epochs, ReferenceFrame.J2000, ReferenceFrame.TEME)
+    for state, row in zip(STATES, teme):
+        assert row[:] == pytest.approx(state, abs=1e-8)
+    converter.clear_cache()
+    assert converter.cache_size == 0
+
+
+def test_max_cache_size():
+    converter = FrameConverter(max_cache_size=2)
+    epochs = [EPOCH + 0.1 * i for i in range(3)]
+    for epoch in epochs:
+        converter.get_transform(ReferenceFrame.TEME, ReferenceFrame.EFG, epoch)
+    assert converter.cache_size == 1
+
+
+def test_llh():
+    converter = FrameConverter()
+    llh = converter.convert(STATES, [EPOCH, EPOCH], ReferenceFrame.TEME, ReferenceFrame.LLH)
+    expected = (c_double * 3)()
+    for state, row in zip(STATES, llh):
+        DLLs.astro_func.XYZToLLHTime(EPOCH.utc_ds50, (c_double * 3)(*state[:3]), expected)
+        assert row[:] == pytest.approx(expected[:])
+    teme = converter.convert(llh, [EPOCH, EPOCH], ReferenceFrame.LLH, ReferenceFrame.TEME)
+    for state, row in zip(STATES, teme):
+        assert row[:] == pytest.approx(state[:3], abs=1e-6)
+
+
+def test_mismatched_epochs():
+    with pytest.raises(ValueError, match="must be the same"):
+        FrameConverter().convert(STATES, [EPOCH], ReferenceFrame.TEME, ReferenceFrame.J2000)
@@ -164,3 +164,20 @@ def test_greenwich_angle():
 def test_from_year_and_days():
     epoch = Epoch.from_year_and_days(2021, 1)
     assert epoch.utc_ds50 == 25934.0
+
+
+def test_format_dtgs():
+    values = [25934.0, 25934.5, 25934.25]
+    for length in (20, 19, 17, 15):
+        expected = [getattr(Epoch(value), f"dtg_{length}") for value in values]
+        assert Epoch.format_dtgs(values, length) == expected
+    with pytest.raises(ValueError):
+        Epoch.format_dtgs(values, 18)
+
+
+def test_parse_dtgs():
+    dtgs = ["2021/001 0000 00.000", "2021Jan01120000.000", "2021/001.25000000", "21001000000.000"]
+    assert list(Epoch.parse_dtgs(dtgs)) == pytest.approx([25934.0, 25934.5, 25934.25, 25934.0])
+    values = [25934.0, 25934.5, 25934.25]
+    assert list(Epoch.parse_dtgs(Epoch.format_dtgs(values))) == pytest.approx(values)
+    assert Epoch.parse_dtgs(["2021/001.25"])[0] == Epoch.from_dtg("2021/001.25").utc_ds50
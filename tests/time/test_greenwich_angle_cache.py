@@ -0,0 +1,26 @@
+import pytest
+
+from pysaal.enums import FKModel
+from pysaal.time import Epoch, GreenwichAngleCache
+
+
+def test_get_angles():
+    cache = GreenwichAngleCache()
+    grid = [25934.0, 25934.5, 25934.0]
+    angles = cache.get_angles(grid)
+    assert angles[0] == Epoch(25934.0).greenwich_angle
+    assert angles[1] == Epoch(25934.5).greenwich_angle
+    assert angles[2] == angles[0]
+    assert cache.cache_size == 2
+    assert cache.get_angle(25934.0, FKModel.FK4) == Epoch(25934.0).fk4_greenwich_angle
+    assert cache.get_angle(25934.0, FKModel.FK5) == Epoch(25934.0).fk5_greenwich_angle
+    assert cache.cache_size == 3
+    cache.clear_cache()
+    assert cache.cache_size == 0
+
+
+def test_max_cache_size():
+    cache = GreenwichAngleCache(2)
+    angles = cache.get_angles([25934.0, 25935.0, 25936.0])
+    assert cache.cache_size == 1
+    assert angles[2] == pytest.approx(Epoch(25936.0).greenwich_angle)
@@ -1,3 +1,5 @@
+import pytest
+
 from pysaal.lib import TIME_CONSTANTS_PATH
 from pysaal.time import Epoch, TimeConstants
 
@@ -26,3 +28,30 @@ def test_is_file_loaded():
 
 def test_load_file():
     TimeConstants.load_file(TIME_CONSTANTS_PATH)
+
+
+def test_get_columns():
+    tai_minus_utc, ut1_minus_utc, ut1_rate, polar_x, polar_y = TimeConstants.get_columns([25934.0, 25000.0, 25934.0])
+    assert len(tai_minus_utc) == 3
+    assert tai_minus_utc[0] == tai_minus_utc[2] == 37.0
+    assert ut1_minus_utc[2] == -0.17538
+    assert ut1_rate[0] == 0.057
+    assert polar_x[2] == 0.0687
+    assert polar_y[0] == 0.304
+    assert tai_minus_utc[1] == TimeConstants.from_epoch(Epoch(25000.0)).tai_minus_utc
+
+
+def test_replace_records():
+    epochs = [25933.0, 25934.0, 25935.0]
+    columns = TimeConstants.get_columns(epochs)
+    try:
+        TimeConstants.replace_records(epochs, *columns)
+        assert TimeConstants.get_loaded_time_span().start.utc_ds50 == 25933.0
+        assert TimeConstants.from_epoch(Epoch(25934.0)).tai_minus_utc == 37.0
+        assert Epoch(25934.0).tai_ds50 == 25934.00042824074
+        with pytest.raises(ValueError):
+            TimeConstants.add_records(epochs, *columns[:4], [0.0])
+    finally:
+        TimeConstants.remove_all()
+        TimeConstants.load_file(TIME_CONSTANTS_PATH)
+    assert TimeConstants.get_loaded_time_span().start.utc_ds50 == 8411.0
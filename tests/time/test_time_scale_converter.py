@@ -0,0 +1,33 @@
+import pytest
+
+from pysaal.enums import TimeScale
+from pysaal.time import Epoch, TimeScaleConverter
+
+
+def test_convert_from_utc():
+    converter = TimeScaleConverter()
+    epoch = Epoch(25934.0)
+    values = [epoch.utc_ds50, epoch.utc_ds50 + 0.5, epoch.utc_ds50]
+    tai = converter.convert(values, TimeScale.UTC, TimeScale.TAI)
+    assert tai[0] == epoch.tai_ds50
+    assert tai[2] == tai[0]
+    assert converter.cache_size == 2
+    assert converter.convert(values, TimeScale.UTC, TimeScale.UT1)[0] == epoch.ut1_ds50
+    assert converter.convert(values, TimeScale.UTC, TimeScale.TT)[0] == epoch.tt_ds50
+    assert converter.cache_size == 6
+    converter.clear_cache()
+    assert converter.cache_size == 0
+
+
+@pytest.mark.parametrize("scale", [TimeScale.TAI, TimeScale.UT1, TimeScale.TT])
+def test_round_trip(scale):
+    converter = TimeScaleConverter()
+    values = [25934.0, 25934.25]
+    converted = converter.convert(values, TimeScale.UTC, scale)
+    assert list(converter.convert(converted, scale, TimeScale.UTC)) == pytest.approx(values, abs=1e-10)
+
+
+def test_max_cache_size():
+    converter = TimeScaleConverter(2)
+    converter.convert([25934.0, 25935.0, 25936.0], TimeScale.UTC, TimeScale.TAI)
+    assert converter.cache_size == 1